@@ -3,21 +3,21 @@ Application Streamlit pour générer des devis de canapés sur mesure
 Design style 'Marocain/Lovable' avec Palette Personnalisée - Utilise canapematplot.py
 """
 
+import sys
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
 import streamlit as st
-import matplotlib.pyplot as plt
-from io import BytesIO
-from PIL import Image
-
-# Import des modules personnalisés
-from pricing import calculer_prix_total
-from pdf_generator import generer_pdf_devis
-
-# Import des fonctions de génération de schémas depuis canapematplot
-from canapematplot import (
-    render_LNF, render_LF_variant, render_U2f_variant,
-    render_U, render_U1F_v1, render_U1F_v2, render_U1F_v3, render_U1F_v4,
-    render_Simple1
-)
+
+# Import des modules personnalisés (légers : rien de Matplotlib ni de ReportLab)
+from pricing import calculer_prix_devis
+from quote_config import QuoteConfig
+from pdf_queue import PDFQueue
+
+# canapematplot (schémas) et pdf_generator (ReportLab) sont importés au premier usage,
+# après le premier affichage de la page (cf. python bench.py importtime)
 
 # -----------------------------------------------------------------------------
 # 1. CONFIGURATION DE LA PAGE & STYLE CSS
@@ -177,122 +177,273 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 # -----------------------------------------------------------------------------
-# 2. FONCTION GENERATION SCHEMA (Inchangée)
+# 2. FONCTION GENERATION SCHEMA
 # -----------------------------------------------------------------------------
 
-def generer_schema_canape(type_canape, tx, ty, tz, profondeur, 
-                          acc_left, acc_right, acc_bas,
-                          dossier_left, dossier_bas, dossier_right,
-                          meridienne_side, meridienne_len, coussins="auto",
-                          couleurs=None):
-    fig = plt.figure(figsize=(12, 8))
-    
+def mise_en_page_canape(config):
+    """
+    Calcule une seule fois la géométrie du canapé (Scene, depuis une QuoteConfig) :
+    elle sert au schéma et au prix.
+    """
+    from canapematplot import layout_canape
     try:
-        if "Simple" in type_canape:
-            render_Simple1(tx=tx, profondeur=profondeur, dossier=dossier_bas,
-                acc_left=acc_left, acc_right=acc_right,
-                meridienne_side=meridienne_side, meridienne_len=meridienne_len,
-                coussins=coussins, window_title="Canapé Simple",
-                couleurs=couleurs)
-        elif "L - Sans Angle" in type_canape:
-            render_LNF(tx=tx, ty=ty, profondeur=profondeur,
-                dossier_left=dossier_left, dossier_bas=dossier_bas,
-                acc_left=acc_left, acc_bas=acc_bas,
-                meridienne_side=meridienne_side, meridienne_len=meridienne_len,
-                coussins=coussins, variant="auto", window_title="L - Sans Angle",
-                couleurs=couleurs)
-        elif "L - Avec Angle" in type_canape:
-            render_LF_variant(tx=tx, ty=ty, profondeur=profondeur,
-                dossier_left=dossier_left, dossier_bas=dossier_bas,
-                acc_left=acc_left, acc_bas=acc_bas,
-                meridienne_side=meridienne_side, meridienne_len=meridienne_len,
-                coussins=coussins, window_title="L - Avec Angle",
-                couleurs=couleurs)
-        elif "U - Sans Angle" in type_canape:
-            render_U(tx=tx, ty_left=ty, tz_right=tz, profondeur=profondeur,
-                dossier_left=dossier_left, dossier_bas=dossier_bas, dossier_right=dossier_right,
-                acc_left=acc_left, acc_bas=acc_bas, acc_right=acc_right,
-                coussins=coussins, variant="auto", window_title="U - Sans Angle",
-                couleurs=couleurs)
-        elif "U - 1 Angle" in type_canape:
-            render_U1F_v1(tx=tx, ty=ty, tz=tz, profondeur=profondeur,
-                dossier_left=dossier_left, dossier_bas=dossier_bas, dossier_right=dossier_right,
-                acc_left=acc_left, acc_right=acc_right,
-                meridienne_side=meridienne_side, meridienne_len=meridienne_len,
-                coussins=coussins, window_title="U - 1 Angle",
-                couleurs=couleurs)
-        elif "U - 2 Angles" in type_canape:
-            render_U2f_variant(tx=tx, ty_left=ty, tz_right=tz, profondeur=profondeur,
-                dossier_left=dossier_left, dossier_bas=dossier_bas, dossier_right=dossier_right,
-                acc_left=acc_left, acc_bas=acc_bas, acc_right=acc_right,
-                meridienne_side=meridienne_side, meridienne_len=meridienne_len,
-                coussins=coussins, window_title="U - 2 Angles",
-                couleurs=couleurs)
-        
-        fig = plt.gcf()
-        return fig
-        
+        return layout_canape(config)
     except Exception as e:
-        plt.close()
         raise Exception(f"Erreur schéma: {str(e)}")
 
-# -----------------------------------------------------------------------------
-# 3. INTERFACE UTILISATEUR
-# -----------------------------------------------------------------------------
 
-st.markdown("# Configurateur de Canapé")
-st.markdown("Créez votre canapé sur mesure et obtenez un devis immédiat.")
-st.markdown("<br>", unsafe_allow_html=True)
+def generer_schema_canape(config, scene=None, vectoriel=False):
+    """
+    Retourne le schéma en PNG (bytes), rendu sans pyplot,
+    ou en Drawing ReportLab vectoriel pour le PDF si vectoriel=True.
+    `scene` : géométrie déjà calculée (mise_en_page_canape), réutilisée telle quelle.
+    """
+    from canapematplot import render_schema, render_drawing
+    try:
+        if vectoriel:
+            return render_drawing(config, scene=scene)
+        return render_schema(config, fmt="png", dpi=150, scene=scene)
+    except Exception as e:
+        raise Exception(f"Erreur schéma: {str(e)}")
 
-# Layout principal
-col_config, col_preview = st.columns([1.1, 0.9], gap="large")
 
-# --- COLONNE GAUCHE : CONFIGURATION AVEC ONGLETS ---
-with col_config:
-    
-    # Création des 3 onglets
-    tab_structure, tab_finitions, tab_client = st.tabs(["📏 Structure", "🛋️ Finitions", "👤 Client"])
-    
-    # --- ONGLET 1 : STRUCTURE ---
-    with tab_structure:
+@st.cache_data(max_entries=128, show_spinner=False)
+def calculer_scene(cle_geometrie, _config):
+    """
+    Géométrie (Scene) d'une QuoteConfig, mise en cache sous `cle_geometrie` et partagée entre
+    sessions (128 configurations au plus) ; couleurs, options de prix et client n'y entrent pas.
+    Les arguments préfixés « _ » ne sont pas hachés par st.cache_data : la clé suffit.
+    """
+    return mise_en_page_canape(_config)
+
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def calculer_image(cle_geometrie, couleurs, _config, _scene):
+    """Schéma PNG d'une Scene avec la palette `couleurs` (la géométrie n'est pas recalculée)."""
+    return generer_schema_canape(_config, scene=_scene)
+
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def calculer_prix(cle_prix, _config, _scene):
+    """Prix d'une QuoteConfig depuis sa Scene."""
+    return calculer_prix_devis(_config, scene=_scene)
+
+
+def calculer_apercu(devis, precedent=None):
+    """
+    Aperçu {config, scene, png, prix} de `devis`, en ne recalculant que ce que ses changements
+    depuis l'aperçu `precedent` imposent : la géométrie (puis schéma et prix) si les dimensions
+    ou la structure changent, le schéma seul pour les couleurs, le prix seul pour les options.
+    """
+    changements = devis.changements(precedent["config"] if precedent else None)
+    apercu = dict(precedent or {}, config=devis)
+    if "geometrie" in changements:
+        apercu["scene"] = calculer_scene(devis.cle_geometrie, devis)
+    if changements & {"geometrie", "couleurs"}:
+        apercu["png"] = calculer_image(devis.cle_geometrie, devis.couleurs, devis, apercu["scene"])
+    if changements & {"geometrie", "prix"}:
+        apercu["prix"] = calculer_prix(devis.cle_prix, devis, apercu["scene"])
+    return apercu
+
+
+def apercu_a_jour(devis):
+    """Aperçu de la session s'il correspond à `devis` (le client n'y entre pas), sinon None."""
+    apercu = st.session_state.get('apercu')
+    if apercu is not None and not devis.changements(apercu["config"]) - {"client"}:
+        return apercu
+    return None
+
+
+@st.cache_resource
+def prechauffage():
+    """
+    Une fois par processus serveur : canapematplot.prechauffer() (Matplotlib, polices, Agg)
+    lancé dans un thread, pour que le premier aperçu d'un utilisateur soit aussi rapide que
+    les suivants sans retarder le premier affichage de la page.
+    """
+    def _prechauffer():
+        from canapematplot import prechauffer
+        prechauffer(vectoriel=True)
+    fil = threading.Thread(target=_prechauffer, name="prechauffage", daemon=True)
+    fil.start()
+    return fil
+
+
+@st.cache_resource
+def file_pdf():
+    """File d'attente des PDF, commune à toutes les sessions (2 threads, 16 travaux au plus)."""
+    return PDFQueue(max_workers=2, max_jobs=16)
+
+
+def construire_pdf(config, scene, prix):
+    """
+    Travail d'arrière-plan : schéma vectoriel rejoué depuis la Scene de l'aperçu
+    (un Drawing neuf à chaque fois puisque le PDF le redimensionne) puis PDF, en bytes.
+    """
+    from pdf_generator import generer_pdf_devis
+    schema_pdf = generer_schema_canape(config, scene=scene, vectoriel=True)
+    return generer_pdf_devis(config, prix, schema_image=schema_pdf).getvalue()
+
+
+@st.fragment(run_every=0.5)
+def attente_pdf(cle_pdf):
+    """Suivi d'un PDF en cours : seul ce fragment se relance, puis toute la page quand il est prêt."""
+    travail = file_pdf().travail(cle_pdf)
+    if travail is None or travail.done():
+        st.rerun()
+    st.info("⏳ Génération du PDF en cours...")
+
+
+def panneau_pdf(devis):
+    """
+    Bouton PDF : le devis est construit en arrière-plan (file_pdf) ; un second clic pour
+    la même configuration rejoint le travail en cours. Le bouton de téléchargement apparaît
+    quand le PDF est prêt.
+    """
+    if st.button("📄 Télécharger le Devis PDF", type="secondary", use_container_width=True):
+        if not devis.nom_client:
+            st.toast("⚠️ Veuillez renseigner le nom du client dans l'onglet 'Client'.", icon="⚠️")
+        else:
+            try:
+                # Aperçu déjà calculé : géométrie et prix repris tels quels, dans ce thread
+                apercu = apercu_a_jour(devis) or calculer_apercu(devis, st.session_state.get('apercu'))
+                file_pdf().soumettre(devis.cle, construire_pdf, devis, apercu["scene"], apercu["prix"])
+                st.session_state['pdf_cle'] = devis.cle
+                st.session_state['pdf_annonce'] = False
+            except Exception as e:
+                st.error(f"Erreur PDF: {str(e)}")
+
+    # PDF de la configuration affichée (un PDF demandé pour une autre configuration est ignoré)
+    if st.session_state.get('pdf_cle') != devis.cle:
+        return
+    travail = file_pdf().travail(devis.cle)
+    if travail is None:
+        return
+    if not travail.done():
+        attente_pdf(devis.cle)
+        return
+    try:
+        pdf_data = travail.result()
+    except Exception as e:
+        st.error(f"Erreur PDF: {str(e)}")
+        return
+    st.download_button(
+        label="📥 Cliquez pour télécharger",
+        data=pdf_data,
+        file_name=f"Devis_{devis.nom_client.replace(' ', '_')}.pdf",
+        mime="application/pdf",
+        type="primary",
+        use_container_width=True
+    )
+    if not st.session_state.get('pdf_annonce'):
+        st.session_state['pdf_annonce'] = True
+        st.balloons()
+
+# -----------------------------------------------------------------------------
+# 3. INTERFACE UTILISATEUR
+# -----------------------------------------------------------------------------
+# Chaque onglet et le panneau d'aperçu sont des fragments : un widget ne relance que son
+# fragment ; les valeurs passent par st.session_state (clés des widgets, cf. config_courante).
+
+MODELES = ["Simple (S)", "L - Sans Angle", "L - Avec Angle (LF)",
+           "U - Sans Angle", "U - 1 Angle (U1F)", "U - 2 Angles (U2F)"]
+
+
+@contextmanager
+def chrono(nom):
+    """
+    Mesure une exécution (page entière ou fragment), gardée dans st.session_state['chronos'].
+    Le bloc peut écarter sa mesure (mesure["garder"] = False) pour ne pas évincer des 20
+    dernières les exécutions qui ont vraiment calculé quelque chose.
+    """
+    t0 = time.perf_counter()
+    mesure = {"garder": True}
+    try:
+        yield mesure
+    finally:
+        if mesure["garder"]:
+            st.session_state.setdefault('chronos', deque(maxlen=20)).append(
+                (nom, (time.perf_counter() - t0) * 1000))
+
+
+def relancer_apercu(onglet):
+    """
+    Rappel (on_change) des widgets de configuration : en mode automatique, relance le fragment
+    de l'onglet et le panneau d'aperçu, sans minuterie. Les relances demandées pendant un calcul
+    sont fusionnées par Streamlit : seule la configuration la plus récente est calculée.
+    """
+    if st.session_state.get("apercu_auto"):
+        st.rerun([onglet, "apercu"])
+
+
+def _cles_dimensions(type_canape):
+    """Clés des champs de dimensions : une par famille, pour garder les valeurs par défaut du modèle."""
+    famille = "S" if "Simple" in type_canape else ("L" if "L" in type_canape else "U")
+    return f"tx_{'S' if famille == 'S' else 'LU'}", f"ty_{famille}", "tz"
+
+
+def config_courante():
+    """QuoteConfig des valeurs saisies dans les trois onglets (st.session_state)."""
+    ss = st.session_state
+    type_canape = ss.get("type_canape", MODELES[0])
+    cle_tx, cle_ty, cle_tz = _cles_dimensions(type_canape)
+    meridienne = ss.get("has_meridienne", False)
+    return QuoteConfig(
+        modele=type_canape, tx=ss[cle_tx], ty=ss.get(cle_ty), tz=ss.get(cle_tz),
+        profondeur=ss["profondeur"],
+        acc_left=ss["acc_gauche"], acc_right=ss["acc_droit"], acc_bas=ss.get("acc_bas", False),
+        dossier_left=ss.get("dos_gauche", False), dossier_bas=ss["dos_bas"],
+        dossier_right=ss.get("dos_droit", False),
+        meridienne_side=ss["mer_sel"][0].lower() if meridienne else None,
+        meridienne_len=ss["meridienne_len"] if meridienne else 0,
+        coussins=ss["type_coussins"],
+        couleurs={"assise": ss["c_assise"], "dossiers": ss["c_dossier"],
+                  "accoudoirs": ss["c_acc"], "coussins": ss["c_coussin"]},
+        type_mousse=ss["type_mousse"], epaisseur=ss["epaisseur"],
+        nb_coussins_deco=ss["nb_coussins_deco"], nb_traversins_supp=ss["nb_traversins_supp"],
+        has_surmatelas=ss["has_surmatelas"],
+        nom_client=ss.get("nom_client", ""), email_client=ss.get("email_client", ""),
+    )
+
+
+@st.fragment(key="structure")
+def onglet_structure():
+    with chrono("structure"):
+        relance = dict(on_change=relancer_apercu, args=("structure",))
         with st.container(border=True):
             st.markdown("### Dimensions & Forme")
             
-            type_canape = st.selectbox(
-                "Modèle",
-                ["Simple (S)", "L - Sans Angle", "L - Avec Angle (LF)", 
-                 "U - Sans Angle", "U - 1 Angle (U1F)", "U - 2 Angles (U2F)"]
-            )
+            type_canape = st.selectbox("Modèle", MODELES, key="type_canape")
+            if type_canape != st.session_state.get('modele_affiche'):
+                # les options des finitions dépendent du modèle : toute la page est refaite
+                st.rerun()
+            cle_tx, cle_ty, cle_tz = _cles_dimensions(type_canape)
             
             c1, c2, c3 = st.columns(3)
             with c1:
                 label_tx = "Largeur (Tx)"
                 if "L" in type_canape or "U" in type_canape: label_tx = "Largeur Bas (Tx)"
-                tx = st.number_input(label_tx, 100, 600, 280 if "Simple" in type_canape else 350, 10)
+                st.number_input(label_tx, 100, 600, 280 if "Simple" in type_canape else 350, 10, key=cle_tx, **relance)
             
             with c2:
-                ty = tz = None
                 if "L" in type_canape:
-                    ty = st.number_input("Retour Gauche (Ty)", 100, 600, 250, 10)
+                    st.number_input("Retour Gauche (Ty)", 100, 600, 250, 10, key=cle_ty, **relance)
                 elif "U" in type_canape:
-                    ty = st.number_input("Retour Gauche (Ty)", 100, 600, 300, 10)
+                    st.number_input("Retour Gauche (Ty)", 100, 600, 300, 10, key=cle_ty, **relance)
                 else:
                     st.markdown("<div style='height: 42px; display: flex; align-items: center; color: #8C6F63;'>-</div>", unsafe_allow_html=True)
 
             with c3:
                 if "U" in type_canape:
-                    tz = st.number_input("Retour Droit (Tz)", 100, 600, 280, 10)
+                    st.number_input("Retour Droit (Tz)", 100, 600, 280, 10, key=cle_tz, **relance)
                 else:
                     st.markdown("<div style='height: 42px; display: flex; align-items: center; color: #8C6F63;'>-</div>", unsafe_allow_html=True)
                     
-            profondeur = st.slider("Profondeur d'assise (cm)", 50, 120, 70, 5)
+            st.slider("Profondeur d'assise (cm)", 50, 120, 70, 5, key="profondeur", **relance)
 
         with st.container(border=True):
             st.markdown("### Méridienne (Optionnel)")
-            has_meridienne = st.checkbox("Ajouter une méridienne (ouverture sans dossier)")
-            
-            meridienne_side = None
-            meridienne_len = 0
+            has_meridienne = st.checkbox("Ajouter une méridienne (ouverture sans dossier)", key="has_meridienne", **relance)
             
             if has_meridienne:
                 m1, m2 = st.columns(2)
@@ -300,49 +451,47 @@ with col_config:
                     opts = ["Gauche (g)", "Droite (d)"]
                     if "L" in type_canape or "U" in type_canape:
                         opts.append("Bas (b)")
-                    mer_sel = st.selectbox("Emplacement", opts)
-                    meridienne_side = mer_sel[0].lower()
+                    st.selectbox("Emplacement", opts, key="mer_sel", **relance)
                 with m2:
-                    meridienne_len = st.number_input("Longueur ouverture (cm)", 30, 200, 100, 10)
+                    st.number_input("Longueur ouverture (cm)", 30, 200, 100, 10, key="meridienne_len", **relance)
 
-    # --- ONGLET 2 : FINITIONS ---
-    with tab_finitions:
+
+@st.fragment(key="finitions")
+def onglet_finitions(type_canape):
+    with chrono("finitions"):
+        relance = dict(on_change=relancer_apercu, args=("finitions",))
         with st.container(border=True):
             st.markdown("### Accoudoirs & Dossiers")
             
             ac1, ac2 = st.columns(2)
             with ac1:
                 st.markdown("**Accoudoirs**")
-                acc_left = st.checkbox("Gauche", value=True, key="acc_gauche")
-                acc_right = st.checkbox("Droit", value=True, key="acc_droit")
+                st.checkbox("Gauche", value=True, key="acc_gauche", **relance)
+                st.checkbox("Droit", value=True, key="acc_droit", **relance)
                 
                 show_acc_bas = True if "L" in type_canape else ("Simple" not in type_canape)
                 if show_acc_bas:
-                    acc_bas = st.checkbox("Bas (Retour)", value=True, key="acc_bas")
-                else:
-                    acc_bas = False
+                    st.checkbox("Bas (Retour)", value=True, key="acc_bas", **relance)
 
             with ac2:
                 st.markdown("**Dossiers**")
-                dossier_bas = st.checkbox("Bas (Central)", value=True, key="dos_bas")
+                st.checkbox("Bas (Central)", value=True, key="dos_bas", **relance)
                 
-                dossier_left = False
                 if "Simple" not in type_canape:
-                    dossier_left = st.checkbox("Gauche", value=True, key="dos_gauche")
+                    st.checkbox("Gauche", value=True, key="dos_gauche", **relance)
                     
-                dossier_right = False
                 if "U" in type_canape:
-                    dossier_right = st.checkbox("Droit", value=True, key="dos_droit")
+                    st.checkbox("Droit", value=True, key="dos_droit", **relance)
 
         with st.container(border=True):
             st.markdown("### Confort & Options")
             
             cf1, cf2 = st.columns(2)
             with cf1:
-                type_coussins = st.selectbox("Type de coussins", ["auto", "65", "80", "90", "valise", "p", "g"])
-                type_mousse = st.selectbox("Qualité Mousse", ["HR35", "HR45", "D30", "D25"])
+                st.selectbox("Type de coussins", ["auto", "65", "80", "90", "valise", "p", "g"], key="type_coussins", **relance)
+                st.selectbox("Qualité Mousse", ["HR35", "HR45", "D30", "D25"], key="type_mousse", **relance)
             with cf2:
-                epaisseur = st.number_input("Épaisseur Assise (cm)", 15, 35, 25, 5)
+                st.number_input("Épaisseur Assise (cm)", 15, 35, 25, 5, key="epaisseur", **relance)
                 
             st.markdown("---")
             st.markdown("**Personnalisation des Couleurs**")
@@ -350,175 +499,162 @@ with col_config:
             # Sélecteurs de couleurs avec les codes HEX par défaut adaptés au thème
             col_c1, col_c2, col_c3, col_c4 = st.columns(4)
             with col_c1:
-                c_assise = st.color_picker("Assise", "#f6f6f6")
+                st.color_picker("Assise", "#f6f6f6", key="c_assise", **relance)
             with col_c2:
-                c_dossier = st.color_picker("Dossier", "#b8b8b8")
+                st.color_picker("Dossier", "#b8b8b8", key="c_dossier", **relance)
             with col_c3:
-                c_acc = st.color_picker("Accoudoir", "#8f8f8f")
+                st.color_picker("Accoudoir", "#8f8f8f", key="c_acc", **relance)
             with col_c4:
-                c_coussin = st.color_picker("Coussins", "#8B7E74")
-                
-            couleurs_dict = {
-                "assise": c_assise,
-                "dossiers": c_dossier,
-                "accoudoirs": c_acc,
-                "coussins": c_coussin
-            }
+                st.color_picker("Coussins", "#8B7E74", key="c_coussin", **relance)
 
             st.markdown("---")
             st.markdown("**Options supplémentaires**")
             opt1, opt2, opt3 = st.columns(3)
             with opt1:
-                nb_coussins_deco = st.number_input("Coussins déco", 0, 10, 0)
+                st.number_input("Coussins déco", 0, 10, 0, key="nb_coussins_deco", **relance)
             with opt2:
-                nb_traversins_supp = st.number_input("Traversins extra", 0, 5, 0)
+                st.number_input("Traversins extra", 0, 5, 0, key="nb_traversins_supp", **relance)
             with opt3:
                 st.write("") 
                 st.write("") 
-                has_surmatelas = st.checkbox("Ajouter Surmatelas")
+                st.checkbox("Ajouter Surmatelas", key="has_surmatelas", **relance)
 
-    # --- ONGLET 3 : CLIENT ---
-    with tab_client:
+
+@st.fragment(key="client")
+def onglet_client():
+    with chrono("client"):
+        relance = dict(on_change=relancer_apercu, args=("client",))
         with st.container(border=True):
             st.markdown("### Coordonnées du Client")
             st.info("Ces informations apparaîtront sur le PDF généré.")
             
-            nom_client = st.text_input("Nom complet / Entreprise")
-            email_client = st.text_input("Email")
+            st.text_input("Nom complet / Entreprise", key="nom_client", **relance)
+            st.text_input("Email", key="email_client", **relance)
+
+
+def panneau_apercu(auto):
+    """
+    Aperçu et prix de la configuration saisie. En mode automatique ce fragment est relancé par
+    les widgets de configuration (relancer_apercu) et ne recalcule que ce qui a changé.
+    """
+    with chrono("apercu") as mesure:
+        # Chronométré seulement si l'aperçu est recalculé
+        mesure["garder"] = False
+        # Même configuration pour l'aperçu et le PDF : le PDF reprend la géométrie de l'aperçu
+        devis = config_courante()
+        
+        with st.container(border=True):
+            st.markdown("### 👁️ Aperçu et Devis")
+            
+            demande = st.button("🔄 Mettre à jour l'aperçu", key="generate", type="primary",
+                                use_container_width=True, disabled=auto)
+            
+            precedent = st.session_state.get('apercu')
+            if (auto or demande) and apercu_a_jour(devis) is None:
+                mesure["garder"] = True
+                try:
+                    # 1. Schéma et prix : seul ce qui a changé depuis le dernier aperçu est recalculé
+                    with st.spinner("Calcul en cours..."):
+                        st.session_state['apercu'] = calculer_apercu(devis, precedent)
+                    st.session_state['prix_details'] = st.session_state['apercu']['prix']
+                except Exception as e:
+                    st.error(f"Oups ! Une erreur dans la configuration : {str(e)}")
+
+            apercu = st.session_state.get('apercu')
+            if apercu is not None:
+                prix_details = apercu['prix']
+                st.image(apercu['png'], use_container_width=True)
+                if apercu_a_jour(devis) is None and not auto:
+                    st.caption("Aperçu d'une configuration précédente : cliquez sur 'Mettre à jour'.")
+
+                # 2. Affichage Sécurisé des Prix
+                montant_ht = prix_details.get('prix_ht', prix_details.get('sous_total', 0))
+                montant_tva = prix_details.get('tva', 0)
+                montant_ttc = prix_details.get('total_ttc', 0)
+                
+                st.markdown("---")
+                
+                p1, p2 = st.columns([2, 1])
+                with p1:
+                    st.markdown("**Total HT**")
+                    st.markdown("TVA (20%)")
+                with p2:
+                    st.markdown(f"<div style='text-align:right'>{montant_ht:.2f} €</div>", unsafe_allow_html=True)
+                    st.markdown(f"<div style='text-align:right'>{montant_tva:.2f} €</div>", unsafe_allow_html=True)
+                
+                st.markdown("---")
+                
+                t1, t2 = st.columns([1, 2])
+                with t1:
+                    st.markdown("### Total TTC")
+                with t2:
+                    st.markdown(f"<h2 style='text-align:right; color:#CF661B; margin:0;'>{montant_ttc:.2f} €</h2>", unsafe_allow_html=True)
+                
+                if 'marge_ht' in prix_details:
+                    with st.expander("Données internes (Marge)"):
+                        m1, m2 = st.columns(2)
+                        m1.metric("Coût Revient", f"{prix_details.get('cout_revient_ht', 0)} €")
+                        m2.metric("Marge", f"{prix_details.get('marge_ht', 0)} €", f"{prix_details.get('taux_marge', 0)}%")
 
+            else:
+                st.info("Cliquez sur 'Mettre à jour' pour voir votre configuration.")
+                st.markdown("""
+                    <div style="background-color: #EDE7DE; border-radius: 8px; height: 300px; display: flex; align-items: center; justify-content: center; color: #8C6F63; border: 1px dashed #8C6F63;">
+                        Aperçu du schéma ici
+                    </div>
+                """, unsafe_allow_html=True)
 
-# --- COLONNE DROITE : PRÉVISUALISATION & PRIX ---
-with col_preview:
+        # Bouton PDF
+        panneau_pdf(devis)
+
+
+t_page = time.perf_counter()
+prechauffage()
+
+st.markdown("# Configurateur de Canapé")
+st.markdown("Créez votre canapé sur mesure et obtenez un devis immédiat.")
+st.markdown("<br>", unsafe_allow_html=True)
+
+# Modèle affiché par cette exécution complète (onglet_structure relance la page s'il change)
+st.session_state['modele_affiche'] = st.session_state.get("type_canape", MODELES[0])
+
+# Layout principal
+col_config, col_preview = st.columns([1.1, 0.9], gap="large")
+
+# --- COLONNE GAUCHE : CONFIGURATION AVEC ONGLETS ---
+with col_config:
     
-    with st.container(border=True):
-        st.markdown("### 👁️ Aperçu et Devis")
-        
-        if st.button("🔄 Mettre à jour l'aperçu", key="generate", type="primary", use_container_width=True):
-            with st.spinner("Calcul en cours..."):
-                try:
-                    # 1. Générer le schéma
-                    fig = generer_schema_canape(
-                        type_canape, tx, ty, tz, profondeur,
-                        acc_left, acc_right, acc_bas,
-                        dossier_left, dossier_bas, dossier_right,
-                        meridienne_side, meridienne_len, type_coussins,
-                        couleurs=couleurs_dict
-                    )
-                    
-                    st.pyplot(fig, use_container_width=True)
-                    plt.close()
-                    
-                    # 2. Calculer le prix
-                    prix_details = calculer_prix_total(
-                        type_canape, tx, ty, tz, profondeur,
-                        type_coussins, type_mousse, epaisseur,
-                        acc_left, acc_right, acc_bas,
-                        dossier_left, dossier_bas, dossier_right,
-                        nb_coussins_deco, nb_traversins_supp,
-                        has_surmatelas, has_meridienne
-                    )
-                    
-                    st.session_state['prix_details'] = prix_details
+    # Création des 3 onglets
+    tab_structure, tab_finitions, tab_client = st.tabs(["📏 Structure", "🛋️ Finitions", "👤 Client"])
+    
+    # --- ONGLET 1 : STRUCTURE ---
+    with tab_structure:
+        onglet_structure()
 
-                    # 3. Affichage Sécurisé des Prix
-                    montant_ht = prix_details.get('prix_ht', prix_details.get('sous_total', 0))
-                    montant_tva = prix_details.get('tva', 0)
-                    montant_ttc = prix_details.get('total_ttc', 0)
-                    
-                    st.markdown("---")
-                    
-                    p1, p2 = st.columns([2, 1])
-                    with p1:
-                        st.markdown("**Total HT**")
-                        st.markdown("TVA (20%)")
-                    with p2:
-                        st.markdown(f"<div style='text-align:right'>{montant_ht:.2f} €</div>", unsafe_allow_html=True)
-                        st.markdown(f"<div style='text-align:right'>{montant_tva:.2f} €</div>", unsafe_allow_html=True)
-                    
-                    st.markdown("---")
-                    
-                    t1, t2 = st.columns([1, 2])
-                    with t1:
-                        st.markdown("### Total TTC")
-                    with t2:
-                        st.markdown(f"<h2 style='text-align:right; color:#CF661B; margin:0;'>{montant_ttc:.2f} €</h2>", unsafe_allow_html=True)
-                    
-                    if 'marge_ht' in prix_details:
-                        with st.expander("Données internes (Marge)"):
-                            m1, m2 = st.columns(2)
-                            m1.metric("Coût Revient", f"{prix_details.get('cout_revient_ht', 0)} €")
-                            m2.metric("Marge", f"{prix_details.get('marge_ht', 0)} €", f"{prix_details.get('taux_marge', 0)}%")
+    # --- ONGLET 2 : FINITIONS ---
+    with tab_finitions:
+        onglet_finitions(st.session_state['modele_affiche'])
 
-                except Exception as e:
-                    st.error(f"Oups ! Une erreur dans la configuration : {str(e)}")
+    # --- ONGLET 3 : CLIENT ---
+    with tab_client:
+        onglet_client()
 
-        else:
-            st.info("Cliquez sur 'Mettre à jour' pour voir votre configuration.")
-            st.markdown("""
-                <div style="background-color: #EDE7DE; border-radius: 8px; height: 300px; display: flex; align-items: center; justify-content: center; color: #8C6F63; border: 1px dashed #8C6F63;">
-                    Aperçu du schéma ici
-                </div>
-            """, unsafe_allow_html=True)
-
-    # Bouton PDF
-    if st.button("📄 Télécharger le Devis PDF", type="secondary", use_container_width=True):
-        if not nom_client:
-            st.toast("⚠️ Veuillez renseigner le nom du client dans l'onglet 'Client'.", icon="⚠️")
-        else:
-            with st.spinner("Génération du PDF..."):
-                try:
-                    # Utilisation des couleurs pour le PDF aussi
-                    couleurs_pdf = {
-                        "assise": c_assise,
-                        "dossiers": c_dossier,
-                        "accoudoirs": c_acc,
-                        "coussins": c_coussin
-                    }
-
-                    fig_pdf = generer_schema_canape(
-                        type_canape, tx, ty, tz, profondeur,
-                        acc_left, acc_right, acc_bas,
-                        dossier_left, dossier_bas, dossier_right,
-                        meridienne_side, meridienne_len, type_coussins,
-                        couleurs=couleurs_pdf
-                    )
-                    img_buffer = BytesIO()
-                    fig_pdf.savefig(img_buffer, format='png', bbox_inches='tight', dpi=150)
-                    img_buffer.seek(0)
-                    plt.close(fig_pdf)
-                    
-                    prix_final = calculer_prix_total(
-                        type_canape, tx, ty, tz, profondeur,
-                        type_coussins, type_mousse, epaisseur,
-                        acc_left, acc_right, acc_bas,
-                        dossier_left, dossier_bas, dossier_right,
-                        nb_coussins_deco, nb_traversins_supp,
-                        has_surmatelas, has_meridienne
-                    )
-                    
-                    config = {
-                        'type_canape': type_canape,
-                        'dimensions': {'tx': tx, 'ty': ty, 'tz': tz, 'profondeur': profondeur},
-                        'options': {
-                            'acc_left': acc_left, 'acc_right': acc_right, 'acc_bas': acc_bas,
-                            'dossier_left': dossier_left, 'dossier_bas': dossier_bas, 'dossier_right': dossier_right,
-                            'meridienne_side': meridienne_side, 'meridienne_len': meridienne_len,
-                            'type_coussins': type_coussins, 'type_mousse': type_mousse, 'epaisseur': epaisseur
-                        },
-                        'client': {'nom': nom_client, 'email': email_client}
-                    }
-                    
-                    pdf_data = generer_pdf_devis(config, prix_final, schema_image=img_buffer)
-                    
-                    st.download_button(
-                        label="📥 Cliquez pour télécharger",
-                        data=pdf_data,
-                        file_name=f"Devis_{nom_client.replace(' ', '_')}.pdf",
-                        mime="application/pdf",
-                        type="primary",
-                        use_container_width=True
-                    )
-                    st.balloons()
-                    
-                except Exception as e:
-                    st.error(f"Erreur PDF: {str(e)}")
+
+# --- COLONNE DROITE : PRÉVISUALISATION & PRIX ---
+with col_preview:
+    # Basculer le mode refait toute la page (le toggle est hors fragment)
+    auto = st.toggle("Aperçu automatique", key="apercu_auto",
+                     help="Met à jour l'aperçu à chaque modification, en ne recalculant que ce qui change.")
+    st.fragment(panneau_apercu, key="apercu")(auto)
+
+st.session_state.setdefault('chronos', deque(maxlen=20)).append(("page", (time.perf_counter() - t_page) * 1000))
+
+# Temps d'exécution des dernières interactions (page entière ou fragment seul)
+with st.sidebar:
+    with st.expander("⏱️ Temps d'exécution"):
+        for nom, ms in reversed(st.session_state['chronos']):
+            st.caption(f"{nom} : {ms:.1f} ms")
+        canape = sys.modules.get("canapematplot")   # pas d'import ici : chargé par le préchauffage
+        if canape is not None and canape.PRECHAUFFAGE:
+            st.caption("Préchauffage du serveur : " + ", ".join(
+                f"{etape} {ms:.0f} ms" for etape, ms in canape.PRECHAUFFAGE.items()))
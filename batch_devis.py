@@ -0,0 +1,210 @@
+"""
+Génération de devis en lot (catalogue, fiches prix du showroom), hors Streamlit.
+
+Usage :
+    python batch_devis.py configs.csv  [--out devis/] [--jobs N] [--force] [--tarif-schema]
+    python batch_devis.py configs.jsonl
+
+Chaque ligne décrit une QuoteConfig (colonnes / clés = champs de quote_config.QuoteConfig,
+"modele" en libellé "U - 1 Angle (U1F)" ou en nom "U_1_ANGLE" ; en CSV, "couleurs" s'écrit
+"assise=#f6f6f6;coussins=taupe"). Les devis sont calculés comme dans l'application
+(layout_canape → calculer_prix_devis → render_drawing → generer_pdf_devis), répartis sur un
+pool de processus ; chaque PDF est nommé d'après l'empreinte de sa configuration
+(QuoteConfig.cle) et le récapitulatif resume.csv est complété au fil de l'eau. Une configuration
+répétée n'est générée qu'une fois ; chacune de ses lignes figure au récapitulatif, avec le même PDF.
+Relancer la même commande ne refait que les devis absents ou en erreur.
+Les prix suivent le tarif de l'application (pricing.TARIF_SCHEMA) : l'estimation forfaitaire
+calculer_prix_total par défaut, le chiffrage depuis le schéma avec --tarif-schema (changer de
+tarif sur un dossier déjà généré demande --force).
+
+    python batch_devis.py configs.csv --catalogue catalogue.pdf
+
+regroupe au contraire tous les devis dans un seul PDF (une page par devis, salons et clients
+professionnels), mis en page devis par devis par pdf_generator.generer_pdf_catalogue
+(schémas produits page par page, fichier écrit à la fin).
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import fields
+
+from quote_config import QuoteConfig
+
+COLONNES_RESUME = ["ligne", "cle", "modele", "tx", "ty", "tz", "client",
+                   "sous_total", "tva", "total_ttc", "pdf", "erreur"]
+
+_VRAI = {"1", "true", "vrai", "oui", "yes", "x"}
+
+
+def _valeur_csv(champ, texte):
+    """Convertit une cellule CSV selon le type du champ de QuoteConfig."""
+    if isinstance(champ.default, bool):
+        return texte.strip().lower() in _VRAI
+    if champ.name in ("tx", "ty", "tz") or isinstance(champ.default, int):
+        return int(float(texte))
+    if champ.name == "couleurs":
+        return dict(p.split("=", 1) for p in texte.split(";") if "=" in p)
+    return texte
+
+
+def lire_configurations(chemin):
+    """Liste de (numéro de ligne, dict de champs QuoteConfig) lue depuis un CSV ou un JSONL."""
+    lignes = []
+    with open(chemin, newline="", encoding="utf-8") as f:
+        if chemin.lower().endswith((".jsonl", ".ndjson")):
+            for num, texte in enumerate(f, 1):
+                if texte.strip():
+                    lignes.append((num, json.loads(texte)))
+        else:
+            champs = {c.name: c for c in fields(QuoteConfig)}
+            for num, row in enumerate(csv.DictReader(f), 2):
+                lignes.append((num, {k: _valeur_csv(champs[k], v) for k, v in row.items()
+                                     if k in champs and v not in (None, "")}))
+    return lignes
+
+
+def _init_worker(tarif_schema=False):
+    """Une fois par processus : tarif des devis, préchauffage et PDF à blanc."""
+    import pricing
+    pricing.TARIF_SCHEMA = tarif_schema
+    import logging
+    logging.getLogger("matplotlib.font_manager").setLevel(logging.ERROR)
+    import canapematplot
+    import pdf_generator
+    canapematplot.prechauffer(vectoriel=True)
+    config = QuoteConfig("Simple (S)", 200)
+    pdf_generator.generer_pdf_devis(config, {"details": {}, "sous_total": 0, "tva": 0, "total_ttc": 0},
+                                    schema_image=canapematplot.render_drawing(config))
+
+
+def generer_devis(job):
+    """Calcule un devis et écrit son PDF ; retourne sa ligne du récapitulatif."""
+    from canapematplot import layout_canape, render_drawing
+    from pdf_generator import generer_pdf_devis
+    from pricing import calculer_prix_devis
+
+    num, data, dossier = job
+    resume = {"ligne": num}
+    try:
+        config = QuoteConfig(**data)
+        resume.update(cle=config.cle, modele=config.modele.value, tx=config.tx, ty=config.ty,
+                      tz=config.tz, client=config.nom_client)
+        scene = layout_canape(config)
+        prix = calculer_prix_devis(config, scene=scene)
+        pdf = generer_pdf_devis(config, prix, schema_image=render_drawing(config, scene=scene))
+        chemin = os.path.join(dossier, f"{config.cle[:16]}.pdf")
+        with open(chemin + ".tmp", "wb") as f:
+            f.write(pdf.getvalue())
+        os.replace(chemin + ".tmp", chemin)   # jamais de PDF tronqué pris pour un devis fait
+        resume.update(sous_total=prix["sous_total"], tva=prix["tva"], total_ttc=prix["total_ttc"],
+                      pdf=os.path.basename(chemin))
+    except Exception as e:
+        resume["erreur"] = f"{type(e).__name__}: {e}"
+    return resume
+
+
+def _deja_faits(chemin_resume, dossier):
+    """Lignes du récapitulatif existant dont le PDF est présent, par empreinte."""
+    if not os.path.exists(chemin_resume):
+        return {}
+    with open(chemin_resume, newline="", encoding="utf-8") as f:
+        return {row["cle"]: row for row in csv.DictReader(f)
+                if not row["erreur"] and row["pdf"] and os.path.exists(os.path.join(dossier, row["pdf"]))}
+
+
+def generer_catalogue(entree, chemin):
+    """Un seul PDF pour toutes les configurations de `entree` ; les lignes invalides sont signalées et sautées."""
+    from canapematplot import layout_canape, render_drawing
+    from pdf_generator import generer_pdf_catalogue
+    from pricing import calculer_prix_devis
+
+    def _devis():
+        for num, data in lire_configurations(entree):
+            try:
+                config = QuoteConfig(**data)
+                scene = layout_canape(config)
+                prix = calculer_prix_devis(config, scene=scene)
+            except Exception as e:
+                print(f"ligne {num} ignorée : {type(e).__name__}: {e}", file=sys.stderr)
+                continue
+            yield config, prix, render_drawing(config, scene=scene)   # schéma produit à sa page
+
+    return generer_pdf_catalogue(_devis(), chemin)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Génère des devis PDF en lot depuis un CSV ou un JSONL.")
+    parser.add_argument("entree", help="fichier .csv ou .jsonl de configurations")
+    parser.add_argument("--out", default="devis", help="dossier des PDF et de resume.csv (défaut : devis/)")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count(), help="processus (défaut : tous les cœurs)")
+    parser.add_argument("--force", action="store_true", help="refaire aussi les devis déjà générés")
+    parser.add_argument("--catalogue", metavar="PDF", help="un seul PDF de tous les devis (au lieu d'un PDF par devis)")
+    parser.add_argument("--tarif-schema", action="store_true",
+                        help="prix chiffrés depuis le schéma (pricing.TARIF_SCHEMA) au lieu du tarif forfaitaire")
+    args = parser.parse_args(argv)
+    if args.tarif_schema:
+        import pricing
+        pricing.TARIF_SCHEMA = True
+
+    if args.catalogue:
+        t0 = time.perf_counter()
+        n = generer_catalogue(args.entree, args.catalogue)
+        print(f"{n} devis dans {args.catalogue} ({time.perf_counter() - t0:.1f} s)", file=sys.stderr)
+        return 0
+
+    dossier = os.path.abspath(args.out)
+    os.makedirs(dossier, exist_ok=True)
+    chemin_resume = os.path.join(dossier, "resume.csv")
+    faits = {} if args.force else _deja_faits(chemin_resume, dossier)
+
+    # une configuration répétée n'est générée qu'une fois, mais chaque ligne a sa ligne du récapitulatif
+    jobs, doublons, repris = [], {}, []   # doublons : cle -> autres lignes de la même configuration
+    for num, data in lire_configurations(args.entree):
+        try:
+            cle = QuoteConfig(**data).cle
+        except Exception:
+            cle = None   # l'erreur sera rapportée par le worker
+        if cle in faits:
+            repris.append(dict(faits[cle], ligne=num))
+        elif cle in doublons:
+            doublons[cle].append(num)
+        else:
+            if cle is not None:
+                doublons[cle] = []
+            jobs.append((num, data, dossier))
+    total = len(jobs)
+    print(f"{total} devis à générer ({len(faits)} déjà faits, "
+          f"{sum(map(len, doublons.values()))} ligne(s) en double) sur {args.jobs} processus", file=sys.stderr)
+
+    erreurs = 0
+    t0 = time.perf_counter()
+    # récapitulatif réécrit : devis déjà faits d'abord (les erreurs passées sont retentées)
+    with open(chemin_resume, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=COLONNES_RESUME)
+        writer.writeheader()
+        cles_reprises = {row["cle"] for row in repris}
+        writer.writerows(row for row in faits.values() if row["cle"] not in cles_reprises)
+        writer.writerows(repris)
+        with ProcessPoolExecutor(max_workers=args.jobs, initializer=_init_worker,
+                                 initargs=(args.tarif_schema,)) as pool:
+            for n, futur in enumerate(as_completed([pool.submit(generer_devis, job) for job in jobs]), 1):
+                resume = futur.result()
+                writer.writerow(resume)
+                # lignes en double : même empreinte, même PDF (ou même erreur)
+                writer.writerows(dict(resume, ligne=num) for num in doublons.get(resume.get("cle"), ()))
+                f.flush()
+                erreurs += bool(resume.get("erreur"))
+                debit = n / (time.perf_counter() - t0)
+                print(f"\r[{n}/{total}] {debit:.1f} devis/s, {erreurs} erreur(s)", end="", file=sys.stderr)
+    if total:
+        print(file=sys.stderr)
+    return 1 if erreurs else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
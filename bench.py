@@ -0,0 +1,801 @@
+"""
+Micro-benchmarks du configurateur (hors Streamlit).
+
+Usage :
+    python bench.py render      # artistes Matplotlib + temps par render_* (avant/après regroupement)
+    python bench.py svg         # render_schema : PNG/SVG Matplotlib vs backend SVG pur Python
+    python bench.py threads     # 50 rendus concurrents (palettes différentes) vs rendu séquentiel
+    python bench.py valise      # optimiseurs valise vs boucles Python de référence
+    python bench.py tables      # tables de remplissage 1D précalculées vs calcul direct
+    python bench.py geometry    # appels compute_points_* par rendu en sélection auto de variante
+    python bench.py variants    # évaluation des variantes (géométrie + valise) : séquentiel vs pool de threads
+    python bench.py pricing     # prix depuis la Scene (polygones) vs estimation forfaitaire
+    python bench.py pdf         # devis PDF par seconde, PDF identiques d'une passe à l'autre
+    python bench.py catalogue   # PDF multi-devis : pages/s, taille et pic mémoire selon le nombre de pages
+    python bench.py importtime  # démarrage à froid de app.py : imports avant le premier affichage (cible en ms)
+    python bench.py warmup      # premier schéma d'un processus neuf, avec / sans prechauffer(), vs les suivants
+"""
+
+import ast
+import collections
+import contextlib
+import io
+import logging
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+
+import canapematplot as cm
+import pricing
+
+# Les polices "Arial" absentes d'un serveur Linux inondent la console d'avertissements
+logging.getLogger("matplotlib.font_manager").setLevel(logging.ERROR)
+
+COULEURS = {"assise": "#f6f6f6", "dossiers": "#b8b8b8", "accoudoirs": "#8f8f8f", "coussins": "#8B7E74"}
+
+# Mêmes appels que generer_schema_canape() dans app.py (valeurs par défaut du formulaire)
+MODELES = {
+    "Simple": lambda c: cm.render_Simple1(
+        tx=280, profondeur=70, dossier=True, acc_left=True, acc_right=True,
+        meridienne_side=None, meridienne_len=0, coussins=c,
+        window_title="Canapé Simple", couleurs=COULEURS),
+    "LNF": lambda c: cm.render_LNF(
+        tx=350, ty=250, profondeur=70, dossier_left=True, dossier_bas=True,
+        acc_left=True, acc_bas=True, meridienne_side=None, meridienne_len=0,
+        coussins=c, variant="auto", window_title="L - Sans Angle", couleurs=COULEURS),
+    "LF": lambda c: cm.render_LF_variant(
+        tx=350, ty=250, profondeur=70, dossier_left=True, dossier_bas=True,
+        acc_left=True, acc_bas=True, meridienne_side=None, meridienne_len=0,
+        coussins=c, window_title="L - Avec Angle", couleurs=COULEURS),
+    "U": lambda c: cm.render_U(
+        tx=350, ty_left=300, tz_right=280, profondeur=70,
+        dossier_left=True, dossier_bas=True, dossier_right=True,
+        acc_left=True, acc_bas=True, acc_right=True,
+        coussins=c, variant="auto", window_title="U - Sans Angle", couleurs=COULEURS),
+    "U1F": lambda c: cm.render_U1F_v1(
+        tx=350, ty=300, tz=280, profondeur=70,
+        dossier_left=True, dossier_bas=True, dossier_right=True,
+        acc_left=True, acc_right=True, meridienne_side=None, meridienne_len=0,
+        coussins=c, window_title="U - 1 Angle", couleurs=COULEURS),
+    "U2f": lambda c: cm.render_U2f_variant(
+        tx=350, ty_left=300, tz_right=280, profondeur=70,
+        dossier_left=True, dossier_bas=True, dossier_right=True,
+        acc_left=True, acc_bas=True, acc_right=True,
+        meridienne_side=None, meridienne_len=0,
+        coussins=c, window_title="U - 2 Angles", couleurs=COULEURS),
+}
+
+# Mêmes configurations, au format attendu par render_schema()
+CONFIGS = {
+    modele: {
+        "type_canape": type_canape, "tx": 280 if modele == "Simple" else 350,
+        "ty": 250 if modele in ("LNF", "LF") else 300, "tz": 280, "profondeur": 70,
+        "acc_left": True, "acc_right": True, "acc_bas": True,
+        "dossier_left": True, "dossier_bas": True, "dossier_right": True,
+        "meridienne_side": None, "meridienne_len": 0, "coussins": "auto", "couleurs": COULEURS,
+    }
+    for modele, type_canape in [
+        ("Simple", "Simple (S)"), ("LNF", "L - Sans Angle"), ("LF", "L - Avec Angle (LF)"),
+        ("U", "U - Sans Angle"), ("U1F", "U - 1 Angle (U1F)"), ("U2f", "U - 2 Angles (U2F)"),
+    ]
+}
+
+
+def _timeit(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def _render_once(modele, coussins="auto"):
+    """Rend un modèle via pyplot (comme app.py) et retourne la figure."""
+    plt.close("all")
+    with contextlib.redirect_stdout(io.StringIO()):
+        MODELES[modele](coussins)
+    return plt.gcf()
+
+
+def bench_render(repeat=5):
+    """Nombre d'artistes, temps de rendu et temps de savefig (PNG 150 dpi), par modèle."""
+    print(f"{'modèle':<8} {'mode':<7} {'artistes':>8} {'render ms':>10} {'savefig ms':>11}")
+    for batch in (False, True):
+        cm.BATCH_STROKES = batch
+        label = "groupé" if batch else "unitaire"
+        for modele in MODELES:
+            fig = _render_once(modele)
+            n_artists = len(fig.axes[0].get_children())
+
+            def _save():
+                fig.savefig(io.BytesIO(), format="png", dpi=150)
+
+            t_render = _timeit(lambda: _render_once(modele), repeat)
+            fig = _render_once(modele)
+            t_save = _timeit(_save, repeat)
+            print(f"{modele:<8} {label:<7} {n_artists:>8} {t_render*1000:>10.1f} {t_save*1000:>11.1f}")
+    cm.BATCH_STROKES = True
+    plt.close("all")
+
+
+def bench_svg(repeat=5):
+    """render_schema() : PNG et SVG via Matplotlib contre le backend SVG pur Python (temps + taille)."""
+    print(f"{'modèle':<8} {'png mpl ms':>11} {'svg mpl ms':>11} {'svg pur ms':>11} {'svg mpl Ko':>11} {'svg pur Ko':>11}")
+    for modele, config in CONFIGS.items():
+        res = {}
+        for key, kwargs in (("png", {"fmt": "png"}),
+                            ("svg_mpl", {"fmt": "svg"}),
+                            ("svg", {"fmt": "svg", "backend": "svg"})):
+            with contextlib.redirect_stdout(io.StringIO()):
+                data = cm.render_schema(config, **kwargs)
+                t = _timeit(lambda: cm.render_schema(config, **kwargs), repeat)
+            res[key] = (t, len(data))
+        print(f"{modele:<8} {res['png'][0]*1000:>11.1f} {res['svg_mpl'][0]*1000:>11.1f} "
+              f"{res['svg'][0]*1000:>11.1f} {res['svg_mpl'][1]/1024:>11.1f} {res['svg'][1]/1024:>11.1f}")
+
+
+# Palettes tournantes pour les rendus concurrents (une par rendu, toutes distinctes)
+PALETTES = [
+    {"assise": a, "dossiers": d, "accoudoirs": acc, "coussins": c}
+    for a in ("#f6f6f6", "beige")
+    for d in ("#b8b8b8", "#123456", "bleu marine")
+    for acc in ("#8f8f8f", "rouge")
+    for c in ("taupe", "vert", "#aa5500", "noir", "jaune")
+][:50]
+
+
+def _render_direct_svg(config):
+    """Dessin direct par render_canape (palette appliquée pendant le dessin), en SVG pur."""
+    with cm._render_context(backend="svg", headless=True) as ctx:
+        cm.render_canape(**config)
+    return ctx.finished.to_svg().encode("utf-8")
+
+
+def _render_job(job):
+    fn, config = job
+    return fn(config)
+
+
+def bench_threads(n=50, workers=8):
+    """
+    n rendus lancés en parallèle (pool de threads), chacun avec sa palette — en alternance
+    render_schema() (PNG, via Scene) et dessin direct en SVG : chaque sortie doit être
+    identique octet pour octet à son rendu séquentiel.
+    """
+    jobs = []
+    for i in range(n):
+        modele = list(CONFIGS)[i % len(CONFIGS)]
+        fn = cm.render_schema if i % 2 == 0 else _render_direct_svg
+        jobs.append((fn, dict(CONFIGS[modele], couleurs=PALETTES[i % len(PALETTES)])))
+    with contextlib.redirect_stdout(io.StringIO()):
+        t0 = time.perf_counter()
+        attendus = [_render_job(job) for job in jobs]
+        t_seq = time.perf_counter() - t0
+        # Bascule entre threads très fréquente : fait apparaître les courses sur un état partagé
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            t0 = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                obtenus = list(pool.map(_render_job, jobs))
+            t_par = time.perf_counter() - t0
+        finally:
+            sys.setswitchinterval(interval)
+    # une image vide (rendu muet) ne doit pas passer pour une image identique
+    erreurs = sum(a != b or not b for a, b in zip(attendus, obtenus))
+    print(f"{n} rendus : séquentiel {t_seq*1000:.0f} ms, {workers} threads {t_par*1000:.0f} ms")
+    print(f"Images différentes du rendu séquentiel (ou vides) : {erreurs}/{n}")
+    if erreurs or len(obtenus) != n:
+        sys.exit(1)
+
+
+# --- Optimiseurs valise : anciennes boucles Python, conservées telles quelles comme référence ---
+# (copie des optimiseurs d'avant le moteur commun _valise_search ; seuls les noms du module
+# sont préfixés par cm.)
+
+def _ref_optimize_valise_L_like(pts, rng, same, x_end_key="Bx", y_end_key="By", traversins=None):
+    best = None
+    r0, r1 = rng
+    for size_g in range(r0, r1+1):
+        cand_b = [size_g] if same else range(r0, r1+1)
+        for size_b in cand_b:
+            if abs(size_b - size_g) > 5:
+                continue
+            eval_A = cm._eval_L_like_counts(pts, size_b, size_g, shift_bas=False, x_end_key=x_end_key, y_end_key=y_end_key, traversins=traversins)
+            eval_B = cm._eval_L_like_counts(pts, size_b, size_g, shift_bas=True,  x_end_key=x_end_key, y_end_key=y_end_key, traversins=traversins)
+            e = min([eval_A, eval_B], key=lambda E: (E["waste"], -E["cover"], -size_b, -size_g))
+            score = (e["waste"], -e["cover"], -size_b, -size_g)
+            if (best is None) or (score < best["score"]):
+                best = {"score": score, "sizes": {"bas": size_b, "gauche": size_g}, "eval": e,
+                        "shift_bas": (e is eval_B)}
+    return best
+
+
+def _ref_optimize_valise_U2f(pts, rng, same, traversins=None):
+    best=None; r0,r1=rng
+    for sg in range(r0, r1+1):
+        cand_b = [sg] if same else range(r0, r1+1)
+        for sb in cand_b:
+            cand_d = [sg] if same else range(r0, r1+1)
+            for sd in cand_d:
+                if max(sb, sg, sd) - min(sb, sg, sd) > 5:
+                    continue
+                E = []
+                for sl in (False, True):
+                    for sr in (False, True):
+                        E.append(cm._eval_U2f_counts(pts, sb, sg, sd, sl, sr, traversins=traversins))
+                e = min(E, key=lambda x: (x["waste"], -x["cover"], -sb, -sg, -sd))
+                score = (e["waste"], -e["cover"], -sb, -sg, -sd)
+                if (best is None) or (score < best["score"]):
+                    best = {"score": score, "sizes": {"bas": sb, "gauche": sg, "droite": sd}, "eval": e}
+    if best:
+        chosen = best["eval"]
+        for sl in (False, True):
+            for sr in (False, True):
+                chk = cm._eval_U2f_counts(pts, best["sizes"]["bas"], best["sizes"]["gauche"], best["sizes"]["droite"], sl, sr, traversins=traversins)
+                if abs(chk["waste"] - chosen["waste"])<1e-9 and chk["cover"]==chosen["cover"]:
+                    best["shiftL"], best["shiftR"] = sl, sr
+                    return best
+    return best
+
+
+def _ref_optimize_valise_U1F(pts, rng, same, traversins=None):
+    best=None; r0,r1=rng
+    for sg in range(r0,r1+1):
+        for sb in ([sg] if same else range(r0,r1+1)):
+            for sd in ([sg] if same else range(r0,r1+1)):
+                if max(sb,sg,sd)-min(sb,sg,sd) > 5:
+                    continue
+                E=[]
+                for sl in (False,True):
+                    for sr in (False,True):
+                        E.append(cm._eval_U1F_counts(pts,sb,sg,sd,sl,sr,traversins=traversins))
+                e = min(E, key=lambda x: (x["waste"], -x["cover"], -sb, -sg, -sd))
+                score=(e["waste"], -e["cover"], -sb, -sg, -sd)
+                if (best is None) or (score < best["score"]):
+                    best={"score":score, "sizes":{"bas":sb,"gauche":sg,"droite":sd}, "shifts":("?", "?")}
+    # Retrouver shifts exacts
+    if best:
+        tgt = best["score"]
+        for sl in (False,True):
+            for sr in (False,True):
+                chk=cm._eval_U1F_counts(pts,best["sizes"]["bas"],best["sizes"]["gauche"],best["sizes"]["droite"],sl,sr,traversins=traversins)
+                score=(chk["waste"], -chk["cover"], -best["sizes"]["bas"], -best["sizes"]["gauche"], -best["sizes"]["droite"])
+                if score==tgt:
+                    best["shifts"]=(sl,sr); break
+    return best
+
+
+def _ref_optimize_valise_U(variant, pts, drawn, rng, same, traversins=None):
+    best=None; r0,r1=rng
+    for sg in range(r0,r1+1):
+        for sb in ([sg] if same else range(r0,r1+1)):
+            for sd in ([sg] if same else range(r0,r1+1)):
+                if max(sb,sg,sd)-min(sb,sg,sd) > 5:
+                    continue
+                E=[]
+                for sl in (False,True):
+                    for sr in (False,True):
+                        E.append(cm._eval_U_counts(variant, pts, drawn, sb, sg, sd, sl, sr, traversins=traversins))
+                e = min(E, key=lambda x: (x["waste"], -x["cover"], -sb, -sg, -sd))
+                score=(e["waste"], -e["cover"], -sb, -sg, -sd)
+                if (best is None) or (score < best["score"]):
+                    best={"score":score, "sizes":{"bas":sb,"gauche":sg,"droite":sd}}
+    if best:
+        tgt=best["score"]
+        for sl in (False,True):
+            for sr in (False,True):
+                chk=cm._eval_U_counts(variant, pts, drawn, best["sizes"]["bas"], best["sizes"]["gauche"], best["sizes"]["droite"], sl, sr, traversins=traversins)
+                score=(chk["waste"], -chk["cover"], -best["sizes"]["bas"], -best["sizes"]["gauche"], -best["sizes"]["droite"])
+                if score==tgt:
+                    best["shiftL"], best["shiftR"] = sl, sr
+                    break
+    return best
+
+
+def _ref_optimize_valise_simple(pts, rng, mer_side=None, mer_len=0, traversins=None):
+    x0 = pts["B0"][0]; x1 = pts["Bx"][0]
+    if mer_side == 'g' and mer_len>0:
+        x0 = max(x0, pts.get("B0_m", (x0,0))[0])
+    if mer_side == 'd' and mer_len>0:
+        x1 = min(x1, pts.get("Bx_m", (x1,0))[0])
+    if traversins:
+        if "g" in traversins: x0 += cm.TRAVERSIN_THK
+        if "d" in traversins: x1 -= cm.TRAVERSIN_THK
+
+    best=None; r0,r1=rng
+    for s in range(r0, r1+1):
+        n0, w0 = cm._waste_and_count_1d(max(0, x1-x0), s)
+        n1, w1 = cm._waste_and_count_1d(max(0, x1-(x0+cm.CUSHION_DEPTH)), s)
+        if w1 < w0 or (w1==w0 and n1>n0):
+            n, waste, off = n1, w1, cm.CUSHION_DEPTH
+        else:
+            n, waste, off = n0, w0, 0
+        score=(waste, -n, -s)
+        if (best is None) or (score < best["score"]):
+            best={"score":score, "size":s, "offset":off, "count":n}
+    return best
+
+
+_REF_OPTIMISEURS = {
+    "simple": _ref_optimize_valise_simple, "L_like": _ref_optimize_valise_L_like,
+    "U": _ref_optimize_valise_U, "U1F": _ref_optimize_valise_U1F, "U2f": _ref_optimize_valise_U2f,
+}
+
+
+def _ref_optimize_valise(name, args, kwargs):
+    """Rejoue un appel d'optimiseur valise avec la boucle de référence."""
+    return _REF_OPTIMISEURS[name](*args, **kwargs)
+
+
+def _valise_ecart(attendu, best):
+    """
+    True si le résultat du moteur diffère de la référence sur l'une des clés de celle-ci
+    (le moteur ajoute seulement "counts", lu par le dessin).
+    """
+    if not attendu or not best:
+        return bool(attendu) != bool(best)
+    return any(best.get(cle) != valeur for cle, valeur in attendu.items())
+
+
+VALISE_OPTIMISEURS = ("simple", "L_like", "U", "U1F", "U2f")
+
+
+def _capture_valise_calls():
+    """Appels réels aux optimiseurs valise sur une grille de dimensions et de specs."""
+    calls = []
+    originaux = {name: getattr(cm, f"_optimize_valise_{name}") for name in VALISE_OPTIMISEURS}
+
+    def _espion(name):
+        def _wrapper(*args, **kwargs):
+            calls.append((name, args, kwargs))
+            return originaux[name](*args, **kwargs)
+        return _wrapper
+
+    for name in originaux:
+        setattr(cm, f"_optimize_valise_{name}", _espion(name))
+    try:
+        for modele in CONFIGS:
+            for tx in (300, 377, 450):
+                for ty, tz in ((240, 260), (301, 283)):
+                    for coussins in ("valise", "p", "g", "s", "g:s"):
+                        for traversins, meridienne in ((None, (None, 0)), ("g,d", (None, 0)), (None, ("g", 50))):
+                            config = dict(CONFIGS[modele], tx=tx, ty=ty, tz=tz, coussins=coussins,
+                                          traversins=traversins, meridienne_side=meridienne[0],
+                                          meridienne_len=meridienne[1])
+                            with contextlib.redirect_stdout(io.StringIO()):
+                                try:
+                                    cm.layout_canape(config)
+                                except ValueError:
+                                    pass   # configuration refusée par le modèle (méridienne…)
+    finally:
+        for name, fn in originaux.items():
+            setattr(cm, f"_optimize_valise_{name}", fn)
+    return calls
+
+
+def bench_valise():
+    """Optimiseurs valise contre les boucles de référence : résultats identiques + temps."""
+    calls = _capture_valise_calls()
+    ecarts = 0
+    temps = {}
+    for name, args, kwargs in calls:
+        t0 = time.perf_counter()
+        attendu = _ref_optimize_valise(name, args, kwargs)
+        t1 = time.perf_counter()
+        best = getattr(cm, f"_optimize_valise_{name}")(*args, **kwargs)
+        t2 = time.perf_counter()
+        if _valise_ecart(attendu, best):
+            ecarts += 1
+        ref, new = temps.get(name, (0.0, 0.0))
+        temps[name] = (ref + t1 - t0, new + t2 - t1)
+    print(f"{'modèle':<8} {'référence ms':>13} {'moteur ms':>10}")
+    for name, (ref, new) in temps.items():
+        n = sum(1 for c in calls if c[0] == name)
+        print(f"{name:<8} {ref/n*1000:>13.2f} {new/n*1000:>10.3f}")
+    print(f"{len(calls)} appels comparés, résultats différents : {ecarts}")
+    # un optimiseur jamais appelé (espion contourné) ne doit pas passer pour identique
+    absents = [name for name in VALISE_OPTIMISEURS if name not in temps]
+    if absents:
+        print(f"Optimiseurs jamais appelés : {', '.join(absents)}")
+    if ecarts or absents:
+        sys.exit(1)
+
+
+def bench_tables(repeat=5):
+    """Tables précalculées (_cushion_tables) : construction, puis gains avec / sans tables."""
+    cm._cushion_tables_cache = None
+    t0 = time.perf_counter()
+    cm._cushion_tables()
+    print(f"Construction des tables : {(time.perf_counter() - t0)*1000:.1f} ms")
+
+    calls = _capture_valise_calls()
+    longueurs = range(0, cm.CUSHION_TABLE_MAX_LEN + 1)
+
+    def _optimiseurs():
+        for name, args, kwargs in calls:
+            getattr(cm, f"_optimize_valise_{name}")(*args, **kwargs)
+
+    def _auto_simple():
+        for L in longueurs:
+            cm._choose_cushion_size_auto_simple_S1(0, L)
+
+    print(f"{'cas':<28} {'direct µs':>10} {'tables µs':>10}")
+    for label, fn, n in (("optimiseur valise (appel)", _optimiseurs, len(calls)),
+                         ("auto simple (longueur)", _auto_simple, len(longueurs))):
+        res = []
+        for flag in (False, True):
+            cm.CUSHION_TABLES = flag
+            cm._window_keys_cache.clear()
+            fn()   # mémorisation par longueur comprise dans le régime établi
+            res.append(_timeit(fn, repeat) / n * 1e6)
+        print(f"{label:<28} {res[0]:>10.2f} {res[1]:>10.2f}")
+    cm.CUSHION_TABLES = True
+
+
+# Rendus en sélection automatique de variante (géométrie évaluée pour chaque variante)
+AUTO_VARIANTES = {
+    "LNF auto": lambda: cm.render_LNF(tx=350, ty=250, coussins="auto", variant="auto"),
+    "U auto":   lambda: cm.render_U(tx=350, ty_left=300, tz_right=280, coussins="auto", variant="auto"),
+    "U1F auto": lambda: cm.render_U1F(tx=350, ty_left=300, tz_right=280, coussins="auto", variant="auto"),
+}
+
+
+def bench_geometry(repeat=5):
+    """
+    Compte les appels compute_points_* / build_polys_* par rendu en sélection auto :
+    chaque variante évaluée doit être calculée une seule fois (dry-run réutilisé au rendu).
+    """
+    noms = [n for n in dir(cm) if n.startswith(("compute_points_", "build_polys_"))]
+    originaux = {n: getattr(cm, n) for n in noms}
+    appels = collections.Counter()
+
+    def _compteur(nom):
+        def _wrapper(*args, **kwargs):
+            appels[nom] += 1
+            return originaux[nom](*args, **kwargs)
+        return _wrapper
+
+    doublons = muets = 0
+    print(f"{'rendu':<10} {'ms':>6}  appels par fonction")
+    for label, fn in AUTO_VARIANTES.items():
+        appels.clear()
+        for nom in noms:
+            setattr(cm, nom, _compteur(nom))
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                cm._layout(label, fn)
+        finally:
+            for nom, f in originaux.items():
+                setattr(cm, nom, f)
+        doublons += sum(1 for n in appels.values() if n > 1)
+        muets += not appels   # aucun appel compté : espion contourné, rien n'a été vérifié
+        with contextlib.redirect_stdout(io.StringIO()):
+            t = _timeit(lambda: cm._layout(label, fn), repeat)
+        detail = ", ".join(f"{nom.split('_', 1)[-1]}×{n}" for nom, n in sorted(appels.items()))
+        print(f"{label:<10} {t*1000:>6.1f}  {detail}")
+    print(f"Fonctions de géométrie appelées plus d'une fois : {doublons}")
+    if muets:
+        print(f"Rendus sans aucun appel de géométrie compté : {muets}")
+    if doublons or muets:
+        sys.exit(1)
+
+
+def _evaluer_variante(job):
+    """Géométrie d'une variante + optimisation valise de ses coussins (coût d'une évaluation complète)."""
+    modele, variante = job
+    if modele == "LNF":
+        pts, polys = cm._dry_polys_for_variant(350, 250, 70, True, True, True, True, None, 0, variante)
+        return cm._optimize_valise_L_like(pts, (60, 100), False)
+    if modele == "U1F":
+        pts, polys = cm._dry_polys_for_U1F_variant(350, 300, 280, 70, True, True, True, True, True,
+                                                   None, 0, variante)
+        return cm._optimize_valise_U1F(pts, (60, 100), False)
+    pts, polys, drawn = cm._dry_polys_for_U_variant(variante, 350, 300, 280, 70, True, True, True,
+                                                    True, True, True)
+    return cm._optimize_valise_U(variante, pts, drawn, (60, 100), False)
+
+
+def bench_variants(repeat=20):
+    """
+    Évaluation de toutes les variantes d'un modèle en mode valise : séquentielle, ou répartie
+    sur un pool de threads (déjà créé, puis créé à chaque appel).
+    """
+    jobs = {
+        "LNF": [("LNF", v) for v in ("v1", "v2")],
+        "U":   [("U", v) for v in ("v1", "v2", "v3", "v4")],
+        "U1F": [("U1F", v) for v in ("v1", "v2", "v3", "v4")],
+    }
+    pool = ThreadPoolExecutor(max_workers=4)
+
+    def _pool_neuf(js):
+        with ThreadPoolExecutor(max_workers=4) as p:
+            return list(p.map(_evaluer_variante, js))
+
+    print(f"{'modèle':<8} {'séquentiel ms':>14} {'pool ms':>8} {'pool neuf ms':>13}")
+    for modele, js in jobs.items():
+        t_seq = _timeit(lambda: [_evaluer_variante(j) for j in js], repeat)
+        t_pool = _timeit(lambda: list(pool.map(_evaluer_variante, js)), repeat)
+        t_neuf = _timeit(lambda: _pool_neuf(js), repeat)
+        print(f"{modele:<8} {t_seq*1000:>14.2f} {t_pool*1000:>8.2f} {t_neuf*1000:>13.2f}")
+    pool.shutdown()
+
+
+# Totaux TTC attendus (HR35, 25 cm, sans option) : toute évolution des surfaces ou des tarifs
+# doit être reportée ici, délibérément.
+# Devis par défaut (calculer_prix_devis, tarif forfaitaire en vigueur) — prix clients
+TOTAUX_DEVIS = {"Simple": 1981.08, "LNF": 3831.12, "LF": 3831.12,
+                "U": 5856.72, "U1F": 5856.72, "U2f": 5856.72}
+# Chiffrage depuis la Scene (pricing.TARIF_SCHEMA, sur option), avec les hauteurs et la marge
+# de couture de pricing.py — hypothèses à revoir avec elles
+TOTAUX_SCENE = {"Simple": 3429.36, "LNF": 6492.24, "LF": 6504.48,
+                "U": 9683.64, "U1F": 9622.44, "U2f": 9634.68}
+
+
+def bench_pricing(repeat=20):
+    """
+    Prix calculé depuis la Scene de l'aperçu (surfaces des polygones, comptages réels) comparé
+    à l'estimation forfaitaire ; le chiffrage ne doit appeler aucune fonction de géométrie,
+    les totaux doivent valoir TOTAUX_SCENE et la méridienne doit être facturée pour chaque modèle.
+    Le devis par défaut (calculer_prix_devis) doit rester au tarif forfaitaire, TOTAUX_DEVIS.
+    """
+    from quote_config import QuoteConfig
+
+    noms = [n for n in dir(cm) if n.startswith(("compute_points_", "build_polys_"))]
+    originaux = {n: getattr(cm, n) for n in noms}
+    appels = collections.Counter()
+
+    def _compteur(nom):
+        def _wrapper(*args, **kwargs):
+            appels[nom] += 1
+            return originaux[nom](*args, **kwargs)
+        return _wrapper
+
+    ecarts = []
+    print(f"{'modèle':<8} {'layout ms':>10} {'prix µs':>8} {'tissu m²':>15} {'mousse m³':>15} {'TTC €':>17}")
+    for modele, config in CONFIGS.items():
+        scene = cm.layout_canape(config)
+        t_layout = _timeit(lambda: cm.layout_canape(config), 5)
+        for nom in noms:
+            setattr(cm, nom, _compteur(nom))
+        try:
+            prix = pricing.calculer_prix_scene(scene, "HR35", 25, 0, 0, False, False)
+            t_prix = _timeit(lambda: pricing.calculer_prix_scene(scene, "HR35", 25, 0, 0, False, False), repeat)
+            avec_meridienne = pricing.calculer_prix_scene(scene, "HR35", 25, 0, 0, False, True)
+        finally:
+            for nom, f in originaux.items():
+                setattr(cm, nom, f)
+        forfait = pricing.calculer_prix_total(
+            config["type_canape"], config["tx"], config["ty"], config["tz"], config["profondeur"],
+            config["coussins"], "HR35", 25,
+            config["acc_left"], config["acc_right"], config["acc_bas"],
+            config["dossier_left"], config["dossier_bas"], config["dossier_right"],
+            0, 0, False, False)
+        print(f"{modele:<8} {t_layout*1000:>10.1f} {t_prix*1e6:>8.1f} "
+              f"{forfait['surface_tissu_m2']:>7.2f} → {prix['surface_tissu_m2']:<5.2f} "
+              f"{forfait['volume_mousse_m3']:>7.3f} → {prix['volume_mousse_m3']:<5.3f} "
+              f"{forfait['total_ttc']:>8.2f} → {prix['total_ttc']:<8.2f}")
+        devis = pricing.calculer_prix_devis(
+            QuoteConfig(**{k: v for k, v in config.items() if k != "type_canape"}, modele=config["type_canape"]),
+            scene=scene)
+        if devis['total_ttc'] != TOTAUX_DEVIS[modele]:
+            ecarts.append(f"{modele} : devis par défaut à {devis['total_ttc']} au lieu de {TOTAUX_DEVIS[modele]}")
+        if prix['total_ttc'] != TOTAUX_SCENE[modele]:
+            ecarts.append(f"{modele} : {prix['total_ttc']} au lieu de {TOTAUX_SCENE[modele]}")
+        if avec_meridienne['details'].get('Méridienne') != pricing.PRIX_MERIDIENNE:
+            ecarts.append(f"{modele} : méridienne non facturée")
+    print(f"Appels de géométrie pendant le chiffrage : {sum(appels.values())}")
+    for ecart in ecarts:
+        print(f"Écart : {ecart}")
+    if appels or ecarts:
+        sys.exit(1)
+
+
+def bench_pdf(n=48):
+    """
+    Devis PDF par seconde (schéma vectoriel compris), en deux passes ; en mode invariant, les
+    deux passes doivent produire les mêmes PDF octet pour octet.
+    """
+    from reportlab import rl_config
+    import pdf_generator
+    from quote_config import QuoteConfig
+
+    configs = [QuoteConfig(**{k: v for k, v in c.items() if k != "type_canape"},
+                           modele=c["type_canape"], type_mousse=mousse)
+               for c in CONFIGS.values() for mousse in pdf_generator.IMAGE_FILES]
+    jobs = [configs[i % len(configs)] for i in range(n)]
+    scenes = {c: cm.layout_canape(c) for c in configs}
+    prix = {c: pricing.calculer_prix_devis(c, scene=scenes[c]) for c in configs}
+
+    def _lot():
+        # le Drawing est remis à l'échelle par le PDF : un neuf par devis, préparé hors chrono
+        dessins = [cm.render_drawing(c, scene=scenes[c]) for c in jobs]
+        t0 = time.perf_counter()
+        pdfs = [pdf_generator.generer_pdf_devis(c, prix[c], schema_image=d).getvalue()
+                for c, d in zip(jobs, dessins)]
+        return time.perf_counter() - t0, pdfs
+
+    invariant = rl_config.invariant
+    rl_config.invariant = 1
+    sorties = []
+    try:
+        _lot()   # chauffe (polices, images de mousse décodées)
+        for passe in (1, 2):
+            duree, pdfs = _lot()
+            sorties.append(pdfs)
+            print(f"passe {passe}  {n / duree:>7.1f} devis/s  ({duree / n * 1000:.1f} ms/devis)")
+    finally:
+        rl_config.invariant = invariant
+    differents = sum(a != b for a, b in zip(*sorties))
+    print(f"PDF différents : {differents}/{n}")
+    if differents:
+        sys.exit(1)
+
+
+def bench_catalogue(tailles=(12, 48, 192)):
+    """
+    generer_pdf_catalogue() sur un générateur de devis (schéma produit page par page) :
+    débit, taille du fichier et pic mémoire Python. Le pic croît avec le nombre de pages (flux
+    compressé de chaque page gardé par ReportLab jusqu'à save()), mais pas avec les schémas.
+    """
+    import pdf_generator
+    from quote_config import QuoteConfig
+
+    configs = [QuoteConfig(**{k: v for k, v in c.items() if k != "type_canape"},
+                           modele=c["type_canape"], type_mousse=mousse)
+               for c in CONFIGS.values() for mousse in pdf_generator.IMAGE_FILES]
+    scenes = {c: cm.layout_canape(c) for c in configs}
+    prix = {c: pricing.calculer_prix_devis(c, scene=scenes[c]) for c in configs}
+
+    def _devis(n):
+        for i in range(n):
+            c = configs[i % len(configs)]
+            yield c, prix[c], cm.render_drawing(c, scene=scenes[c])
+
+    with tempfile.TemporaryDirectory() as dossier:
+        chemin = os.path.join(dossier, "catalogue.pdf")
+        pdf_generator.generer_pdf_catalogue(_devis(2), chemin)   # chauffe (polices, images de mousse)
+        print(f"{'devis':>6} {'pages/s':>8} {'Ko':>8} {'Ko/page':>8} {'pic Mo':>7}")
+        for n in tailles:
+            tracemalloc.start()
+            t0 = time.perf_counter()
+            pdf_generator.generer_pdf_catalogue(_devis(n), chemin)
+            duree = time.perf_counter() - t0
+            pic = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            taille = os.path.getsize(chemin) / 1024
+            print(f"{n:>6} {n / duree:>8.1f} {taille:>8.0f} {taille / n:>8.1f} {pic / 2**20:>7.1f}")
+
+
+# Imports d'app.py exécutés avant son premier élément Streamlit (streamlit lui-même exclu), en ms
+CIBLE_PREMIER_AFFICHAGE_MS = 25
+
+# Modules lourds que l'application ne charge qu'au premier usage
+IMPORTS_DIFFERES = ["canapematplot", "pdf_generator", "matplotlib.figure", "reportlab.platypus"]
+
+
+def _imports_avant_affichage(chemin="app.py"):
+    """Instructions d'import en tête de `chemin`, jusqu'au premier appel Streamlit (hors streamlit)."""
+    with open(chemin, encoding="utf-8") as f:
+        arbre = ast.parse(f.read())
+    imports = []
+    for noeud in arbre.body:
+        if isinstance(noeud, (ast.Import, ast.ImportFrom)):
+            if not any(a.name.split(".")[0] == "streamlit" for a in noeud.names) and \
+                    not (isinstance(noeud, ast.ImportFrom) and noeud.module == "streamlit"):
+                imports.append(ast.unparse(noeud))
+        elif not (isinstance(noeud, ast.Expr) and isinstance(noeud.value, ast.Constant)):
+            break
+    return imports
+
+
+def _temps_import(code, repeat=3):
+    """(ms, modules les plus coûteux) de `code` dans un interpréteur neuf où streamlit est déjà importé."""
+    script = ("import time, streamlit\n"
+              "t0 = time.perf_counter()\n"
+              f"{code}\n"
+              "print((time.perf_counter() - t0) * 1000)")
+    meilleur, detail = None, []
+    for _ in range(repeat):
+        res = subprocess.run([sys.executable, "-X", "importtime", "-c", script],
+                             capture_output=True, text=True, check=True)
+        ms = float(res.stdout.strip().splitlines()[-1])
+        if meilleur is None or ms < meilleur:
+            meilleur = ms
+            # lignes « import time: self | cumulé | module » après l'import de streamlit
+            lignes = res.stderr.splitlines()
+            debut = max(i for i, l in enumerate(lignes) if l.rstrip().endswith("| streamlit")) + 1
+            detail = []
+            for l in lignes[debut:]:
+                champs = l.split("|")
+                if len(champs) == 3 and not champs[2].startswith("  "):
+                    detail.append((int(champs[1]) / 1000, champs[2].strip()))
+    return meilleur, sorted(detail, reverse=True)
+
+
+def bench_importtime():
+    """
+    Démarrage à froid de app.py (python -X importtime) : imports exécutés avant le premier
+    affichage de la page comparés à CIBLE_PREMIER_AFFICHAGE_MS, puis coût des modules lourds
+    chargés au premier schéma / premier PDF. streamlit est importé d'abord : son coût ne dépend pas d'app.py.
+    """
+    imports = _imports_avant_affichage()
+    ms, detail = _temps_import("\n".join(imports))
+    print("Imports avant le premier affichage :")
+    for ligne in imports:
+        print(f"    {ligne}")
+    for cumul, module in detail[:8]:
+        print(f"  {module:<28} {cumul:>7.1f} ms")
+    print(f"Total : {ms:.1f} ms (cible {CIBLE_PREMIER_AFFICHAGE_MS} ms)")
+    print("Chargés au premier usage :")
+    for module in IMPORTS_DIFFERES:
+        print(f"  {module:<28} {_temps_import(f'import {module}')[0]:>7.1f} ms")
+    if ms > CIBLE_PREMIER_AFFICHAGE_MS:
+        sys.exit(1)
+
+
+_SCRIPT_WARMUP = """
+import json, logging, statistics, sys, time
+logging.getLogger("matplotlib.font_manager").setLevel(logging.ERROR)
+import canapematplot as cm
+config = json.loads(sys.argv[1])
+etapes = cm.prechauffer() if sys.argv[2] == "1" else {}
+temps = []
+for _ in range(int(sys.argv[3])):
+    t0 = time.perf_counter()
+    cm.render_schema(config, scene=cm.layout_canape(config))
+    temps.append((time.perf_counter() - t0) * 1000)
+print(json.dumps({"etapes": etapes, "premier": temps[0], "suivants": statistics.median(temps[1:])}))
+"""
+
+
+def bench_warmup(n=30):
+    """
+    Premier schéma (layout_canape + render_schema PNG) d'un processus neuf comparé à la médiane
+    des suivants, sans puis avec canapematplot.prechauffer() au démarrage.
+    """
+    import json
+    config = dict(CONFIGS["U1F"])
+    for chauffe in ("0", "1"):
+        res = subprocess.run([sys.executable, "-c", _SCRIPT_WARMUP, json.dumps(config), chauffe, str(n)],
+                             capture_output=True, text=True, check=True)
+        r = json.loads(res.stdout.strip().splitlines()[-1])
+        if r["etapes"]:
+            print("prechauffer() : " + ", ".join(f"{k} {v:.0f} ms" for k, v in r["etapes"].items())
+                  + f" (total {sum(r['etapes'].values()):.0f} ms)")
+        print(f"{'avec' if chauffe == '1' else 'sans'} préchauffage : premier schéma {r['premier']:.0f} ms, "
+              f"suivants {r['suivants']:.0f} ms (×{r['premier'] / r['suivants']:.1f})")
+
+
+BENCHES = {
+    "render": bench_render,
+    "svg": bench_svg,
+    "threads": bench_threads,
+    "valise": bench_valise,
+    "tables": bench_tables,
+    "geometry": bench_geometry,
+    "variants": bench_variants,
+    "pricing": bench_pricing,
+    "pdf": bench_pdf,
+    "catalogue": bench_catalogue,
+    "importtime": bench_importtime,
+    "warmup": bench_warmup,
+}
+
+
+if __name__ == "__main__":
+    names = sys.argv[1:] or list(BENCHES)
+    for name in names:
+        if name not in BENCHES:
+            sys.exit(f"Benchmark inconnu : {name} (choix : {', '.join(BENCHES)})")
+        print(f"--- {name} ---")
+        BENCHES[name]()
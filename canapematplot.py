@@ -31,26 +31,95 @@ def _format_valise_counts_console(sizes, counts, total):
 #   - Correctifs nommage 'coussins_count' -> 'cushions_count'
 
 import math
+import threading
+from contextlib import contextmanager
 import unicodedata
-
-import matplotlib.pyplot as plt
-from matplotlib.patches import Polygon
+import time
+from dataclasses import dataclass
+from io import BytesIO
+import html
 import types
 
+
+def _xml_escape(text):
+    """&, < et > échappés pour le SVG (comme xml.sax.saxutils.escape, sans importer urllib/http)."""
+    return html.escape(text, quote=False)
+
+# NB : Matplotlib n'est importé qu'à la création d'un _Screen (backend "matplotlib") ;
+#      les backends SVG pur (_SvgScreen) et ReportLab (_RLScreen) n'en ont pas besoin.
+
 # =========================
-# Adapteur "turtle" -> Matplotlib
+# Adapteur "turtle" -> Matplotlib / SVG
 # =========================
 
-_current_screen = None
+class _RenderContext:
+    """
+    État d'un rendu, propre à chaque thread (cf. _ctx / _render_context) :
+      - screen   → écran en cours de dessin (équivalent du singleton turtle)
+      - finished → en mode headless : écran finalisé par turtle.done(), à exporter
+      - headless → True pendant render_schema() : pas de pyplot ni de plt.show()
+      - backend  → "matplotlib" (défaut), "svg", "reportlab" ou "scene" (enregistrement, cf. layout_*)
+      - notes    → en mode "scene" : éléments sémantiques relevés pendant le dessin
+      - palette  → {"accoudoirs"|"dossiers"|"assise"|"coussins": (hex, nom)} du rendu en cours
+    La transformation cm → px (WorldToScreen) est créée par chaque render_* et passée
+    explicitement (`tr`) aux outils de dessin : elle n'a pas besoin d'état partagé.
+    """
+    __slots__ = ("screen", "finished", "headless", "backend", "notes", "palette")
+
+    def __init__(self, backend="matplotlib", headless=False, notes=None, palette=None):
+        self.screen = None
+        self.finished = None
+        self.headless = headless
+        self.backend = backend
+        self.notes = notes
+        self.palette = palette
+
+_local = threading.local()
+
+def _ctx():
+    """Contexte de rendu du thread courant (créé à la demande)."""
+    ctx = getattr(_local, "ctx", None)
+    if ctx is None:
+        ctx = _local.ctx = _RenderContext()
+    return ctx
+
+@contextmanager
+def _render_context(**kwargs):
+    """Active un contexte de rendu neuf pour le thread courant, puis restaure le précédent."""
+    prev = getattr(_local, "ctx", None)
+    _local.ctx = ctx = _RenderContext(**kwargs)
+    try:
+        yield ctx
+    finally:
+        _local.ctx = prev
+
+# Regroupe les traits / remplissages en quelques collections Matplotlib
+# (au lieu d'un Line2D par goto). False = ancien comportement, utile pour comparer.
+BATCH_STROKES = True
+
+# Backends vectoriels : 1 unité = 1 px turtle ; tailles de police turtle en points → px
+_PT_TO_PX = 4 / 3.0
 
 class _Screen:
-    def __init__(self):
-        global _current_screen
-        self.fig, self.ax = plt.subplots()
+    """Écran Matplotlib : une figure, un axe, des primitives regroupées en collections."""
+    def __init__(self, headless=None):
+        if headless is None:
+            headless = _ctx().headless
+        if headless:
+            from matplotlib.backends.backend_agg import FigureCanvasAgg
+            from matplotlib.figure import Figure
+            self.fig = Figure()
+            FigureCanvasAgg(self.fig)
+            self.ax = self.fig.add_subplot()
+        else:
+            import matplotlib.pyplot as plt
+            self.fig, self.ax = plt.subplots()
         self.ax.set_aspect('equal', adjustable='box')
         self.width = None
         self.height = None
-        _current_screen = self
+        # tampons vidés par flush() : polylignes [pts, couleur, épaisseur] et chemins remplis
+        self._strokes = []
+        self._fills = []
 
     def setup(self, width, height):
         """Approxime turtle.Screen().setup(width,height)."""
@@ -78,14 +147,300 @@ class _Screen:
         # Avec Matplotlib on ne s'en sert pas : méthode factice pour compatibilité.
         pass
 
+    # --- Primitives (appelées par _Turtle) ---
+    def add_segment(self, x0, y0, x1, y1, color, linewidth):
+        """Prolonge la polyligne courante si même stylo et point de départ, sinon en ouvre une."""
+        if not BATCH_STROKES:
+            self.ax.plot([x0, x1], [y0, y1], linewidth=linewidth, color=color)
+            return
+        _append_segment(self._strokes, x0, y0, x1, y1, color, linewidth)
+
+    def add_fill(self, points, facecolor, edgecolor, linewidth):
+        from matplotlib.path import Path
+        if not BATCH_STROKES:
+            from matplotlib.patches import Polygon
+            self.ax.add_patch(Polygon(points, closed=True, facecolor=facecolor,
+                                      edgecolor=edgecolor, linewidth=linewidth))
+            return
+        path = Path(list(points) + [points[0]], closed=True)
+        self._fills.append((path, facecolor, edgecolor, linewidth))
+
+    def add_rounded_rect(self, x0, y0, x1, y1, radius, fill, outline, width):
+        path = _rounded_rect_path(x0, y0, x1, y1, radius)
+        face = fill if fill else "none"
+        if not BATCH_STROKES:
+            from matplotlib.patches import PathPatch
+            self.ax.add_patch(PathPatch(path, facecolor=face, edgecolor=outline, linewidth=width))
+            return
+        self._fills.append((path, face, outline, width))
+
+    def add_text(self, x, y, text, align="left", font=None):
+        ha = {"left": "left", "center": "center", "right": "right"}.get(align, "left")
+        kwargs = {"ha": ha, "va": "center"}
+        if font is not None:
+            # tuple de type ("Arial", 12, "bold")
+            if len(font) > 0:
+                kwargs["fontfamily"] = font[0]
+            if len(font) > 1:
+                kwargs["fontsize"] = font[1]
+            if len(font) > 2:
+                style = font[2]
+                if style in ("bold", "normal"):
+                    kwargs["fontweight"] = style
+                else:
+                    kwargs["fontstyle"] = style
+        self.ax.text(x, y, str(text), **kwargs)
+
+    def flush(self):
+        """
+        Crée une PathCollection (remplissages) et une LineCollection (traits) à partir des tampons.
+        Couleurs / épaisseurs sont portées par élément : l'ordre de peinture est celui des appels,
+        et les zorders reprennent ceux de Patch (1) et Line2D (2) → rendu identique à l'ancien.
+        """
+        from matplotlib.collections import LineCollection, PathCollection
+        if self._fills:
+            coll = PathCollection([f[0] for f in self._fills],
+                                  facecolors=[f[1] for f in self._fills],
+                                  edgecolors=[f[2] for f in self._fills],
+                                  linewidths=[f[3] for f in self._fills],
+                                  zorder=1)
+            self.ax.add_collection(coll, autolim=False)
+        if self._strokes:
+            coll = LineCollection([s[0] for s in self._strokes],
+                                  colors=[s[1] for s in self._strokes],
+                                  linewidths=[s[2] for s in self._strokes],
+                                  capstyle="projecting", joinstyle="round",
+                                  zorder=2)
+            self.ax.add_collection(coll, autolim=False)
+        self._strokes = []
+        self._fills = []
+
+    def finish(self):
+        self.flush()
+        self.ax.set_aspect("equal", adjustable="box")
+
+
+class _SvgScreen:
+    """
+    Écran SVG pur Python (aucun import Matplotlib) : mêmes primitives que _Screen,
+    écrites en éléments SVG. Repère turtle (origine au centre, y vers le haut) → y inversé.
+    Ordre de peinture identique au rendu Matplotlib : remplissages, puis traits, puis textes.
+    """
+    def __init__(self):
+        self.width = float(WIN_W)
+        self.height = float(WIN_H)
+        self._title = None
+        self._strokes = []
+        self._fills = []
+        self._texts = []
+
+    def setup(self, width, height):
+        self.width, self.height = float(width), float(height)
+
+    def title(self, text):
+        self._title = str(text)
+
+    def tracer(self, flag):
+        pass
+
+    def add_segment(self, x0, y0, x1, y1, color, linewidth):
+        _append_segment(self._strokes, x0, y0, x1, y1, color, linewidth)
+
+    def add_fill(self, points, facecolor, edgecolor, linewidth):
+        d = "M" + " L".join(f"{x:.1f},{-y:.1f}" for x, y in points) + " Z"
+        self._fills.append(f'<path d="{d}" fill="{facecolor}" stroke="{edgecolor}" '
+                           f'stroke-width="{linewidth:g}"/>')
+
+    def add_rounded_rect(self, x0, y0, x1, y1, radius, fill, outline, width):
+        if x0 > x1: x0, x1 = x1, x0
+        if y0 > y1: y0, y1 = y1, y0
+        r = max(0.0, min(float(radius), (x1 - x0) / 2.0, (y1 - y0) / 2.0))
+        self._fills.append(f'<rect x="{x0:.1f}" y="{-y1:.1f}" width="{x1 - x0:.1f}" '
+                           f'height="{y1 - y0:.1f}" rx="{r:.1f}" fill="{fill or "none"}" '
+                           f'stroke="{outline}" stroke-width="{float(width):g}"/>')
+
+    def add_text(self, x, y, text, align="left", font=None):
+        anchor = {"left": "start", "center": "middle", "right": "end"}.get(align, "start")
+        attrs = f'x="{x:.1f}" y="{-y:.1f}" text-anchor="{anchor}" dominant-baseline="central"'
+        if font is not None:
+            if len(font) > 0:
+                attrs += f' font-family="{font[0]}"'
+            if len(font) > 1:
+                attrs += f' font-size="{font[1] * _PT_TO_PX:.1f}"'
+            if len(font) > 2:
+                style = font[2]
+                attrs += (f' font-weight="{style}"' if style in ("bold", "normal")
+                          else f' font-style="{style}"')
+        self._texts.append(f"<text {attrs}>{_xml_escape(str(text))}</text>")
+
+    def finish(self):
+        pass
+
+    def to_svg(self):
+        w, h = self.width, self.height
+        out = [f'<svg xmlns="http://www.w3.org/2000/svg" width="{w:g}" height="{h:g}" '
+               f'viewBox="{-w / 2:g} {-h / 2:g} {w:g} {h:g}">',
+               f'<rect x="{-w / 2:g}" y="{-h / 2:g}" width="{w:g}" height="{h:g}" fill="#ffffff"/>']
+        if self._title:
+            out.append(f"<title>{_xml_escape(self._title)}</title>")
+        out.extend(self._fills)
+        for pts, color, lw in self._strokes:
+            p = " ".join(f"{x:.1f},{-y:.1f}" for x, y in pts)
+            out.append(f'<polyline points="{p}" fill="none" stroke="{color}" stroke-width="{lw:g}" '
+                       f'stroke-linecap="square" stroke-linejoin="round"/>')
+        out.extend(self._texts)
+        out.append("</svg>")
+        return "\n".join(out)
+
+
+class _RLScreen:
+    """
+    Écran ReportLab : mêmes primitives, assemblées en un reportlab.graphics.shapes.Drawing
+    (flowable vectoriel pour le devis PDF). Polices Arial → Helvetica (polices PDF standard).
+    """
+    _FONTS = {"bold": "Helvetica-Bold", "italic": "Helvetica-Oblique", "normal": "Helvetica"}
+
+    def __init__(self):
+        self.width = float(WIN_W)
+        self.height = float(WIN_H)
+        self._title = None
+        self._strokes = []
+        self._fills = []
+        self._texts = []
+
+    def setup(self, width, height):
+        self.width, self.height = float(width), float(height)
+
+    def title(self, text):
+        self._title = str(text)
+
+    def tracer(self, flag):
+        pass
+
+    @staticmethod
+    def _color(c):
+        from reportlab.lib import colors
+        if c is None or c == "none":
+            return None
+        return colors.toColor(c)
+
+    def add_segment(self, x0, y0, x1, y1, color, linewidth):
+        _append_segment(self._strokes, x0, y0, x1, y1, color, linewidth)
+
+    def add_fill(self, points, facecolor, edgecolor, linewidth):
+        from reportlab.graphics.shapes import Polygon as RLPolygon
+        flat = [v for p in points for v in p]
+        self._fills.append(RLPolygon(flat, fillColor=self._color(facecolor),
+                                     strokeColor=self._color(edgecolor), strokeWidth=linewidth))
+
+    def add_rounded_rect(self, x0, y0, x1, y1, radius, fill, outline, width):
+        from reportlab.graphics.shapes import Rect
+        if x0 > x1: x0, x1 = x1, x0
+        if y0 > y1: y0, y1 = y1, y0
+        r = max(0.0, min(float(radius), (x1 - x0) / 2.0, (y1 - y0) / 2.0))
+        self._fills.append(Rect(x0, y0, x1 - x0, y1 - y0, rx=r, ry=r,
+                                fillColor=self._color(fill), strokeColor=self._color(outline),
+                                strokeWidth=width))
+
+    def add_text(self, x, y, text, align="left", font=None):
+        from reportlab.graphics.shapes import String
+        anchor = {"left": "start", "center": "middle", "right": "end"}.get(align, "start")
+        size = (font[1] if font is not None and len(font) > 1 else 10) * _PT_TO_PX
+        style = font[2] if font is not None and len(font) > 2 else "normal"
+        # va="center" : la ligne de base descend d'environ un tiers de corps
+        self._texts.append(String(x, y - 0.35 * size, str(text), fontSize=size,
+                                  fontName=self._FONTS.get(style, "Helvetica"),
+                                  textAnchor=anchor))
+
+    def finish(self):
+        pass
+
+    def to_drawing(self, margin=10):
+        """Drawing recadré sur le contenu (équivalent de bbox_inches='tight')."""
+        from reportlab.graphics.shapes import Drawing, Group, PolyLine, String
+        content = Group(*self._fills)
+        for pts, color, lw in self._strokes:
+            content.add(PolyLine([v for p in pts for v in p], strokeColor=self._color(color),
+                                 strokeWidth=lw, strokeLineCap=2, strokeLineJoin=1))
+        for txt in self._texts:
+            content.add(txt)
+        x0, y0, x1, y1 = content.getBounds() if content.contents else (0, 0, 1, 1)
+        if self._title:
+            content.add(String((x0 + x1) / 2.0, y1 + 12, self._title, fontName="Helvetica",
+                               fontSize=12, textAnchor="middle"))
+            y1 += 12 + 14
+        content.translate(margin - x0, margin - y0)
+        d = Drawing(x1 - x0 + 2 * margin, y1 - y0 + 2 * margin)
+        d.add(content)
+        return d
+
+
+def _append_segment(strokes, x0, y0, x1, y1, color, linewidth):
+    """Prolonge la dernière polyligne de `strokes` si même stylo et point de départ, sinon en ouvre une."""
+    if strokes:
+        last = strokes[-1]
+        if last[1] == color and last[2] == linewidth and last[0][-1] == (x0, y0):
+            last[0].append((x1, y1))
+            return
+    strokes.append([[(x0, y0), (x1, y1)], color, linewidth])
+
+
+class _SceneScreen:
+    """
+    Écran d'enregistrement : mémorise les primitives (liste d'opérations rejouable sur
+    n'importe quel autre écran) sans rien dessiner. Utilisé par layout_* → Scene.
+    """
+    def __init__(self):
+        self.width = float(WIN_W)
+        self.height = float(WIN_H)
+        self._title = ""
+        self.ops = []
+
+    def setup(self, width, height):
+        self.width, self.height = float(width), float(height)
+
+    def title(self, text):
+        self._title = str(text)
+
+    def tracer(self, flag):
+        pass
+
+    def add_segment(self, *args):
+        self.ops.append(("add_segment", args))
+
+    def add_fill(self, points, *args):
+        self.ops.append(("add_fill", (tuple(points),) + args))
+
+    def add_rounded_rect(self, *args):
+        self.ops.append(("add_rounded_rect", args))
+
+    def add_text(self, x, y, text, align="left", font=None):
+        self.ops.append(("add_text", (x, y, str(text), align, font)))
+
+    def finish(self):
+        pass
+
+
+_SCREENS = {"matplotlib": _Screen, "svg": _SvgScreen, "reportlab": _RLScreen, "scene": _SceneScreen}
+
+def _new_screen(backend=None):
+    """turtle.Screen() : crée l'écran du backend courant (Matplotlib par défaut) et l'active."""
+    ctx = _ctx()
+    ctx.screen = _SCREENS[backend or ctx.backend]()
+    return ctx.screen
+
+
+def _scene_note(kind, value):
+    """En mode enregistrement (layout_*), relève un élément sémantique du schéma."""
+    notes = _ctx().notes
+    if notes is not None:
+        notes.setdefault(kind, []).append(value)
+
 
 class _Turtle:
     def __init__(self, visible=True):
-        global _current_screen
-        if _current_screen is None:
-            _current_screen = _Screen()
-        self.screen = _current_screen
-        self.ax = self.screen.ax
+        ctx = _ctx()
+        self.screen = ctx.screen if ctx.screen is not None else _new_screen()
         self.x = 0.0
         self.y = 0.0
         # 0° vers la droite, positif = anti-horaire (comme turtle)
@@ -129,9 +484,8 @@ class _Turtle:
         x = float(x)
         y = float(y)
         if self.pen_down:
-            self.ax.plot([self.x, x], [self.y, y],
-                         linewidth=self.linewidth,
-                         color=self.pencolor_value)
+            self.screen.add_segment(self.x, self.y, x, y,
+                                    self.pencolor_value, self.linewidth)
         if self.is_filling:
             if not self.fill_path:
                 self.fill_path.append((self.x, self.y))
@@ -157,11 +511,8 @@ class _Turtle:
 
     def end_fill(self):
         if self.is_filling and len(self.fill_path) >= 3:
-            poly = Polygon(self.fill_path, closed=True,
-                           facecolor=self.fillcolor_value,
-                           edgecolor=self.pencolor_value,
-                           linewidth=self.linewidth)
-            self.ax.add_patch(poly)
+            self.screen.add_fill(self.fill_path, self.fillcolor_value,
+                                 self.pencolor_value, self.linewidth)
         self.is_filling = False
         self.fill_path = []
 
@@ -200,23 +551,17 @@ class _Turtle:
         # nouvelle orientation de la tortue à la fin de l'arc
         self.heading = start_heading + extent
 
+    # --- Rectangle à coins arrondis (primitive native, un seul chemin) ---
+    def rounded_rect(self, x0, y0, x1, y1, radius=0.0, fill=None, outline="black", width=1.0):
+        """
+        Rectangle (px) à coins arrondis : remplissage + contour en un seul chemin
+        (coins en Bézier cubiques) au lieu des ~80 goto de forward()/circle().
+        """
+        self.screen.add_rounded_rect(x0, y0, x1, y1, radius, fill, outline, float(width))
+
     # --- Texte ---
     def write(self, text, align="left", font=None):
-        ha = {"left": "left", "center": "center", "right": "right"}.get(align, "left")
-        kwargs = {"ha": ha, "va": "center"}
-        if font is not None:
-            # tuple de type ("Arial", 12, "bold")
-            if len(font) > 0:
-                kwargs["fontfamily"] = font[0]
-            if len(font) > 1:
-                kwargs["fontsize"] = font[1]
-            if len(font) > 2:
-                style = font[2]
-                if style in ("bold", "normal"):
-                    kwargs["fontweight"] = style
-                else:
-                    kwargs["fontstyle"] = style
-        self.ax.text(self.x, self.y, str(text), **kwargs)
+        self.screen.add_text(self.x, self.y, text, align=align, font=font)
 
     # --- Autres méthodes ---
     def speed(self, _):
@@ -228,16 +573,54 @@ class _Turtle:
         pass
 
 
+_BEZIER_K = 0.5522847498  # approximation d'un quart de cercle par une cubique
+
+def _rounded_rect_path(x0, y0, x1, y1, r):
+    """Path Matplotlib fermé d'un rectangle à coins arrondis (r borné à la demi‑taille)."""
+    from matplotlib.path import Path
+    if x0 > x1: x0, x1 = x1, x0
+    if y0 > y1: y0, y1 = y1, y0
+    r = max(0.0, min(float(r), (x1 - x0) / 2.0, (y1 - y0) / 2.0))
+    if r <= 0:
+        verts = [(x0, y0), (x1, y0), (x1, y1), (x0, y1), (x0, y0)]
+        codes = [Path.MOVETO] + [Path.LINETO] * 3 + [Path.CLOSEPOLY]
+        return Path(verts, codes)
+    k = r * _BEZIER_K
+    verts = [
+        (x0 + r, y0), (x1 - r, y0),
+        (x1 - r + k, y0), (x1, y0 + r - k), (x1, y0 + r),
+        (x1, y1 - r),
+        (x1, y1 - r + k), (x1 - r + k, y1), (x1 - r, y1),
+        (x0 + r, y1),
+        (x0 + r - k, y1), (x0, y1 - r + k), (x0, y1 - r),
+        (x0, y0 + r),
+        (x0, y0 + r - k), (x0 + r - k, y0), (x0 + r, y0),
+        (x0 + r, y0),
+    ]
+    C = Path.CURVE4
+    codes = ([Path.MOVETO, Path.LINETO, C, C, C, Path.LINETO, C, C, C,
+              Path.LINETO, C, C, C, Path.LINETO, C, C, C, Path.CLOSEPOLY])
+    return Path(verts, codes)
+
+
 def _done():
-    """Équivalent de turtle.done() : affiche la figure Matplotlib."""
-    global _current_screen
-    if _current_screen is not None:
-        _current_screen.ax.set_aspect("equal", adjustable="box")
-        plt.show()
-    _current_screen = None
+    """
+    Équivalent de turtle.done() : finalise la scène puis affiche la figure Matplotlib.
+    En mode headless (render_schema), l'écran est seulement mis de côté pour l'export.
+    """
+    ctx = _ctx()
+    screen = ctx.screen
+    if screen is not None:
+        screen.finish()
+        if ctx.headless:
+            ctx.finished = screen
+        else:
+            import matplotlib.pyplot as plt
+            plt.show()
+    ctx.screen = None
 
 
-turtle = types.SimpleNamespace(Screen=_Screen, Turtle=_Turtle, done=_done)
+turtle = types.SimpleNamespace(Screen=_new_screen, Turtle=_Turtle, done=_done)
 
 # =========================
 # Réglages / constantes
@@ -253,12 +636,15 @@ LINE_WIDTH         = 2
 # - dossiers = gris (un ton plus clair)
 # - assises/banquettes = gris très clair (presque blanc)
 # - coussins = taupe
-# NB : Ces valeurs seront éventuellement écrasées à chaque render_* via _resolve_and_apply_colors()
+# NB : Valeurs par défaut seulement : la palette d'un rendu vit dans son contexte
+#      (_resolve_and_apply_colors() → _pal()), ces constantes ne sont jamais modifiées.
 COLOR_ASSISE       = "#f6f6f6"  # gris très clair / presque blanc
 COLOR_ACC          = "#8f8f8f"  # gris
 COLOR_DOSSIER      = "#b8b8b8"  # gris plus clair que accoudoirs
 COLOR_CUSHION      = "#8B7E74"  # taupe
 COLOR_CONTOUR      = "black"
+_DEFAULT_COLORS = {"assise": COLOR_ASSISE, "accoudoirs": COLOR_ACC,
+                   "dossiers": COLOR_DOSSIER, "coussins": COLOR_CUSHION}
 
 # (Conservés mais non utilisés car quadrillage/repères supprimés)
 GRID_MINOR_STEP    = 10
@@ -487,14 +873,12 @@ def _parse_couleurs_argument(couleurs):
             res[kn] = v
     return res
 
-def _resolve_and_apply_colors(couleurs):
+def _resolve_palette(couleurs):
     """
-    Résout la palette utilisateur puis applique aux variables globales:
-      COLOR_ASSISE, COLOR_ACC, COLOR_DOSSIER, COLOR_CUSHION
-    Retourne une liste d'items pour la légende: [(libellé, hex, nom)]
+    Résout la palette utilisateur, sans effet de bord.
+    Retourne {"accoudoirs"|"dossiers"|"assise"|"coussins": (hex, nom ou None)}.
     Règle : si dossiers non spécifié mais accoudoirs oui => dossiers = accoudoirs éclaircis.
     """
-    global COLOR_ASSISE, COLOR_ACC, COLOR_DOSSIER, COLOR_CUSHION
 
     # base par défaut (demande client)
     default = {
@@ -520,21 +904,52 @@ def _resolve_and_apply_colors(couleurs):
     # coussins
     cush_hex, cush_name = _parse_color_value(spec["coussins"])
 
-    # applique globals
-    COLOR_ACC     = acc_hex
-    COLOR_DOSSIER = dos_hex
-    COLOR_ASSISE  = ass_hex
-    COLOR_CUSHION = cush_hex
+    return {
+        "accoudoirs": (acc_hex, acc_name),
+        "dossiers":   (dos_hex, dos_name),
+        "assise":     (ass_hex, ass_name),
+        "coussins":   (cush_hex, cush_name),
+    }
+
+# Marqueurs de couleur utilisés pendant l'enregistrement d'une Scene (remplacés au rejeu)
+_PALETTE_PLACEHOLDERS = {
+    "accoudoirs": ("@accoudoirs", "@accoudoirs"),
+    "dossiers":   ("@dossiers",   "@dossiers"),
+    "assise":     ("@assise",     "@assise"),
+    "coussins":   ("@coussins",   "@coussins"),
+}
+
+def _resolve_and_apply_colors(couleurs):
+    """
+    Résout la palette utilisateur puis l'applique au contexte de rendu du thread courant
+    (lue ensuite par _pal() dans les outils de dessin ; les COLOR_* restent les défauts).
+    Retourne une liste d'items pour la légende: [(libellé, hex, nom)]
+    En mode enregistrement (layout_*), applique des marqueurs : la Scene reste indépendante
+    de la palette, qui n'est résolue qu'au dessin (Scene.draw).
+    """
+    ctx = _ctx()
+    if ctx.backend == "scene":
+        pal = _PALETTE_PLACEHOLDERS
+    else:
+        pal = _resolve_palette(couleurs)
+    ctx.palette = pal
 
     # Items de légende (texte + nom de couleur si dispo)
     items = [
-        ("Dossier",   COLOR_DOSSIER, dos_name),
-        ("Accoudoir", COLOR_ACC,     acc_name),
-        ("Coussins",  COLOR_CUSHION, cush_name),
-        ("Assise",    COLOR_ASSISE,  ass_name),
+        ("Dossier",   pal["dossiers"][0],   pal["dossiers"][1]),
+        ("Accoudoir", pal["accoudoirs"][0], pal["accoudoirs"][1]),
+        ("Coussins",  pal["coussins"][0],   pal["coussins"][1]),
+        ("Assise",    pal["assise"][0],     pal["assise"][1]),
     ]
     return items
 
+def _pal(key):
+    """Couleur `key` ("accoudoirs", "dossiers", "assise", "coussins") du rendu en cours."""
+    pal = _ctx().palette
+    if pal is None:
+        return _DEFAULT_COLORS[key]
+    return pal[key][0]
+
 # =========================
 # Transform cm → px (isométrique & centré)
 # =========================
@@ -573,30 +988,17 @@ def draw_rounded_rect_cm(t, tr, x0, y0, x1, y1, r_cm=CUSHION_ROUND_R_CM,
     if x0 > x1: x0, x1 = x1, x0
     if y0 > y1: y0, y1 = y1, y0
     rx = max(0.0, min(r_cm, (x1-x0)/2.0, (y1-y0)/2.0))
-    wpx = (x1 - x0) * tr.scale
-    hpx = (y1 - y0) * tr.scale
-    rpx = rx * tr.scale
-    sx, sy = tr.pt(x0 + rx, y0)
-
-    t.pensize(width)
-    t.pencolor(outline)
-    pen_up_to(t, sx, sy)
-    if fill:
-        t.fillcolor(fill)
-        t.begin_fill()
-    t.setheading(0)
-    t.down()
-    for _ in range(2):
-        t.forward(max(0.0, wpx - 2*rpx)); t.circle(rpx, 90)
-        t.forward(max(0.0, hpx - 2*rpx)); t.circle(rpx, 90)
-    t.up()
-    if fill:
-        t.end_fill()
+    px0, py0 = tr.pt(x0, y0)
+    px1, py1 = tr.pt(x1, y1)
+    t.rounded_rect(px0, py0, px1, py1, rx * tr.scale,
+                   fill=fill, outline=outline, width=width)
 
 def draw_polygon_cm(t, tr, pts, fill=None, outline=COLOR_CONTOUR, width=LINE_WIDTH):
     if not pts: return
+    if fill == _pal("coussins"):
+        _scene_note("cushions", pts)
     # Arrondi auto pour coussins rectangulaires axis‑alignés
-    if fill == COLOR_CUSHION and _is_axis_aligned_rect(pts):
+    if fill == _pal("coussins") and _is_axis_aligned_rect(pts):
         xs = [x for x, _ in pts[:-1]] if pts[0] == pts[-1] else [x for x, _ in pts]
         ys = [y for _, y in pts[:-1]] if pts[0] == pts[-1] else [y for _, y in pts]
         x0, x1 = min(xs), max(xs); y0, y1 = min(ys), max(ys)
@@ -642,9 +1044,11 @@ def draw_double_arrow_px(t, p1, p2, text=None, text_perp_offset_px=0, text_tang_
         pen_up_to(t, tx, ty); t.write(text, align="center", font=FONT_DIM)
 
 def draw_double_arrow_vertical_cm(t, tr, x_cm, y0_cm, y1_cm, label):
+    _scene_note("arrows", (x_cm, y0_cm, x_cm, y1_cm, label))
     draw_double_arrow_px(t, tr.pt(x_cm, y0_cm), tr.pt(x_cm, y1_cm), text=label, text_perp_offset_px=+12)
 
 def draw_double_arrow_horizontal_cm(t, tr, y_cm, x0_cm, x1_cm, label):
+    _scene_note("arrows", (x0_cm, y_cm, x1_cm, y_cm, label))
     draw_double_arrow_px(t, tr.pt(x0_cm, y_cm), tr.pt(x1_cm, y_cm), text=label,
                          text_perp_offset_px=-12, text_tang_shift_px=20)
 
@@ -653,10 +1057,12 @@ def centroid(poly):
 
 def label_poly(t, tr, poly, text, font=FONT_LABEL):
     cx, cy = centroid(poly); pen_up_to(t, *tr.pt(cx, cy))
+    _scene_note("labels", (cx, cy, str(text)))
     t.write(text, align="center", font=font)
 
 def label_poly_offset_cm(t, tr, poly, text, dx_cm=0.0, dy_cm=0.0, font=FONT_LABEL):
     cx, cy = centroid(poly); x, y = tr.pt(cx + dx_cm, cy + dy_cm)
+    _scene_note("labels", (cx + dx_cm, cy + dy_cm, str(text)))
     pen_up_to(t, x, y); t.write(text, align="center", font=font)
 
 def banquette_dims(poly):
@@ -733,16 +1139,7 @@ def _assert_banquettes_max_250(polys):
 # =====================================================================
 
 def _draw_rect_px(t, x, y, w, h, fill=None, outline=COLOR_CONTOUR, width=1):
-    t.pensize(width); t.pencolor(outline)
-    pen_up_to(t, x, y)
-    if fill:
-        t.fillcolor(fill); t.begin_fill()
-    t.setheading(0); t.down()
-    for _ in range(2):
-        t.forward(w); t.left(90); t.forward(h); t.left(90)
-    t.up()
-    if fill:
-        t.end_fill()
+    t.rounded_rect(x, y, x + w, y + h, 0.0, fill=fill, outline=outline, width=width)
 
 def _wrap_text(text, max_len=28):
     words = str(text).split()
@@ -778,10 +1175,10 @@ def draw_legend(t, tr, tx_cm, ty_cm, items=None, pos="top-right"):
     # Items / couleurs
     if not items:
         items = [
-            ("Dossier",   COLOR_DOSSIER, None),
-            ("Accoudoir", COLOR_ACC,     None),
-            ("Coussins",  COLOR_CUSHION, None),
-            ("Assise",    COLOR_ASSISE,  None),
+            ("Dossier",   _pal("dossiers"),   None),
+            ("Accoudoir", _pal("accoudoirs"), None),
+            ("Coussins",  _pal("coussins"),   None),
+            ("Assise",    _pal("assise"),     None),
         ]
     # Taille & position + placement "safe" (jamais sur le schéma)
     box = LEGEND_BOX_PX
@@ -952,8 +1349,68 @@ def _waste_and_count_1d(length, size):
     waste = length - n*size
     return n, waste
 
+# ----- Tables précalculées de remplissage 1D -----
+# Pour les longueurs entières 0..CUSHION_TABLE_MAX_LEN et les tailles de la plage valise :
+# nombre / chute, meilleure taille de chaque fenêtre de 6 tailles, chute minimale, choix "auto".
+# Construites une fois, à la première demande. False = calcul direct, utile pour comparer.
+CUSHION_TABLES        = True
+CUSHION_TABLE_MAX_LEN = 600
+CUSHION_TABLE_SIZES   = (60, 100)
+CUSHION_AUTO_SIZES    = (65, 80, 90)
+_cushion_tables_cache = None
+
+def _cushion_tables():
+    """
+    Tables (array 'B', à plat) indexées par longueur entière :
+      - count / waste   : [longueur * nb_tailles + (taille - 60)]
+      - best_cover / best_count : [longueur * nb_fenêtres + (début - 60)] → meilleure taille de
+        [début, début+5] selon (chute, -couverture, -taille) ou (chute, -nombre, -taille)
+      - min_waste       : [longueur] → chute minimale sur toute la plage (borne des optimiseurs)
+      - auto_simple     : [longueur] → taille de CUSHION_AUTO_SIZES de chute minimale (puis la plus grande)
+    """
+    global _cushion_tables_cache
+    tables = _cushion_tables_cache
+    if tables is not None:
+        return tables
+
+    import numpy as np
+    from array import array
+    from numpy.lib.stride_tricks import sliding_window_view
+
+    lo, hi = CUSHION_TABLE_SIZES
+    L = np.arange(CUSHION_TABLE_MAX_LEN + 1)[:, None]
+    S = np.arange(lo, hi + 1)[None, :]
+    N = L // S
+    W = L - N*S
+    # clés entières équivalentes aux tuples de départage (plus petite = meilleure)
+    key_cover = (W * (CUSHION_TABLE_MAX_LEN + 1) + (CUSHION_TABLE_MAX_LEN - N*S)) * 128 + (127 - S)
+    key_count = (W * 64 + (63 - N)) * 128 + (127 - S)
+    win = VALISE_MAX_DELTA + 1
+    first = np.arange(S.shape[1] - win + 1)[None, :] + lo
+    best_cover = first + sliding_window_view(key_cover, win, axis=1).argmin(axis=-1)
+    best_count = first + sliding_window_view(key_count, win, axis=1).argmin(axis=-1)
+    A = np.array(CUSHION_AUTO_SIZES)[None, :]
+    auto_simple = A[0, ((L % A) * 128 + (127 - A)).argmin(axis=1)]
+
+    def _pack(values):
+        return array("B", np.ascontiguousarray(values, dtype=np.uint8).tobytes())
+
+    tables = {
+        "n_sizes": S.shape[1], "n_windows": best_cover.shape[1],
+        "count": _pack(N), "waste": _pack(W),
+        "best_cover": _pack(best_cover), "best_count": _pack(best_count),
+        "min_waste": _pack(W.min(axis=1)), "auto_simple": _pack(auto_simple),
+    }
+    _cushion_tables_cache = tables
+    return tables
+
+def _tabulated(length):
+    """True si `length` (cm) est couverte par les tables précalculées."""
+    return CUSHION_TABLES and type(length) is int and 0 <= length <= CUSHION_TABLE_MAX_LEN
+
 # ----- Traversins : dessin -----
 def _draw_traversin_block(t, tr, x0, y0, x1, y1):
+    _scene_note("traversins", (min(x0, x1), min(y0, y1), max(x0, x1), max(y0, y1)))
     draw_rounded_rect_cm(t, tr, x0, y0, x1, y1,
                          r_cm=CUSHION_ROUND_R_CM,
                          fill=COLOR_TRAVERSIN, outline=COLOR_CONTOUR, width=1)
@@ -1103,6 +1560,88 @@ def _draw_traversins_U_side_F02(t, tr, pts, profondeur, traversins):
 # ================  COUSSINS — moteur "valise" (utilitaires)  =========
 # =====================================================================
 
+# Décalages (shiftL, shiftR) des U / U1F / U2f, par ordre de préférence à égalité de score
+# (le premier l'emporte), repris des anciennes boucles : U2f retenait le premier couple trouvé ;
+# U et U1F sortaient seulement de la boucle sur shiftR, donc gardaient le dernier shiftL
+# (True avant False) avec son premier shiftR
+_VALISE_SHIFTS = ((False, False), (False, True), (True, False), (True, True))
+_VALISE_SHIFTS_U = ((True, False), (True, True), (False, False), (False, True))
+VALISE_MAX_DELTA = 5   # écart max entre tailles de coussins des différentes branches
+
+def _valise_search(lengths, rng, same, by="cover"):
+    """
+    Moteur commun des optimiseurs valise (simple, L, U, U1F, U2f).
+      - lengths : pour chaque décalage candidat (ordre de préférence à égalité), tuple des
+                  longueurs utiles de chaque branche — dans l'ordre de départage des tailles
+      - rng     : (min, max) des tailles ; same : une seule taille pour toutes les branches
+      - by      : second critère, "cover" (cm couverts) ou "count" (nombre de coussins)
+    Minimise (chute, -couverture|-nombre, -s_1, …, -s_m) sous max(s) - min(s) ≤ 5.
+    Toutes les tailles admissibles tiennent dans une fenêtre [lo, lo+5] : dans une fenêtre,
+    le critère est une somme de termes indépendants, donc chaque branche y prend seule sa
+    meilleure taille. On ne parcourt ainsi que (décalages × fenêtres × branches × 6) cas,
+    et un décalage dont la chute minimale possible dépasse déjà la meilleure est élagué.
+    Meilleures tailles par fenêtre et chutes minimales viennent des tables précalculées
+    (_cushion_tables, _valise_window_keys) pour les longueurs entières ; calcul direct sinon.
+    Retourne ((s_1, …, s_m), indice du décalage) ou None.
+    """
+    r0, r1 = rng
+    if r1 < r0 or not lengths:
+        return None
+    width = 0 if same else VALISE_MAX_DELTA
+    columns = {}
+    for lens in lengths:
+        for length in lens:
+            if length not in columns:
+                columns[length] = _valise_window_keys(length, r0, r1, width, by)
+
+    # borne inférieure : chaque branche à sa chute minimale (tables), valable si la plage
+    # est incluse dans celle des tables ; sinon pas d'élagage
+    bounded = CUSHION_TABLE_SIZES[0] <= r0 and r1 <= CUSHION_TABLE_SIZES[1]
+    best = None
+    for k, lens in enumerate(lengths):
+        if bounded and best is not None and sum(_min_waste(length) for length in lens) > best[0][0]:
+            continue
+        for picks in zip(*[columns[length] for length in lens]):
+            key = (sum(p[0] for p in picks), sum(p[1] for p in picks)) + tuple(p[2] for p in picks)
+            if best is None or key < best[0]:
+                best = (key, k)
+    key, k = best
+    return tuple(-v for v in key[2:]), k
+
+_window_keys_cache = {}
+
+def _valise_window_keys(length, r0, r1, width, by):
+    """
+    Pour une branche de longueur `length` : meilleure (chute, -couverture|-nombre, -taille)
+    de chaque fenêtre [lo, lo+width] de la plage [r0, r1] (fenêtre tronquée si la plage est
+    plus courte). Fenêtres pleines de la plage des tables : lues dans _cushion_tables et
+    mémorisées par longueur ; calcul direct sinon.
+    """
+    lo_tab, hi_tab = CUSHION_TABLE_SIZES
+    if lo_tab <= r0 and r0 + width <= r1 <= hi_tab and _tabulated(length):
+        full = _window_keys_cache.get((length, width, by))
+        if full is None:
+            tables = _cushion_tables()
+            if width == 0:
+                sizes = range(lo_tab, hi_tab + 1)
+            else:
+                row = length * tables["n_windows"]
+                sizes = tables["best_" + by][row:row + tables["n_windows"]]
+            full = _window_keys_cache[(length, width, by)] = [_valise_key(length, size, by) for size in sizes]
+        return full[r0 - lo_tab:r1 - width - lo_tab + 1]
+
+    keys = [_valise_key(length, size, by) for size in range(r0, r1 + 1)]
+    last = max(0, r1 - r0 - width)
+    return [min(keys[i:i + width + 1]) for i in range(last + 1)]
+
+def _valise_key(length, size, by):
+    n, waste = _waste_and_count_1d(length, size)
+    return (waste, -(n*size if by == "cover" else n), -size)
+
+def _min_waste(length):
+    """Chute minimale d'une branche sur toute la plage des tables (borne inférieure), 0 hors tables."""
+    return _cushion_tables()["min_waste"][length] if _tabulated(length) else 0
+
 def _apply_traversin_limits_L_like(pts, x_end_key, y_end_key, traversins):
     x_end = _lim_x(pts, x_end_key); y_end = _lim_y(pts, y_end_key)
     if traversins:
@@ -1110,6 +1649,14 @@ def _apply_traversin_limits_L_like(pts, x_end_key, y_end_key, traversins):
         if "g" in traversins: y_end -= TRAVERSIN_THK
     return x_end, y_end
 
+def _lengths_L_like(pts, shift_bas, x_end_key="Bx", y_end_key="By", traversins=None):
+    """Longueurs utiles (bas, gauche) des deux branches de coussins d'un L."""
+    F0x, F0y = pts["F0"]
+    x_end, y_end = _apply_traversin_limits_L_like(pts, x_end_key, y_end_key, traversins)
+    xs = F0x + (CUSHION_DEPTH if shift_bas else 0)
+    y0 = F0y + (0 if shift_bas else CUSHION_DEPTH)
+    return max(0, x_end - xs), max(0, y_end - y0)
+
 def _eval_L_like_counts(pts, size_bas, size_g, shift_bas, x_end_key="Bx", y_end_key="By", traversins=None):
     F0x, F0y = pts["F0"]
     x_end, y_end = _apply_traversin_limits_L_like(pts, x_end_key, y_end_key, traversins)
@@ -1119,8 +1666,7 @@ def _eval_L_like_counts(pts, size_bas, size_g, shift_bas, x_end_key="Bx", y_end_
     y0 = F0y + (0 if shift_bas else CUSHION_DEPTH)
     ye = y_end
 
-    len_b = max(0, xe - xs)
-    len_g = max(0, ye - y0)
+    len_b, len_g = _lengths_L_like(pts, shift_bas, x_end_key, y_end_key, traversins)
 
     nb_b, wb = _waste_and_count_1d(len_b, size_bas)
     nb_g, wg = _waste_and_count_1d(len_g, size_g)
@@ -1134,21 +1680,16 @@ def _eval_L_like_counts(pts, size_bas, size_g, shift_bas, x_end_key="Bx", y_end_
     }
 
 def _optimize_valise_L_like(pts, rng, same, x_end_key="Bx", y_end_key="By", traversins=None):
-    best = None
-    r0, r1 = rng
-    for size_g in range(r0, r1+1):
-        cand_b = [size_g] if same else range(r0, r1+1)
-        for size_b in cand_b:
-            if abs(size_b - size_g) > 5:
-                continue
-            eval_A = _eval_L_like_counts(pts, size_b, size_g, shift_bas=False, x_end_key=x_end_key, y_end_key=y_end_key, traversins=traversins)
-            eval_B = _eval_L_like_counts(pts, size_b, size_g, shift_bas=True,  x_end_key=x_end_key, y_end_key=y_end_key, traversins=traversins)
-            e = min([eval_A, eval_B], key=lambda E: (E["waste"], -E["cover"], -size_b, -size_g))
-            score = (e["waste"], -e["cover"], -size_b, -size_g)
-            if (best is None) or (score < best["score"]):
-                best = {"score": score, "sizes": {"bas": size_b, "gauche": size_g}, "eval": e,
-                        "shift_bas": (e is eval_B)}
-    return best
+    lengths = [_lengths_L_like(pts, shift, x_end_key, y_end_key, traversins) for shift in (False, True)]
+    found = _valise_search(lengths, rng, same)
+    if found is None:
+        return None
+    (size_b, size_g), k = found
+    e = _eval_L_like_counts(pts, size_b, size_g, shift_bas=bool(k), x_end_key=x_end_key,
+                            y_end_key=y_end_key, traversins=traversins)
+    return {"score": (e["waste"], -e["cover"], -size_b, -size_g),
+            "sizes": {"bas": size_b, "gauche": size_g}, "eval": e,
+            "counts": e["counts"], "shift_bas": bool(k)}
 
 def _draw_L_like_with_sizes(t, tr, pts, sizes, shift_bas, x_end_key="Bx", y_end_key="By", traversins=None):
     F0x, F0y = pts["F0"]
@@ -1161,7 +1702,7 @@ def _draw_L_like_with_sizes(t, tr, pts, sizes, shift_bas, x_end_key="Bx", y_end_
     sb = sizes["bas"]
     while x + sb <= xe + 1e-6:
         poly = [(x,yb), (x+sb,yb), (x+sb,yb+CUSHION_DEPTH), (x,yb+CUSHION_DEPTH), (x,yb)]
-        draw_polygon_cm(t, tr, poly, fill=COLOR_CUSHION, outline=COLOR_CONTOUR, width=1)
+        draw_polygon_cm(t, tr, poly, fill=_pal("coussins"), outline=COLOR_CONTOUR, width=1)
         label_poly(t, tr, poly, f"{sb}", font=FONT_CUSHION)
         x += sb; nb += 1
 
@@ -1172,14 +1713,15 @@ def _draw_L_like_with_sizes(t, tr, pts, sizes, shift_bas, x_end_key="Bx", y_end_
     sg = sizes["gauche"]
     while y + sg <= yg1 + 1e-6:
         poly = [(xg,y), (xg+CUSHION_DEPTH,y), (xg+CUSHION_DEPTH,y+sg), (xg,y+sg), (xg,y)]
-        draw_polygon_cm(t, tr, poly, fill=COLOR_CUSHION, outline=COLOR_CONTOUR, width=1)
+        draw_polygon_cm(t, tr, poly, fill=_pal("coussins"), outline=COLOR_CONTOUR, width=1)
         label_poly(t, tr, poly, f"{sg}", font=FONT_CUSHION)
         y += sg; ng += 1
 
     return nb + ng, sb, sg
 
 # ----- U2f : évaluation / dessin -----
-def _eval_U2f_counts(pts, sb, sg, sd, shiftL, shiftR, traversins=None):
+def _lengths_U2f(pts, shiftL, shiftR, traversins=None):
+    """Longueurs utiles (bas, gauche, droite) des trois branches de coussins du U2f."""
     F0x, F0y = pts["F0"]
     F02x = pts["F02"][0]
     y_end_L = pts.get("By_", pts["By"])[1]
@@ -1192,10 +1734,17 @@ def _eval_U2f_counts(pts, sb, sg, sd, shiftL, shiftR, traversins=None):
     xe = F02x - (CUSHION_DEPTH if shiftR else 0)
     yL0 = F0y + (0 if shiftL else CUSHION_DEPTH)
     yR0 = F0y + (0 if shiftR else CUSHION_DEPTH)
+    return max(0, xe - xs), max(0, y_end_L - yL0), max(0, y_end_R - yR0)
 
-    len_b = max(0, xe - xs)
-    len_g = max(0, y_end_L - yL0)
-    len_d = max(0, y_end_R - yR0)
+def _eval_U2f_counts(pts, sb, sg, sd, shiftL, shiftR, traversins=None):
+    F0x, F0y = pts["F0"]
+    F02x = pts["F02"][0]
+    xs = F0x + (CUSHION_DEPTH if shiftL else 0)
+    xe = F02x - (CUSHION_DEPTH if shiftR else 0)
+    yL0 = F0y + (0 if shiftL else CUSHION_DEPTH)
+    yR0 = F0y + (0 if shiftR else CUSHION_DEPTH)
+
+    len_b, len_g, len_d = _lengths_U2f(pts, shiftL, shiftR, traversins)
 
     nb, wb = _waste_and_count_1d(len_b, sb)
     ng, wg = _waste_and_count_1d(len_g, sg)
@@ -1207,31 +1756,16 @@ def _eval_U2f_counts(pts, sb, sg, sd, shiftL, shiftR, traversins=None):
             "geom": {"xs": xs, "xe": xe, "yL0": yL0, "yR0": yR0}}
 
 def _optimize_valise_U2f(pts, rng, same, traversins=None):
-    best=None; r0,r1=rng
-    for sg in range(r0, r1+1):
-        cand_b = [sg] if same else range(r0, r1+1)
-        for sb in cand_b:
-            cand_d = [sg] if same else range(r0, r1+1)
-            for sd in cand_d:
-                if max(sb, sg, sd) - min(sb, sg, sd) > 5:
-                    continue
-                E = []
-                for sl in (False, True):
-                    for sr in (False, True):
-                        E.append(_eval_U2f_counts(pts, sb, sg, sd, sl, sr, traversins=traversins))
-                e = min(E, key=lambda x: (x["waste"], -x["cover"], -sb, -sg, -sd))
-                score = (e["waste"], -e["cover"], -sb, -sg, -sd)
-                if (best is None) or (score < best["score"]):
-                    best = {"score": score, "sizes": {"bas": sb, "gauche": sg, "droite": sd}, "eval": e}
-    if best:
-        chosen = best["eval"]
-        for sl in (False, True):
-            for sr in (False, True):
-                chk = _eval_U2f_counts(pts, best["sizes"]["bas"], best["sizes"]["gauche"], best["sizes"]["droite"], sl, sr, traversins=traversins)
-                if abs(chk["waste"] - chosen["waste"])<1e-9 and chk["cover"]==chosen["cover"]:
-                    best["shiftL"], best["shiftR"] = sl, sr
-                    return best
-    return best
+    lengths = [_lengths_U2f(pts, sl, sr, traversins) for sl, sr in _VALISE_SHIFTS]
+    found = _valise_search(lengths, rng, same)
+    if found is None:
+        return None
+    (sb, sg, sd), k = found
+    sl, sr = _VALISE_SHIFTS[k]
+    e = _eval_U2f_counts(pts, sb, sg, sd, sl, sr, traversins=traversins)
+    return {"score": (e["waste"], -e["cover"], -sb, -sg, -sd),
+            "sizes": {"bas": sb, "gauche": sg, "droite": sd}, "eval": e,
+            "counts": e["counts"], "shiftL": sl, "shiftR": sr}
 
 def _draw_U2f_with_sizes(t, tr, pts, sizes, shiftL, shiftR, traversins=None):
     F0x, F0y = pts["F0"]
@@ -1248,7 +1782,7 @@ def _draw_U2f_with_sizes(t, tr, pts, sizes, shiftL, shiftR, traversins=None):
     yb = F0y; sb = sizes["bas"]; nb=0; x=xs
     while x + sb <= xe + 1e-6:
         poly=[(x,yb),(x+sb,yb),(x+sb,yb+CUSHION_DEPTH),(x,yb+CUSHION_DEPTH),(x,yb)]
-        draw_polygon_cm(t,tr,poly,fill=COLOR_CUSHION,outline=COLOR_CONTOUR,width=1)
+        draw_polygon_cm(t,tr,poly,fill=_pal("coussins"),outline=COLOR_CONTOUR,width=1)
         label_poly(t,tr,poly,f"{sb}",font=FONT_CUSHION)
         x+=sb; nb+=1
 
@@ -1257,7 +1791,7 @@ def _draw_U2f_with_sizes(t, tr, pts, sizes, shiftL, shiftR, traversins=None):
     xg = F0x; sg = sizes["gauche"]; ng=0; y=yL0
     while y + sg <= y_end_L + 1e-6:
         poly=[(xg,y),(xg+CUSHION_DEPTH,y),(xg+CUSHION_DEPTH,y+sg),(xg,y+sg),(xg,y)]
-        draw_polygon_cm(t,tr,poly,fill=COLOR_CUSHION,outline=COLOR_CONTOUR,width=1)
+        draw_polygon_cm(t,tr,poly,fill=_pal("coussins"),outline=COLOR_CONTOUR,width=1)
         label_poly(t,tr,poly,f"{sg}",font=FONT_CUSHION)
         y+=sg; ng+=1
 
@@ -1266,7 +1800,7 @@ def _draw_U2f_with_sizes(t, tr, pts, sizes, shiftL, shiftR, traversins=None):
     xr = F02x; sd = sizes["droite"]; nd=0; y=yR0
     while y + sd <= y_end_R + 1e-6:
         poly=[(xr-CUSHION_DEPTH,y),(xr,y),(xr,y+sd),(xr-CUSHION_DEPTH,y+sd),(xr-CUSHION_DEPTH,y)]
-        draw_polygon_cm(t,tr,poly,fill=COLOR_CUSHION,outline=COLOR_CONTOUR,width=1)
+        draw_polygon_cm(t,tr,poly,fill=_pal("coussins"),outline=COLOR_CONTOUR,width=1)
         label_poly(t,tr,poly,f"{sd}",font=FONT_CUSHION)
         y+=sd; nd+=1
 
@@ -1306,27 +1840,28 @@ def _draw_cushions_U2f_optimized(t, tr, pts, size, traversins=None):
     y, x = F0y, xs
     while x + size <= xe + 1e-6:
         poly = [(x,y),(x+size,y),(x+size,y+CUSHION_DEPTH),(x,y+CUSHION_DEPTH),(x,y)]
-        draw_polygon_cm(t,tr,poly,fill=COLOR_CUSHION,outline=COLOR_CONTOUR,width=1)
+        draw_polygon_cm(t,tr,poly,fill=_pal("coussins"),outline=COLOR_CONTOUR,width=1)
         label_poly(t,tr,poly,f"{size}",font=FONT_CUSHION)
         x += size; count += 1
     # Gauche
     x, y = F0x, yL0
     while y + size <= y_end_L + 1e-6:
         poly = [(x,y),(x+CUSHION_DEPTH,y),(x+CUSHION_DEPTH,y+size),(x,y+size),(x,y)]
-        draw_polygon_cm(t,tr,poly,fill=COLOR_CUSHION,outline=COLOR_CONTOUR,width=1)
+        draw_polygon_cm(t,tr,poly,fill=_pal("coussins"),outline=COLOR_CONTOUR,width=1)
         label_poly(t,tr,poly,f"{size}",font=FONT_CUSHION)
         y += size; count += 1
     # Droite
     x, y = F02x, yR0
     while y + size <= y_end_R + 1e-6:
         poly = [(x-CUSHION_DEPTH,y),(x,y),(x,y+size),(x-CUSHION_DEPTH,y+size),(x-CUSHION_DEPTH,y)]
-        draw_polygon_cm(t,tr,poly,fill=COLOR_CUSHION,outline=COLOR_CONTOUR,width=1)
+        draw_polygon_cm(t,tr,poly,fill=_pal("coussins"),outline=COLOR_CONTOUR,width=1)
         label_poly(t,tr,poly,f"{size}",font=FONT_CUSHION)
         y += size; count += 1
     return count
 
 # ----- U1F : évaluation / dessin -----
-def _eval_U1F_counts(pts, sb, sg, sd, shiftL, shiftR, traversins=None):
+def _lengths_U1F(pts, shiftL, shiftR, traversins=None):
+    """Longueurs utiles (bas, gauche, droite) des trois branches de coussins du U1F."""
     F0x, F0y = pts["F0"]; F02x = pts["F02"][0]
     y_end_L = pts["By_cush"][1]; y_end_R = pts["By4_cush"][1]
     if traversins:
@@ -1336,7 +1871,10 @@ def _eval_U1F_counts(pts, sb, sg, sd, shiftL, shiftR, traversins=None):
     xe = F02x - (CUSHION_DEPTH if shiftR else 0)
     yL0 = F0y + (0 if shiftL else CUSHION_DEPTH)
     yR0 = F0y + (0 if shiftR else CUSHION_DEPTH)
-    len_b = max(0, xe-xs); len_g=max(0, y_end_L-yL0); len_d=max(0, y_end_R-yR0)
+    return max(0, xe-xs), max(0, y_end_L-yL0), max(0, y_end_R-yR0)
+
+def _eval_U1F_counts(pts, sb, sg, sd, shiftL, shiftR, traversins=None):
+    len_b, len_g, len_d = _lengths_U1F(pts, shiftL, shiftR, traversins)
     nb, wb = _waste_and_count_1d(len_b, sb)
     ng, wg = _waste_and_count_1d(len_g, sg)
     nd, wd = _waste_and_count_1d(len_d, sd)
@@ -1344,30 +1882,16 @@ def _eval_U1F_counts(pts, sb, sg, sd, shiftL, shiftR, traversins=None):
     return {"counts":{"bas":nb,"gauche":ng,"droite":nd},"waste":waste,"cover":cover}
 
 def _optimize_valise_U1F(pts, rng, same, traversins=None):
-    best=None; r0,r1=rng
-    for sg in range(r0,r1+1):
-        for sb in ([sg] if same else range(r0,r1+1)):
-            for sd in ([sg] if same else range(r0,r1+1)):
-                if max(sb,sg,sd)-min(sb,sg,sd) > 5:
-                    continue
-                E=[]
-                for sl in (False,True):
-                    for sr in (False,True):
-                        E.append(_eval_U1F_counts(pts,sb,sg,sd,sl,sr,traversins=traversins))
-                e = min(E, key=lambda x: (x["waste"], -x["cover"], -sb, -sg, -sd))
-                score=(e["waste"], -e["cover"], -sb, -sg, -sd)
-                if (best is None) or (score < best["score"]):
-                    best={"score":score, "sizes":{"bas":sb,"gauche":sg,"droite":sd}, "shifts":("?", "?")}
-    # Retrouver shifts exacts
-    if best:
-        tgt = best["score"]
-        for sl in (False,True):
-            for sr in (False,True):
-                chk=_eval_U1F_counts(pts,best["sizes"]["bas"],best["sizes"]["gauche"],best["sizes"]["droite"],sl,sr,traversins=traversins)
-                score=(chk["waste"], -chk["cover"], -best["sizes"]["bas"], -best["sizes"]["gauche"], -best["sizes"]["droite"])
-                if score==tgt:
-                    best["shifts"]=(sl,sr); break
-    return best
+    lengths = [_lengths_U1F(pts, sl, sr, traversins) for sl, sr in _VALISE_SHIFTS_U]
+    found = _valise_search(lengths, rng, same)
+    if found is None:
+        return None
+    (sb, sg, sd), k = found
+    shifts = _VALISE_SHIFTS_U[k]
+    e = _eval_U1F_counts(pts, sb, sg, sd, *shifts, traversins=traversins)
+    return {"score": (e["waste"], -e["cover"], -sb, -sg, -sd),
+            "sizes": {"bas": sb, "gauche": sg, "droite": sd},
+            "counts": e["counts"], "shifts": shifts}
 
 def _draw_U1F_with_sizes(t,tr,pts,sizes,shiftL,shiftR,traversins=None):
     F0x, F0y = pts["F0"]; F02x=pts["F02"][0]
@@ -1382,7 +1906,7 @@ def _draw_U1F_with_sizes(t,tr,pts,sizes,shiftL,shiftR,traversins=None):
     sb=sizes["bas"]; nb=0; x=xs; y=F0y
     while x + sb <= xe + 1e-6:
         poly=[(x,y),(x+sb,y),(x+sb,y+CUSHION_DEPTH),(x,y+CUSHION_DEPTH),(x,y)]
-        draw_polygon_cm(t,tr,poly,fill=COLOR_CUSHION,outline=COLOR_CONTOUR,width=1)
+        draw_polygon_cm(t,tr,poly,fill=_pal("coussins"),outline=COLOR_CONTOUR,width=1)
         label_poly(t,tr,poly,f"{sb}",font=FONT_CUSHION)
         nb+=1; x+=sb
 
@@ -1391,7 +1915,7 @@ def _draw_U1F_with_sizes(t,tr,pts,sizes,shiftL,shiftR,traversins=None):
     sg=sizes["gauche"]; ng=0; xg=F0x; y_=yL0
     while y_ + sg <= y_end_L + 1e-6:
         poly=[(xg,y_),(xg+CUSHION_DEPTH,y_),(xg+CUSHION_DEPTH,y_+sg),(xg,y_+sg),(xg,y_)]
-        draw_polygon_cm(t,tr,poly,fill=COLOR_CUSHION,outline=COLOR_CONTOUR,width=1)
+        draw_polygon_cm(t,tr,poly,fill=_pal("coussins"),outline=COLOR_CONTOUR,width=1)
         label_poly(t,tr,poly,f"{sg}",font=FONT_CUSHION)
         ng+=1; y_+=sg
 
@@ -1400,7 +1924,7 @@ def _draw_U1F_with_sizes(t,tr,pts,sizes,shiftL,shiftR,traversins=None):
     sd=sizes["droite"]; nd=0; xr=F02x; y_=yR0
     while y_ + sd <= y_end_R + 1e-6:
         poly=[(xr-CUSHION_DEPTH,y_),(xr,y_),(xr,y_+sd),(xr-CUSHION_DEPTH,y_+sd),(xr-CUSHION_DEPTH,y_)]
-        draw_polygon_cm(t,tr,poly,fill=COLOR_CUSHION,outline=COLOR_CONTOUR,width=1)
+        draw_polygon_cm(t,tr,poly,fill=_pal("coussins"),outline=COLOR_CONTOUR,width=1)
         label_poly(t,tr,poly,f"{sd}",font=FONT_CUSHION)
         nd+=1; y_+=sd
 
@@ -1413,12 +1937,8 @@ def _u_variant_x_end(variant, pts):
     else:
         return pts["F02"][0]
 
-def _eval_U_counts(variant, pts, drawn, sb, sg, sd, shiftL, shiftR, traversins=None):
-    """
-    Evaluate how many cushions of sizes ``sb``, ``sg`` and ``sd`` will fit on
-    the bottom, left and right branches of a U‑shaped sofa, considering
-    possible méridienne limits.
-    """
+def _lengths_U(variant, pts, drawn, shiftL, shiftR, traversins=None):
+    """Longueurs utiles (bas, gauche, droite) des trois branches de coussins du U (variante)."""
     F0x, F0y = pts["F0"]
     x_end = _u_variant_x_end(variant, pts)
     xs = F0x + (CUSHION_DEPTH if shiftL else 0)
@@ -1434,10 +1954,18 @@ def _eval_U_counts(variant, pts, drawn, sb, sg, sd, shiftL, shiftR, traversins=N
     yL0 = F0y + (0 if (not drawn.get("D1", False) or shiftL) else CUSHION_DEPTH)
     has_right = drawn.get("D4", False) or drawn.get("D5", False)
     yR0 = F0y + (0 if (not has_right or shiftR) else CUSHION_DEPTH)
+    return max(0, xe - xs), max(0, y_end_L - yL0), max(0, y_end_R - yR0)
 
-    nb, wb = _waste_and_count_1d(max(0, xe - xs), sb)
-    ng, wg = _waste_and_count_1d(max(0, y_end_L - yL0), sg)
-    nd, wd = _waste_and_count_1d(max(0, y_end_R - yR0), sd)
+def _eval_U_counts(variant, pts, drawn, sb, sg, sd, shiftL, shiftR, traversins=None):
+    """
+    Evaluate how many cushions of sizes ``sb``, ``sg`` and ``sd`` will fit on
+    the bottom, left and right branches of a U‑shaped sofa, considering
+    possible méridienne limits.
+    """
+    len_b, len_g, len_d = _lengths_U(variant, pts, drawn, shiftL, shiftR, traversins)
+    nb, wb = _waste_and_count_1d(len_b, sb)
+    ng, wg = _waste_and_count_1d(len_g, sg)
+    nd, wd = _waste_and_count_1d(len_d, sd)
     waste = wb + wg + wd
     cover = nb * sb + ng * sg + nd * sd
     return {
@@ -1447,30 +1975,16 @@ def _eval_U_counts(variant, pts, drawn, sb, sg, sd, shiftL, shiftR, traversins=N
     }
 
 def _optimize_valise_U(variant, pts, drawn, rng, same, traversins=None):
-    best=None; r0,r1=rng
-    for sg in range(r0,r1+1):
-        for sb in ([sg] if same else range(r0,r1+1)):
-            for sd in ([sg] if same else range(r0,r1+1)):
-                if max(sb,sg,sd)-min(sb,sg,sd) > 5:
-                    continue
-                E=[]
-                for sl in (False,True):
-                    for sr in (False,True):
-                        E.append(_eval_U_counts(variant, pts, drawn, sb, sg, sd, sl, sr, traversins=traversins))
-                e = min(E, key=lambda x: (x["waste"], -x["cover"], -sb, -sg, -sd))
-                score=(e["waste"], -e["cover"], -sb, -sg, -sd)
-                if (best is None) or (score < best["score"]):
-                    best={"score":score, "sizes":{"bas":sb,"gauche":sg,"droite":sd}}
-    if best:
-        tgt=best["score"]
-        for sl in (False,True):
-            for sr in (False,True):
-                chk=_eval_U_counts(variant, pts, drawn, best["sizes"]["bas"], best["sizes"]["gauche"], best["sizes"]["droite"], sl, sr, traversins=traversins)
-                score=(chk["waste"], -chk["cover"], -best["sizes"]["bas"], -best["sizes"]["gauche"], -best["sizes"]["droite"])
-                if score==tgt:
-                    best["shiftL"], best["shiftR"] = sl, sr
-                    break
-    return best
+    lengths = [_lengths_U(variant, pts, drawn, sl, sr, traversins) for sl, sr in _VALISE_SHIFTS_U]
+    found = _valise_search(lengths, rng, same)
+    if found is None:
+        return None
+    (sb, sg, sd), k = found
+    sl, sr = _VALISE_SHIFTS_U[k]
+    e = _eval_U_counts(variant, pts, drawn, sb, sg, sd, sl, sr, traversins=traversins)
+    return {"score": (e["waste"], -e["cover"], -sb, -sg, -sd),
+            "sizes": {"bas": sb, "gauche": sg, "droite": sd},
+            "counts": e["counts"], "shiftL": sl, "shiftR": sr}
 
 def _draw_U_with_sizes(
     variant, t, tr, pts, sizes, drawn, shiftL, shiftR, traversins=None
@@ -1501,7 +2015,7 @@ def _draw_U_with_sizes(
             (x, y),
         ]
         draw_polygon_cm(
-            t, tr, poly, fill=COLOR_CUSHION, outline=COLOR_CONTOUR, width=1
+            t, tr, poly, fill=_pal("coussins"), outline=COLOR_CONTOUR, width=1
         )
         label_poly(t, tr, poly, f"{sb}", font=FONT_CUSHION)
         nb += 1
@@ -1529,7 +2043,7 @@ def _draw_U_with_sizes(
             (xg, y_),
         ]
         draw_polygon_cm(
-            t, tr, poly, fill=COLOR_CUSHION, outline=COLOR_CONTOUR, width=1
+            t, tr, poly, fill=_pal("coussins"), outline=COLOR_CONTOUR, width=1
         )
         label_poly(t, tr, poly, f"{sg}", font=FONT_CUSHION)
         ng += 1
@@ -1558,7 +2072,7 @@ def _draw_U_with_sizes(
             (x_col - CUSHION_DEPTH, y_),
         ]
         draw_polygon_cm(
-            t, tr, poly, fill=COLOR_CUSHION, outline=COLOR_CONTOUR, width=1
+            t, tr, poly, fill=_pal("coussins"), outline=COLOR_CONTOUR, width=1
         )
         label_poly(t, tr, poly, f"{sd}", font=FONT_CUSHION)
         nd += 1
@@ -1577,18 +2091,14 @@ def _optimize_valise_simple(pts, rng, mer_side=None, mer_len=0, traversins=None)
         if "g" in traversins: x0 += TRAVERSIN_THK
         if "d" in traversins: x1 -= TRAVERSIN_THK
 
-    best=None; r0,r1=rng
-    for s in range(r0, r1+1):
-        n0, w0 = _waste_and_count_1d(max(0, x1-x0), s)
-        n1, w1 = _waste_and_count_1d(max(0, x1-(x0+CUSHION_DEPTH)), s)
-        if w1 < w0 or (w1==w0 and n1>n0):
-            n, waste, off = n1, w1, CUSHION_DEPTH
-        else:
-            n, waste, off = n0, w0, 0
-        score=(waste, -n, -s)
-        if (best is None) or (score < best["score"]):
-            best={"score":score, "size":s, "offset":off, "count":n}
-    return best
+    # une seule branche : décalage 0 puis CUSHION_DEPTH (retenu seulement s'il fait mieux)
+    offsets = (0, CUSHION_DEPTH)
+    found = _valise_search([(max(0, x1-(x0+off)),) for off in offsets], rng, same=True, by="count")
+    if found is None:
+        return None
+    (s,), k = found
+    n, waste = _waste_and_count_1d(max(0, x1-(x0+offsets[k])), s)
+    return {"score": (waste, -n, -s), "size": s, "offset": offsets[k], "count": n}
 
 def _draw_simple_with_size(t,tr,pts,size,mer_side=None,mer_len=0, traversins=None):
     x0 = pts["B0"][0]; x1 = pts["Bx"][0]
@@ -1606,7 +2116,7 @@ def _draw_simple_with_size(t,tr,pts,size,mer_side=None,mer_len=0, traversins=Non
     x = x0 + off; y = pts["B0"][1]; n=0
     while x + size <= x1 + 1e-6:
         poly=[(x,y),(x+size,y),(x+size,y+CUSHION_DEPTH),(x,y+CUSHION_DEPTH),(x,y)]
-        draw_polygon_cm(t,tr,poly,fill=COLOR_CUSHION,outline=COLOR_CONTOUR,width=1)
+        draw_polygon_cm(t,tr,poly,fill=_pal("coussins"),outline=COLOR_CONTOUR,width=1)
         label_poly(t,tr,poly,f"{size}",font=FONT_CUSHION)
         x+=size; n+=1
     return n
@@ -1728,7 +2238,7 @@ def draw_cousins_and_return_count(t, tr, pts, tx, ty, coussins, meridienne_side,
     x_cur = F0x + (CUSHION_DEPTH if use_shift else 0)
     while x_cur + size <= x_end + 1e-6:
         poly = [(x_cur, y), (x_cur+size, y), (x_cur+size, y+CUSHION_DEPTH), (x_cur, y+CUSHION_DEPTH), (x_cur, y)]
-        draw_polygon_cm(t, tr, poly, fill=COLOR_CUSHION, outline=COLOR_CONTOUR, width=1)
+        draw_polygon_cm(t, tr, poly, fill=_pal("coussins"), outline=COLOR_CONTOUR, width=1)
         label_poly(t, tr, poly, f"{size}", font=FONT_CUSHION)
         x_cur += size; count += 1
     # gauche
@@ -1736,7 +2246,7 @@ def draw_cousins_and_return_count(t, tr, pts, tx, ty, coussins, meridienne_side,
     y_cur = F0y + (0 if use_shift else CUSHION_DEPTH)
     while y_cur + size <= y_end + 1e-6:
         poly = [(x, y_cur), (x+CUSHION_DEPTH, y_cur), (x+CUSHION_DEPTH, y_cur+size), (x, y_cur+size), (x, y_cur)]
-        draw_polygon_cm(t, tr, poly, fill=COLOR_CUSHION, outline=COLOR_CONTOUR, width=1)
+        draw_polygon_cm(t, tr, poly, fill=_pal("coussins"), outline=COLOR_CONTOUR, width=1)
         label_poly(t, tr, poly, f"{size}", font=FONT_CUSHION)
         y_cur += size; count += 1
 
@@ -1835,6 +2345,7 @@ def render_LF_variant(tx, ty, profondeur=DEPTH_STD,
     pts=compute_points_LF_variant(tx,ty,profondeur,dossier_left,dossier_bas,acc_left,acc_bas,meridienne_side,meridienne_len)
     polys=build_polys_LF_variant(pts,tx,ty,profondeur,dossier_left,dossier_bas,acc_left,acc_bas,meridienne_side,meridienne_len)
     _assert_banquettes_max_250(polys)
+    _scene_note("polys", polys)
 
     screen=turtle.Screen(); screen.setup(WIN_W,WIN_H)
     screen.title(f"{window_title} — {tx}x{ty} cm — prof={profondeur} — méridienne {meridienne_side or '-'}={meridienne_len} — coussins={coussins}")
@@ -1843,10 +2354,10 @@ def render_LF_variant(tx, ty, profondeur=DEPTH_STD,
 
     # (Quadrillage et repères supprimés)
 
-    for poly in polys["dossiers"]:   draw_polygon_cm(t,tr,poly,fill=COLOR_DOSSIER)
-    for poly in polys["banquettes"]: draw_polygon_cm(t,tr,poly,fill=COLOR_ASSISE)
-    for poly in polys["accoudoirs"]: draw_polygon_cm(t,tr,poly,fill=COLOR_ACC)
-    for poly in polys["angle"]:      draw_polygon_cm(t,tr,poly,fill=COLOR_ASSISE)
+    for poly in polys["dossiers"]:   draw_polygon_cm(t,tr,poly,fill=_pal("dossiers"))
+    for poly in polys["banquettes"]: draw_polygon_cm(t,tr,poly,fill=_pal("assise"))
+    for poly in polys["accoudoirs"]: draw_polygon_cm(t,tr,poly,fill=_pal("accoudoirs"))
+    for poly in polys["angle"]:      draw_polygon_cm(t,tr,poly,fill=_pal("assise"))
 
     # Traversins (visuel) + comptage
     n_traversins = _draw_traversins_L_like(t, tr, pts, profondeur, trv)
@@ -1872,9 +2383,11 @@ def render_LF_variant(tx, ty, profondeur=DEPTH_STD,
     if spec["mode"] == "auto":
         cushions_count, chosen_size = draw_cousins_and_return_count(t,tr,pts,tx,ty,"auto",meridienne_side,meridienne_len,traversins=trv)
         total_line = f"{coussins} → {cushions_count} × {chosen_size} cm"
+        cushion_sizes = {"total": (cushions_count, chosen_size)}
     elif spec["mode"] == "fixed":
         cushions_count, chosen_size = draw_cousins_and_return_count(t,tr,pts,tx,ty,int(spec["fixed"]),meridienne_side,meridienne_len,traversins=trv)
         total_line = f"{coussins} → {cushions_count} × {chosen_size} cm"
+        cushion_sizes = {"total": (cushions_count, chosen_size)}
     else:
         best = _optimize_valise_L_like(pts, spec["range"], spec["same"], x_end_key="Bx", y_end_key="By", traversins=trv)
         if not best:
@@ -1882,6 +2395,7 @@ def render_LF_variant(tx, ty, profondeur=DEPTH_STD,
         sizes = best["sizes"]; shift = best["shift_bas"]
         n, sb, sg = _draw_L_like_with_sizes(t, tr, pts, sizes, shift, x_end_key="Bx", y_end_key="By", traversins=trv)
         cushions_count = n; total_line = _format_valise_counts_console({"bas": sb, "gauche": sg}, best["counts"], cushions_count)
+        cushion_sizes = _valise_sizes_report(best)
 
     # Légende (couleurs)
     draw_legend(t, tr, tx, ty, items=legend_items, pos="top-right")
@@ -1889,15 +2403,23 @@ def render_LF_variant(tx, ty, profondeur=DEPTH_STD,
     screen.tracer(True); t.hideturtle()
     add_split = int(polys["split_flags"]["left"] and dossier_left) + int(polys["split_flags"]["bottom"] and dossier_bas)
     A = profondeur + 20
-    print("=== Rapport canapé (LF) ===")
-    print(f"Dimensions : {tx}×{ty} cm — profondeur : {profondeur} cm")
-    print(f"Banquettes : {len(polys['banquettes'])} → {banquette_sizes}")
-    print(f"Dossiers : {len(polys['dossiers'])} (+{add_split} via scission) | Accoudoirs : {len(polys['accoudoirs'])}")
-    print(f"Banquettes d’angle : 1")
-    print(f"Angles : 1 × {A}×{A} cm")
-    print(f"Traversins : {n_traversins} × 70x30")
-    print(f"Coussins : {total_line}")
+    lines = [
+        "=== Rapport canapé (LF) ===",
+        f"Dimensions : {tx}×{ty} cm — profondeur : {profondeur} cm",
+        f"Banquettes : {len(polys['banquettes'])} → {banquette_sizes}",
+        f"Dossiers : {len(polys['dossiers'])} (+{add_split} via scission) | Accoudoirs : {len(polys['accoudoirs'])}",
+        f"Banquettes d’angle : 1",
+        f"Angles : 1 × {A}×{A} cm",
+        f"Traversins : {n_traversins} × 70x30",
+        f"Coussins : {total_line}",
+    ]
+    report = _emit_report("LF", lines, polys, banquette_sizes, n_traversins, cushions_count,
+                          cushion_sizes,
+                          tx, ty, profondeur=profondeur,
+                          meridienne_side=meridienne_side, meridienne_len=meridienne_len,
+                          dossiers_scission=add_split, angles=1, angle_size=A)
     turtle.done()
+    return report
 
 # =====================================================================
 # ========================  U2f (2 angles fromage)  ====================
@@ -2147,6 +2669,7 @@ def render_U2f_variant(tx, ty_left, tz_right, profondeur=DEPTH_STD,
                             dossier_left, dossier_bas, dossier_right,
                             acc_left, acc_bas, acc_right)
     _assert_banquettes_max_250(polys)
+    _scene_note("polys", polys)
 
     ty_canvas = pts["_ty_canvas"]
     screen = turtle.Screen(); screen.setup(WIN_W, WIN_H)
@@ -2156,10 +2679,10 @@ def render_U2f_variant(tx, ty_left, tz_right, profondeur=DEPTH_STD,
 
     # (Quadrillage et repères supprimés)
 
-    for poly in polys["dossiers"]:   draw_polygon_cm(t, tr, poly, fill=COLOR_DOSSIER)
-    for poly in polys["banquettes"]: draw_polygon_cm(t, tr, poly, fill=COLOR_ASSISE)
-    for poly in polys["accoudoirs"]: draw_polygon_cm(t, tr, poly, fill=COLOR_ACC)
-    for poly in polys["angles"]:     draw_polygon_cm(t, tr, poly, fill=COLOR_ASSISE)
+    for poly in polys["dossiers"]:   draw_polygon_cm(t, tr, poly, fill=_pal("dossiers"))
+    for poly in polys["banquettes"]: draw_polygon_cm(t, tr, poly, fill=_pal("assise"))
+    for poly in polys["accoudoirs"]: draw_polygon_cm(t, tr, poly, fill=_pal("accoudoirs"))
+    for poly in polys["angles"]:     draw_polygon_cm(t, tr, poly, fill=_pal("assise"))
 
     # Traversins (visuel) + comptage
     n_traversins = _draw_traversins_U_side_F02(t, tr, pts, profondeur, trv)
@@ -2209,10 +2732,12 @@ def render_U2f_variant(tx, ty_left, tz_right, profondeur=DEPTH_STD,
         size = best
         cushions_count = _draw_cushions_U2f_optimized_wrapper(t, tr, pts, size, traversins=trv)
         total_line = f"{coussins} → {cushions_count} × {size} cm"
+        cushion_sizes = {"total": (cushions_count, size)}
     elif spec["mode"] == "fixed":
         size = int(spec["fixed"])
         cushions_count = _draw_cushions_U2f_optimized_wrapper(t, tr, pts, size, traversins=trv)
         total_line = f"{coussins} → {cushions_count} × {size} cm"
+        cushion_sizes = {"total": (cushions_count, size)}
     else:
         best = _optimize_valise_U2f(pts, spec["range"], spec["same"], traversins=trv)
         if not best:
@@ -2221,26 +2746,33 @@ def render_U2f_variant(tx, ty_left, tz_right, profondeur=DEPTH_STD,
         cushions_count = _draw_U2f_with_sizes(t, tr, pts, sizes, shiftL, shiftR, traversins=trv)
         sb, sg, sd = sizes["bas"], sizes["gauche"], sizes["droite"]
         total_line = _format_valise_counts_console({"bas": sb, "gauche": sg, "droite": sd}, best["counts"], cushions_count)
+        cushion_sizes = _valise_sizes_report(best)
 
     # Titre demandé + légende (U → légende en haut-centre)
     draw_title_center(t, tr, tx, ty_canvas, "Canapé en U avec deux angles")
     draw_legend(t, tr, tx, ty_canvas, items=legend_items, pos="top-center")
 
     screen.tracer(True); t.hideturtle()
-    add_split = sum(int(v) for v in polys.get("split_flags", {}).values())
-    print("=== Rapport canapé U2f ===")
-    print(f"Dimensions : tx={tx} / ty(left)={ty_left} / tz(right)={tz_right} — prof={profondeur} (A={A})")
-    print(f"Méridienne : {meridienne_side or '-'} ({meridienne_len} cm)")
-    print(f"Banquettes : {len(polys['banquettes'])} → {banquette_sizes}")
     dossier_bonus = int(polys["split_flags"].get("left", False) and dossier_left) + \
                    int(polys["split_flags"].get("bottom", False) and dossier_bas) + \
                    int(polys["split_flags"].get("right", False) and dossier_right)
-    print(f"Dossiers : {len(polys['dossiers'])} (+{dossier_bonus} via scission) | Accoudoirs : {len(polys['accoudoirs'])}")
-    print(f"Banquettes d'angle : 2")
-    print(f"Angles : 2 × {A}×{A} cm")
-    print(f"Traversins : {n_traversins} × 70x30")
-    print(f"Coussins : {total_line}")
+    lines = [
+        "=== Rapport canapé U2f ===",
+        f"Dimensions : tx={tx} / ty(left)={ty_left} / tz(right)={tz_right} — prof={profondeur} (A={A})",
+        f"Méridienne : {meridienne_side or '-'} ({meridienne_len} cm)",
+        f"Banquettes : {len(polys['banquettes'])} → {banquette_sizes}",
+        f"Dossiers : {len(polys['dossiers'])} (+{dossier_bonus} via scission) | Accoudoirs : {len(polys['accoudoirs'])}",
+        f"Banquettes d'angle : 2",
+        f"Angles : 2 × {A}×{A} cm",
+        f"Traversins : {n_traversins} × 70x30",
+        f"Coussins : {total_line}",
+    ]
+    report = _emit_report("U2f", lines, polys, banquette_sizes, n_traversins, cushions_count, cushion_sizes,
+                          tx, ty_left, tz_right, profondeur,
+                          meridienne_side=meridienne_side, meridienne_len=meridienne_len,
+                          dossiers_scission=dossier_bonus, angles=2, angle_size=A)
     turtle.done()
+    return report
 
 # =====================================================================
 # ===================  U1F (1 angle fromage) — v1..v4  =================
@@ -2317,21 +2849,21 @@ def _draw_coussins_U1F(t, tr, pts, size, traversins=None):
     y = F0y; x = xs
     while x + size <= xe + 1e-6:
         poly=[(x,y),(x+size,y),(x+size,y+CUSHION_DEPTH),(x,y+CUSHION_DEPTH),(x,y)]
-        draw_polygon_cm(t,tr,poly,fill=COLOR_CUSHION,outline=COLOR_CONTOUR,width=1)
+        draw_polygon_cm(t,tr,poly,fill=_pal("coussins"),outline=COLOR_CONTOUR,width=1)
         label_poly(t,tr,poly,f"{size}",font=FONT_CUSHION)
         count+=1; x+=size
     # GAUCHE
     x = F0x; y = yL0
     while y + size <= y_end_L + 1e-6:
         poly=[(x,y),(x+CUSHION_DEPTH,y),(x+CUSHION_DEPTH,y+size),(x,y+size),(x,y)]
-        draw_polygon_cm(t,tr,poly,fill=COLOR_CUSHION,outline=COLOR_CONTOUR,width=1)
+        draw_polygon_cm(t,tr,poly,fill=_pal("coussins"),outline=COLOR_CONTOUR,width=1)
         label_poly(t,tr,poly,f"{size}",font=FONT_CUSHION)
         count+=1; y+=size
     # DROITE
     x = F02x; y = yR0
     while y + size <= y_end_R + 1e-6:
         poly=[(x-CUSHION_DEPTH,y),(x,y),(x,y+size),(x-CUSHION_DEPTH,y+size),(x-CUSHION_DEPTH,y)]
-        draw_polygon_cm(t,tr,poly,fill=COLOR_CUSHION,outline=COLOR_CONTOUR,width=1)
+        draw_polygon_cm(t,tr,poly,fill=_pal("coussins"),outline=COLOR_CONTOUR,width=1)
         label_poly(t,tr,poly,f"{size}",font=FONT_CUSHION)
         count+=1; y+=size
     return count
@@ -2950,23 +3482,21 @@ def _render_common_U1F(variant, tx, ty_left, tz_right, profondeur,
                        dossier_left, dossier_bas, dossier_right,
                        acc_left, acc_right,
                        meridienne_side, meridienne_len,
-                       coussins, traversins, couleurs, window_title):
-    comp = {"v1":compute_points_U1F_v1, "v2":compute_points_U1F_v2,
-            "v3":compute_points_U1F_v3, "v4":compute_points_U1F_v4}[variant]
-    build= {"v1":build_polys_U1F_v1,   "v2":build_polys_U1F_v2,
-            "v3":build_polys_U1F_v3,   "v4":build_polys_U1F_v4}[variant]
-
+                       coussins, traversins, couleurs, window_title,
+                       geometry=None):
+    """`geometry` : (pts, polys) déjà calculés pour `variant` (sélection auto), sinon recalculés."""
     trv = _parse_traversins_spec(traversins, allowed={"g","d"})
     legend_items = _resolve_and_apply_colors(couleurs)
 
-    pts = comp(tx, ty_left, tz_right, profondeur,
-               dossier_left, dossier_bas, dossier_right,
-               acc_left, acc_right,
-               meridienne_side, meridienne_len)
-    polys = build(pts, tx, ty_left, tz_right, profondeur,
-                  dossier_left, dossier_bas, dossier_right,
-                  acc_left, acc_right)
+    if geometry is None:
+        geometry = _dry_polys_for_U1F_variant(tx, ty_left, tz_right, profondeur,
+                                              dossier_left, dossier_bas, dossier_right,
+                                              acc_left, acc_right,
+                                              meridienne_side, meridienne_len,
+                                              variant)
+    pts, polys = geometry
     _assert_banquettes_max_250(polys)
+    _scene_note("polys", polys)
 
     ty_canvas = max(ty_left, tz_right)
     screen = turtle.Screen(); screen.setup(WIN_W, WIN_H)
@@ -2979,10 +3509,10 @@ def _render_common_U1F(variant, tx, ty_left, tz_right, profondeur,
     for p in polys["dossiers"]:
         xs=[pp[0] for pp in p]; ys=[pp[1] for pp in p]
         if (max(xs)-min(xs) > 1e-9) and (max(ys)-min(ys) > 1e-9):
-            draw_polygon_cm(t, tr, p, fill=COLOR_DOSSIER)
-    for p in polys["banquettes"]: draw_polygon_cm(t, tr, p, fill=COLOR_ASSISE)
-    for p in polys["accoudoirs"]: draw_polygon_cm(t, tr, p, fill=COLOR_ACC)
-    for p in polys["angle"]:      draw_polygon_cm(t, tr, p, fill=COLOR_ASSISE)
+            draw_polygon_cm(t, tr, p, fill=_pal("dossiers"))
+    for p in polys["banquettes"]: draw_polygon_cm(t, tr, p, fill=_pal("assise"))
+    for p in polys["accoudoirs"]: draw_polygon_cm(t, tr, p, fill=_pal("accoudoirs"))
+    for p in polys["angle"]:      draw_polygon_cm(t, tr, p, fill=_pal("assise"))
 
     # Traversins + comptage
     n_traversins = _draw_traversins_U_side_F02(t, tr, pts, profondeur, trv)
@@ -3017,10 +3547,12 @@ def _render_common_U1F(variant, tx, ty_left, tz_right, profondeur,
         size = _choose_cushion_size_auto_U1F(pts, traversins=trv)
         nb_coussins = _draw_coussins_U1F(t, tr, pts, size, traversins=trv)
         total_line = f"{coussins} → {nb_coussins} × {size} cm"
+        cushion_sizes = {"total": (nb_coussins, size)}
     elif spec["mode"] == "fixed":
         size = int(spec["fixed"])
         nb_coussins = _draw_coussins_U1F(t, tr, pts, size, traversins=trv)
         total_line = f"{coussins} → {nb_coussins} × {size} cm"
+        cushion_sizes = {"total": (nb_coussins, size)}
     else:
         best = _optimize_valise_U1F(pts, spec["range"], spec["same"], traversins=trv)
         if not best:
@@ -3029,6 +3561,7 @@ def _render_common_U1F(variant, tx, ty_left, tz_right, profondeur,
         nb_coussins = _draw_U1F_with_sizes(t, tr, pts, sizes, shiftL, shiftR, traversins=trv)
         sb, sg, sd = sizes["bas"], sizes["gauche"], sizes["droite"]
         total_line = _format_valise_counts_console({"bas": sb, "gauche": sg, "droite": sd}, best["counts"], nb_coussins)
+        cushion_sizes = _valise_sizes_report(best)
 
     # Titre + légende (U → haut-centre)
     draw_title_center(t, tr, tx, ty_canvas, "Canapé en U avec un angle")
@@ -3037,15 +3570,22 @@ def _render_common_U1F(variant, tx, ty_left, tz_right, profondeur,
     screen.tracer(True); t.hideturtle()
 
     add_split = int(polys.get("split_flags",{}).get("any",False))
-    print(f"=== Rapport U1F {variant} ===")
-    print(f"Dimensions : tx={tx} / ty(left)={ty_left} / tz(right)={tz_right} — profondeur={profondeur} (A={A})")
-    print(f"Banquettes : {len(polys['banquettes'])} → {banquette_sizes}")
-    print(f"Dossiers : {len(polys['dossiers'])} (+{add_split} via scission) | Accoudoirs : {len(polys['accoudoirs'])}")
-    print(f"Banquettes d’angle : 1")
-    print(f"Angles : 1 × {A}×{A} cm")
-    print(f"Traversins : {n_traversins} × 70x30")
-    print(f"Coussins : {total_line}")
+    lines = [
+        f"=== Rapport U1F {variant} ===",
+        f"Dimensions : tx={tx} / ty(left)={ty_left} / tz(right)={tz_right} — profondeur={profondeur} (A={A})",
+        f"Banquettes : {len(polys['banquettes'])} → {banquette_sizes}",
+        f"Dossiers : {len(polys['dossiers'])} (+{add_split} via scission) | Accoudoirs : {len(polys['accoudoirs'])}",
+        f"Banquettes d’angle : 1",
+        f"Angles : 1 × {A}×{A} cm",
+        f"Traversins : {n_traversins} × 70x30",
+        f"Coussins : {total_line}",
+    ]
+    report = _emit_report(f"U1F {variant}", lines, polys, banquette_sizes, n_traversins, nb_coussins, cushion_sizes,
+                          tx, ty_left, tz_right, profondeur,
+                          meridienne_side=meridienne_side, meridienne_len=meridienne_len,
+                          dossiers_scission=add_split, angles=1, angle_size=A)
     turtle.done()
+    return report
 
 def _dry_polys_for_U1F_variant(tx, ty_left, tz_right, profondeur,
                                dossier_left, dossier_bas, dossier_right,
@@ -3092,7 +3632,8 @@ def render_U1F(tx, ty_left, tz_right, profondeur=DEPTH_STD,
                window_title="U1F — auto"):
     """
     Rendu générique pour les U1F. Permet de forcer une variante (v1/v2/v3/v4)
-    ou de laisser le choix automatique (auto) entre les variantes les plus simples (v1 et v3).
+    ou de laisser le choix automatique (auto) de la variante la plus simple parmi les quatre
+    (moins de banquettes ; à égalité : v1, v3, v2 puis v4).
     """
     v_norm = (variant or "auto").lower()
     # Forcer explicitement une variante
@@ -3133,9 +3674,12 @@ def render_U1F(tx, ty_left, tz_right, profondeur=DEPTH_STD,
                 coussins=coussins, traversins=traversins, couleurs=couleurs,
                 window_title=window_title,
             )
-    # Mode automatique: choisir la variante la plus simple entre v1 et v3
-    candidates = ("v1", "v3")
+    # Mode automatique: choisir la variante la plus simple parmi les quatre.
+    # Ordre de préférence fixe à égalité (v1 et v3 d'abord, comme avant) : choix déterministe.
+    # Les variantes dont une banquette dépasserait 250 cm sont écartées (comme pour le U).
+    candidates = ("v1", "v3", "v2", "v4")
     best_variant = None
+    geometries = {}
     best_nb_ban = float("inf")
     best_scissions = float("inf")
     def _count_scissions(polys):
@@ -3153,6 +3697,11 @@ def render_U1F(tx, ty_left, tz_right, profondeur=DEPTH_STD,
             )
         except ValueError:
             continue
+        try:
+            _assert_banquettes_max_250(_polys)
+        except ValueError:
+            continue
+        geometries[var] = (_pts, _polys)
         nb_ban = len(_polys.get("banquettes", []))
         sci = _count_scissions(_polys)
         if (nb_ban < best_nb_ban) or (nb_ban == best_nb_ban and sci < best_scissions):
@@ -3169,6 +3718,7 @@ def render_U1F(tx, ty_left, tz_right, profondeur=DEPTH_STD,
         meridienne_side, meridienne_len,
         coussins, traversins, couleurs,
         window_title,
+        geometry=geometries.get(best_variant),
     )
 
 def render_U1F_v1(*args, **kwargs):
@@ -3177,25 +3727,25 @@ def render_U1F_v1(*args, **kwargs):
     # compat. anciens appels : ty/tz -> ty_left/tz_right
     if "ty_left" not in kwargs and "ty" in kwargs: kwargs["ty_left"] = kwargs.pop("ty")
     if "tz_right" not in kwargs and "tz" in kwargs: kwargs["tz_right"] = kwargs.pop("tz")
-    _render_common_U1F("v1", *args, **kwargs)
+    return _render_common_U1F("v1", *args, **kwargs)
 def render_U1F_v2(*args, **kwargs):
     if "traversins" not in kwargs: kwargs["traversins"]=None
     if "couleurs" not in kwargs: kwargs["couleurs"]=None
     if "ty_left" not in kwargs and "ty" in kwargs: kwargs["ty_left"] = kwargs.pop("ty")
     if "tz_right" not in kwargs and "tz" in kwargs: kwargs["tz_right"] = kwargs.pop("tz")
-    _render_common_U1F("v2", *args, **kwargs)
+    return _render_common_U1F("v2", *args, **kwargs)
 def render_U1F_v3(*args, **kwargs):
     if "traversins" not in kwargs: kwargs["traversins"]=None
     if "couleurs" not in kwargs: kwargs["couleurs"]=None
     if "ty_left" not in kwargs and "ty" in kwargs: kwargs["ty_left"] = kwargs.pop("ty")
     if "tz_right" not in kwargs and "tz" in kwargs: kwargs["tz_right"] = kwargs.pop("tz")
-    _render_common_U1F("v3", *args, **kwargs)
+    return _render_common_U1F("v3", *args, **kwargs)
 def render_U1F_v4(*args, **kwargs):
     if "traversins" not in kwargs: kwargs["traversins"]=None
     if "couleurs" not in kwargs: kwargs["couleurs"]=None
     if "ty_left" not in kwargs and "ty" in kwargs: kwargs["ty_left"] = kwargs.pop("ty")
     if "tz_right" not in kwargs and "tz" in kwargs: kwargs["tz_right"] = kwargs.pop("tz")
-    _render_common_U1F("v4", *args, **kwargs)
+    return _render_common_U1F("v4", *args, **kwargs)
 
 # =====================================================================
 # ======================  L (no fromage) v1 + v2  =====================
@@ -3502,7 +4052,7 @@ def draw_coussins_L_optimized(t, tr, pts, coussins, traversins=None):
         cnt=0; y=F0y; x_cur=x_start
         while x_cur + size <= x_end + 1e-6:
             poly=[(x_cur,y),(x_cur+size,y),(x_cur+size,y+CUSHION_DEPTH),(x_cur,y+CUSHION_DEPTH),(x_cur,y)]
-            draw_polygon_cm(t,tr,poly,fill=COLOR_CUSHION,outline=COLOR_CONTOUR,width=1)
+            draw_polygon_cm(t,tr,poly,fill=_pal("coussins"),outline=COLOR_CONTOUR,width=1)
             label_poly(t,tr,poly,f"{size}",font=FONT_CUSHION)
             x_cur += size; cnt += 1
         return cnt
@@ -3510,7 +4060,7 @@ def draw_coussins_L_optimized(t, tr, pts, coussins, traversins=None):
         cnt=0; x=F0x; y_cur=y_start
         while y_cur + size <= y_end + 1e-6:
             poly=[(x,y_cur),(x+CUSHION_DEPTH,y_cur),(x+CUSHION_DEPTH,y_cur+size),(x,y_cur+size),(x,y_cur)]
-            draw_polygon_cm(t,tr,poly,fill=COLOR_CUSHION,outline=COLOR_CONTOUR,width=1)
+            draw_polygon_cm(t,tr,poly,fill=_pal("coussins"),outline=COLOR_CONTOUR,width=1)
             label_poly(t,tr,poly,f"{size}",font=FONT_CUSHION)
             y_cur += size; cnt += 1
         return cnt
@@ -3529,6 +4079,7 @@ def _render_common_L(tx, ty, pts, polys, coussins, window_title,
                      profondeur, dossier_left, dossier_bas, meridienne_side, meridienne_len,
                      traversins=None, couleurs=None):
     _assert_banquettes_max_250(polys)
+    _scene_note("polys", polys)
 
     trv = _parse_traversins_spec(traversins, allowed={"g","b"})
     legend_items = _resolve_and_apply_colors(couleurs)
@@ -3540,9 +4091,9 @@ def _render_common_L(tx, ty, pts, polys, coussins, window_title,
 
     # (Quadrillage et repères supprimés)
 
-    for p in polys["dossiers"]:   draw_polygon_cm(t,tr,p,fill=COLOR_DOSSIER)
-    for p in polys["banquettes"]: draw_polygon_cm(t,tr,p,fill=COLOR_ASSISE)
-    for p in polys["accoudoirs"]: draw_polygon_cm(t,tr,p,fill=COLOR_ACC)
+    for p in polys["dossiers"]:   draw_polygon_cm(t,tr,p,fill=_pal("dossiers"))
+    for p in polys["banquettes"]: draw_polygon_cm(t,tr,p,fill=_pal("assise"))
+    for p in polys["accoudoirs"]: draw_polygon_cm(t,tr,p,fill=_pal("accoudoirs"))
 
     # Traversins + comptage
     n_traversins = _draw_traversins_L_like(t, tr, pts, profondeur, trv)
@@ -3566,9 +4117,11 @@ def _render_common_L(tx, ty, pts, polys, coussins, window_title,
     if spec["mode"] == "auto":
         cushions_count, chosen_size = draw_coussins_L_optimized(t,tr,pts,"auto", traversins=trv)
         total_line = f"{coussins} → {cushions_count} × {chosen_size} cm"
+        cushion_sizes = {"total": (cushions_count, chosen_size)}
     elif spec["mode"] == "fixed":
         cushions_count, chosen_size = draw_coussins_L_optimized(t,tr,pts,int(spec["fixed"]), traversins=trv)
         total_line = f"{coussins} → {cushions_count} × {chosen_size} cm"
+        cushion_sizes = {"total": (cushions_count, chosen_size)}
     else:
         best = _optimize_valise_L_like(pts, spec["range"], spec["same"], traversins=trv)
         if not best:
@@ -3576,6 +4129,7 @@ def _render_common_L(tx, ty, pts, polys, coussins, window_title,
         sizes = best["sizes"]; shift = best["shift_bas"]
         n, sb, sg = _draw_L_like_with_sizes(t, tr, pts, sizes, shift, traversins=trv)
         cushions_count = n; total_line = _format_valise_counts_console({"bas": sb, "gauche": sg}, best["counts"], cushions_count)
+        cushion_sizes = _valise_sizes_report(best)
 
     # Légende
     draw_legend(t, tr, tx, ty, items=legend_items, pos="top-right")
@@ -3585,18 +4139,25 @@ def _render_common_L(tx, ty, pts, polys, coussins, window_title,
     add_split = int(polys.get("split_flags",{}).get("left",False) and dossier_left) \
               + int(polys.get("split_flags",{}).get("bottom",False) and dossier_bas)
 
-    print("=== Rapport LNF ===")
-    print(f"Dimensions : {tx}×{ty} — prof={profondeur} — méridienne {meridienne_side or '-'}={meridienne_len}")
-    print(f"Banquettes : {len(polys['banquettes'])} → {banquette_sizes}")
     # Comptage des dossiers : ajuste pour le cas où le bas comporte un "retour" sans dossier gauche
     dossiers_count = len(polys['dossiers'])
     if dossier_bas and (dossier_left is None) and (meridienne_side not in ('b','B','bas','bottom')):
         dossiers_count -= 0.5
-    print(f"Dossiers : {dossiers_count} (+{add_split} via scission) | Accoudoirs : {len(polys['accoudoirs'])}")
-    print(f"Banquettes d’angle : 0")
-    print(f"Traversins : {n_traversins} × 70x30")
-    print(f"Coussins : {total_line}")
+    lines = [
+        "=== Rapport LNF ===",
+        f"Dimensions : {tx}×{ty} — prof={profondeur} — méridienne {meridienne_side or '-'}={meridienne_len}",
+        f"Banquettes : {len(polys['banquettes'])} → {banquette_sizes}",
+        f"Dossiers : {dossiers_count} (+{add_split} via scission) | Accoudoirs : {len(polys['accoudoirs'])}",
+        f"Banquettes d’angle : 0",
+        f"Traversins : {n_traversins} × 70x30",
+        f"Coussins : {total_line}",
+    ]
+    report = _emit_report("LNF", lines, polys, banquette_sizes, n_traversins, cushions_count, cushion_sizes,
+                          tx, ty, profondeur=profondeur,
+                          meridienne_side=meridienne_side, meridienne_len=meridienne_len,
+                          dossiers=dossiers_count, dossiers_scission=add_split)
     turtle.done()
+    return report
 
 def render_LNF_v1(tx, ty, profondeur=DEPTH_STD,
                   dossier_left=True, dossier_bas=True,
@@ -3614,7 +4175,7 @@ def render_LNF_v1(tx, ty, profondeur=DEPTH_STD,
         if not dossier_bas: raise ValueError("Méridienne bas impossible sans dossier bas.")
     pts = compute_points_LNF_v1(tx,ty,profondeur,dossier_left,dossier_bas,acc_left,acc_bas,meridienne_side,meridienne_len)
     polys = build_polys_LNF_v1(pts,tx,ty,profondeur,dossier_left,dossier_bas,acc_left,acc_bas,meridienne_side,meridienne_len)
-    _render_common_L(tx,ty,pts,polys,coussins,window_title,profondeur,dossier_left,dossier_bas,meridienne_side,meridienne_len,traversins=traversins, couleurs=couleurs)
+    return _render_common_L(tx,ty,pts,polys,coussins,window_title,profondeur,dossier_left,dossier_bas,meridienne_side,meridienne_len,traversins=traversins, couleurs=couleurs)
 
 def render_LNF_v2(tx, ty, profondeur=DEPTH_STD,
                   dossier_left=True, dossier_bas=True,
@@ -3632,7 +4193,7 @@ def render_LNF_v2(tx, ty, profondeur=DEPTH_STD,
         if not dossier_bas: raise ValueError("Méridienne bas impossible sans dossier bas.")
     pts = compute_points_LNF_v2(tx,ty,profondeur,dossier_left,dossier_bas,acc_left,acc_bas,meridienne_side,meridienne_len)
     polys = build_polys_LNF_v2(pts,tx,ty,profondeur,dossier_left,dossier_bas,acc_left,acc_bas,meridienne_side,meridienne_len)
-    _render_common_L(tx,ty,pts,polys,coussins,window_title,profondeur,dossier_left,dossier_bas,meridienne_side,meridienne_len,traversins=traversins, couleurs=couleurs)
+    return _render_common_L(tx,ty,pts,polys,coussins,window_title,profondeur,dossier_left,dossier_bas,meridienne_side,meridienne_len,traversins=traversins, couleurs=couleurs)
 
 def _dry_polys_for_variant(tx, ty, profondeur,
                            dossier_left, dossier_bas,
@@ -3666,14 +4227,12 @@ def render_LNF(tx, ty, profondeur=DEPTH_STD,
     if variant and variant.lower() in ("v1", "v2"):
         chosen = variant.lower()
         if chosen == "v2":
-            render_LNF_v2(tx, ty, profondeur, dossier_left, dossier_bas, acc_left, acc_bas,
-                          meridienne_side, meridienne_len, coussins, traversins=traversins, couleurs=couleurs,
-                          window_title=window_title)
-        else:
-            render_LNF_v1(tx, ty, profondeur, dossier_left, dossier_bas, acc_left, acc_bas,
-                          meridienne_side, meridienne_len, coussins, traversins=traversins, couleurs=couleurs,
-                          window_title=window_title)
-        return
+            return render_LNF_v2(tx, ty, profondeur, dossier_left, dossier_bas, acc_left, acc_bas,
+                                 meridienne_side, meridienne_len, coussins, traversins=traversins, couleurs=couleurs,
+                                 window_title=window_title)
+        return render_LNF_v1(tx, ty, profondeur, dossier_left, dossier_bas, acc_left, acc_bas,
+                             meridienne_side, meridienne_len, coussins, traversins=traversins, couleurs=couleurs,
+                             window_title=window_title)
 
     nb_ban_v1 = float("inf")
     nb_ban_v2 = float("inf")
@@ -3709,14 +4268,20 @@ def render_LNF(tx, ty, profondeur=DEPTH_STD,
         elif scissions(polys2) < scissions(polys1): chosen="v2"
         else: chosen = "v1" if tx >= ty else "v2"
 
+    # géométrie du dry-run réutilisée telle quelle (mêmes validations que render_LNF_v1/v2)
+    chosen_polys = polys2 if chosen == "v2" else polys1
+    if chosen_polys is not None:
+        chosen_pts = _pts2 if chosen == "v2" else _pts1
+        return _render_common_L(tx, ty, chosen_pts, chosen_polys, coussins, window_title,
+                                profondeur, dossier_left, dossier_bas, meridienne_side, meridienne_len,
+                                traversins=traversins, couleurs=couleurs)
     if chosen == "v2":
-        render_LNF_v2(tx, ty, profondeur, dossier_left, dossier_bas, acc_left, acc_bas,
-                      meridienne_side, meridienne_len, coussins, traversins=traversins, couleurs=couleurs,
-                      window_title=window_title)
-    else:
-        render_LNF_v1(tx, ty, profondeur, dossier_left, dossier_bas, acc_left, acc_bas,
-                      meridienne_side, meridienne_len, coussins, traversins=traversins, couleurs=couleurs,
-                      window_title=window_title)
+        return render_LNF_v2(tx, ty, profondeur, dossier_left, dossier_bas, acc_left, acc_bas,
+                             meridienne_side, meridienne_len, coussins, traversins=traversins, couleurs=couleurs,
+                             window_title=window_title)
+    return render_LNF_v1(tx, ty, profondeur, dossier_left, dossier_bas, acc_left, acc_bas,
+                         meridienne_side, meridienne_len, coussins, traversins=traversins, couleurs=couleurs,
+                         window_title=window_title)
 
 # =====================================================================
 # =====================  U (no fromage) — v1..v4  =====================
@@ -4813,7 +5378,7 @@ def _draw_cushions_variant_U(t, tr, variant, pts, size, drawn, traversins=None):
             (x, y),
         ]
         draw_polygon_cm(
-            t, tr, poly, fill=COLOR_CUSHION, outline=COLOR_CONTOUR, width=1
+            t, tr, poly, fill=_pal("coussins"), outline=COLOR_CONTOUR, width=1
         )
         label_poly(t, tr, poly, f"{size}", font=FONT_CUSHION)
         x += size
@@ -4831,7 +5396,7 @@ def _draw_cushions_variant_U(t, tr, variant, pts, size, drawn, traversins=None):
             (x, y),
         ]
         draw_polygon_cm(
-            t, tr, poly, fill=COLOR_CUSHION, outline=COLOR_CONTOUR, width=1
+            t, tr, poly, fill=_pal("coussins"), outline=COLOR_CONTOUR, width=1
         )
         label_poly(t, tr, poly, f"{size}", font=FONT_CUSHION)
         y += size
@@ -4849,7 +5414,7 @@ def _draw_cushions_variant_U(t, tr, variant, pts, size, drawn, traversins=None):
             (x - CUSHION_DEPTH, y),
         ]
         draw_polygon_cm(
-            t, tr, poly, fill=COLOR_CUSHION, outline=COLOR_CONTOUR, width=1
+            t, tr, poly, fill=_pal("coussins"), outline=COLOR_CONTOUR, width=1
         )
         label_poly(t, tr, poly, f"{size}", font=FONT_CUSHION)
         y += size
@@ -4877,6 +5442,7 @@ def _render_common_U(
     couleurs=None,
     meridienne_side=None,
     meridienne_len=0,
+    geometry=None,
 ):
     """
     Common rendering routine for all U‑shaped sofa variants.
@@ -4886,38 +5452,44 @@ def _render_common_U(
     polygons via ``build_fn``, draws the backs, seats, armrests,
     cushions and traversins, and prints a textual report. The window
     title is augmented to display the méridienne configuration.
+    ``geometry`` may carry an already computed ``(pts, polys, drawn)``
+    (auto selection in ``render_U``), in which case it is reused as is.
     """
-    # Compute points with méridienne parameters
-    pts = compute_fn(
-        tx,
-        ty_left,
-        tz_right,
-        profondeur,
-        dossier_left,
-        dossier_bas,
-        dossier_right,
-        acc_left,
-        acc_bas,
-        acc_right,
-        meridienne_side,
-        meridienne_len,
-    )
-    # Build polygons and drawing flags
-    polys, drawn = build_fn(
-        pts,
-        tx,
-        ty_left,
-        tz_right,
-        profondeur,
-        dossier_left,
-        dossier_bas,
-        dossier_right,
-        acc_left,
-        acc_bas,
-        acc_right,
-    )
+    if geometry is not None:
+        pts, polys, drawn = geometry
+    else:
+        # Compute points with méridienne parameters
+        pts = compute_fn(
+            tx,
+            ty_left,
+            tz_right,
+            profondeur,
+            dossier_left,
+            dossier_bas,
+            dossier_right,
+            acc_left,
+            acc_bas,
+            acc_right,
+            meridienne_side,
+            meridienne_len,
+        )
+        # Build polygons and drawing flags
+        polys, drawn = build_fn(
+            pts,
+            tx,
+            ty_left,
+            tz_right,
+            profondeur,
+            dossier_left,
+            dossier_bas,
+            dossier_right,
+            acc_left,
+            acc_bas,
+            acc_right,
+        )
     # Ensure no seat exceeds maximum length
     _assert_banquettes_max_250(polys)
+    _scene_note("polys", polys)
 
     # Parse traversins and resolve colors
     trv = _parse_traversins_spec(traversins, allowed={"g", "d"})
@@ -4939,11 +5511,11 @@ def _render_common_U(
     # Draw backs, seats and armrests
     for p in polys["dossiers"]:
         if _poly_has_area(p):
-            draw_polygon_cm(t, tr, p, fill=COLOR_DOSSIER)
+            draw_polygon_cm(t, tr, p, fill=_pal("dossiers"))
     for p in polys["banquettes"]:
-        draw_polygon_cm(t, tr, p, fill=COLOR_ASSISE)
+        draw_polygon_cm(t, tr, p, fill=_pal("assise"))
     for p in polys["accoudoirs"]:
-        draw_polygon_cm(t, tr, p, fill=COLOR_ACC)
+        draw_polygon_cm(t, tr, p, fill=_pal("accoudoirs"))
 
     # Draw traversins and count
     n_traversins = _draw_traversins_U_common(
@@ -5000,12 +5572,14 @@ def _render_common_U(
             t, tr, variant, pts, size, drawn, traversins=trv
         )
         total_line = f"{coussins} → {cushions_count} × {size} cm"
+        cushion_sizes = {"total": (cushions_count, size)}
     elif spec["mode"] == "fixed":
         size = int(spec["fixed"])
         cushions_count = _draw_cushions_variant_U(
             t, tr, variant, pts, size, drawn, traversins=trv
         )
         total_line = f"{coussins} → {cushions_count} × {size} cm"
+        cushion_sizes = {"total": (cushions_count, size)}
     else:
         best = _optimize_valise_U(
             variant,
@@ -5039,6 +5613,7 @@ def _render_common_U(
             sizes["droite"],
         )
         total_line = _format_valise_counts_console({"bas": sb, "gauche": sg, "droite": sd}, best["counts"], cushions_count)
+        cushion_sizes = _valise_sizes_report(best)
 
     # Title and legend
     draw_title_center(
@@ -5063,24 +5638,35 @@ def _render_common_U(
         split_flags.get("right", False) and drawn.get("D5")
     )
 
-    # Print report
-    print(f"=== Rapport canapé U (variant {variant}) ===")
-    print(
-        f"Dimensions : tx={tx} / ty(left)={ty_left} / tz(right)={tz_right} — prof={profondeur}"
-    )
-    print(
-        f"Méridienne : {meridienne_side or '-'} ({meridienne_len} cm)"
-    )
-    print(
-        f"Banquettes : {len(polys['banquettes'])} → {banquette_sizes}"
-    )
-    print(
-        f"Dossiers : {len(polys['dossiers'])} (+{add_split} via scission) | Accoudoirs : {len(polys['accoudoirs'])}"
+    # Build report
+    lines = [
+        f"=== Rapport canapé U (variant {variant}) ===",
+        f"Dimensions : tx={tx} / ty(left)={ty_left} / tz(right)={tz_right} — prof={profondeur}",
+        f"Méridienne : {meridienne_side or '-'} ({meridienne_len} cm)",
+        f"Banquettes : {len(polys['banquettes'])} → {banquette_sizes}",
+        f"Dossiers : {len(polys['dossiers'])} (+{add_split} via scission) | Accoudoirs : {len(polys['accoudoirs'])}",
+        "Banquettes d’angle : 0",
+        f"Traversins : {n_traversins} × 70x30",
+        f"Coussins : {total_line}",
+    ]
+    report = _emit_report(
+        f"U {variant}",
+        lines,
+        polys,
+        banquette_sizes,
+        n_traversins,
+        cushions_count,
+        cushion_sizes,
+        tx,
+        ty_left,
+        tz_right,
+        profondeur,
+        meridienne_side=meridienne_side,
+        meridienne_len=meridienne_len,
+        dossiers_scission=add_split,
     )
-    print("Banquettes d’angle : 0")
-    print(f"Traversins : {n_traversins} × 70x30")
-    print(f"Coussins : {total_line}")
     turtle.done()
+    return report
 
 def render_U_v1(
     tx,
@@ -5125,7 +5711,7 @@ def render_U_v1(
             raise ValueError(
                 "Méridienne droite impossible sans dossier droit."
             )
-    _render_common_U(
+    return _render_common_U(
         "v1",
         tx,
         ty_left,
@@ -5188,7 +5774,7 @@ def render_U_v2(
             raise ValueError(
                 "Méridienne droite impossible sans dossier droit."
             )
-    _render_common_U(
+    return _render_common_U(
         "v2",
         tx,
         ty_left,
@@ -5251,7 +5837,7 @@ def render_U_v3(
             raise ValueError(
                 "Méridienne droite impossible sans dossier droit."
             )
-    _render_common_U(
+    return _render_common_U(
         "v3",
         tx,
         ty_left,
@@ -5314,7 +5900,7 @@ def render_U_v4(
             raise ValueError(
                 "Méridienne droite impossible sans dossier droit."
             )
-    _render_common_U(
+    return _render_common_U(
         "v4",
         tx,
         ty_left,
@@ -5337,7 +5923,16 @@ def render_U_v4(
     )
 
 # ---------- AUTO sélection U ----------
-def _metrics_U(
+def _U_variant_fns(variant):
+    """(compute_points_U_vN, build_polys_U_vN) d'une variante U."""
+    return {
+        "v1": (compute_points_U_v1, build_polys_U_v1),
+        "v2": (compute_points_U_v2, build_polys_U_v2),
+        "v3": (compute_points_U_v3, build_polys_U_v3),
+        "v4": (compute_points_U_v4, build_polys_U_v4),
+    }[variant]
+
+def _dry_polys_for_U_variant(
     variant,
     tx,
     ty_left,
@@ -5353,32 +5948,10 @@ def _metrics_U(
     meridienne_len=0,
 ):
     """
-    Compute metrics used to automatically select the best U‑shaped sofa variant.
-
-    Returns a 4‑tuple:
-      (nb_banquettes, scissions, nb_le_200, ok)
-
-    - nb_banquettes : number of seat polygons after internal splits
-    - scissions     : number of extra splits beyond the base 3 (left, bottom, right)
-    - nb_le_200     : number of seats whose longest dimension ≤ 200 cm
-    - ok            : True if no seat exceeds MAX_BANQUETTE (250 cm), False otherwise
-
-    Additional parameters ``meridienne_side`` and ``meridienne_len`` are
-    forwarded to the geometry computation to account for a méridienne.
+    Compute ``(pts, polys, drawn)`` for one U variant without drawing it,
+    so that variants can be compared and the chosen one rendered as is.
     """
-    comp = {
-        "v1": compute_points_U_v1,
-        "v2": compute_points_U_v2,
-        "v3": compute_points_U_v3,
-        "v4": compute_points_U_v4,
-    }[variant]
-    build = {
-        "v1": build_polys_U_v1,
-        "v2": build_polys_U_v2,
-        "v3": build_polys_U_v3,
-        "v4": build_polys_U_v4,
-    }[variant]
-
+    comp, build = _U_variant_fns(variant)
     pts = comp(
         tx,
         ty_left,
@@ -5393,7 +5966,7 @@ def _metrics_U(
         meridienne_side,
         meridienne_len,
     )
-    polys, _ = build(
+    polys, drawn = build(
         pts,
         tx,
         ty_left,
@@ -5406,6 +5979,57 @@ def _metrics_U(
         acc_bas,
         acc_right,
     )
+    return pts, polys, drawn
+
+def _metrics_U(
+    variant,
+    tx,
+    ty_left,
+    tz_right,
+    profondeur,
+    dossier_left,
+    dossier_bas,
+    dossier_right,
+    acc_left,
+    acc_bas,
+    acc_right,
+    meridienne_side=None,
+    meridienne_len=0,
+    geometry=None,
+):
+    """
+    Compute metrics used to automatically select the best U‑shaped sofa variant.
+
+    Returns a 4‑tuple:
+      (nb_banquettes, scissions, nb_le_200, ok)
+
+    - nb_banquettes : number of seat polygons after internal splits
+    - scissions     : number of extra splits beyond the base 3 (left, bottom, right)
+    - nb_le_200     : number of seats whose longest dimension ≤ 200 cm
+    - ok            : True if no seat exceeds MAX_BANQUETTE (250 cm), False otherwise
+
+    Additional parameters ``meridienne_side`` and ``meridienne_len`` are
+    forwarded to the geometry computation to account for a méridienne.
+    ``geometry`` is an already computed ``(pts, polys, drawn)`` for this
+    variant (see ``_dry_polys_for_U_variant``); computed here otherwise.
+    """
+    if geometry is None:
+        geometry = _dry_polys_for_U_variant(
+            variant,
+            tx,
+            ty_left,
+            tz_right,
+            profondeur,
+            dossier_left,
+            dossier_bas,
+            dossier_right,
+            acc_left,
+            acc_bas,
+            acc_right,
+            meridienne_side,
+            meridienne_len,
+        )
+    polys = geometry[1]
 
     nb_banquettes = len(polys["banquettes"])
     scissions = max(0, nb_banquettes - 3)
@@ -5499,8 +6123,27 @@ def render_U(
             meridienne_len=meridienne_len,
         )
 
-    # Automatic variant selection
+    # Automatic variant selection: each variant's geometry is computed once,
+    # scored, and the chosen one is handed to the renderer as is
     variants = ["v1", "v2", "v3", "v4"]
+    geometries = {
+        vv: _dry_polys_for_U_variant(
+            vv,
+            tx,
+            ty_left,
+            tz_right,
+            profondeur,
+            dossier_left,
+            dossier_bas,
+            dossier_right,
+            acc_left,
+            acc_bas,
+            acc_right,
+            meridienne_side,
+            meridienne_len,
+        )
+        for vv in variants
+    }
     metrics = {
         vv: _metrics_U(
             vv,
@@ -5516,6 +6159,7 @@ def render_U(
             acc_right,
             meridienne_side,
             meridienne_len,
+            geometry=geometries[vv],
         )
         for vv in variants
     }
@@ -5546,8 +6190,11 @@ def render_U(
     if choice is None:
         choice = tied[0]
 
-    # Delegate to the chosen variant
-    return render_U(
+    # Render the chosen variant from its dry-run geometry (same title and
+    # validations as render_U(..., variant=choice))
+    compute_fn, build_fn = _U_variant_fns(choice)
+    return _render_common_U(
+        choice,
         tx,
         ty_left,
         tz_right,
@@ -5559,12 +6206,14 @@ def render_U(
         acc_bas,
         acc_right,
         coussins,
-        variant=choice,
+        f"{window_title} [{choice}]",
+        compute_fn,
+        build_fn,
         traversins=traversins,
         couleurs=couleurs,
-        window_title=window_title,
         meridienne_side=meridienne_side,
         meridienne_len=meridienne_len,
+        geometry=geometries[choice],
     )
 
 # =====================================================================
@@ -5657,6 +6306,8 @@ def build_polys_simple_S1(pts, dossier=True, acc_left=True, acc_right=True,
 
 def _choose_cushion_size_auto_simple_S1(x0, x1):
     usable = max(0, x1 - x0)
+    if _tabulated(usable):
+        return _cushion_tables()["auto_simple"][usable]
     best, best_score = 65, (1e9, -1)
     for s in (65, 80, 90):
         waste = usable % s if usable > 0 else 0
@@ -5686,7 +6337,7 @@ def _draw_coussins_simple_S1(t, tr, pts, size,
     x = x0 + off; n = 0
     while x + size <= x1 + 1e-6:
         poly = [(x, y), (x+size, y), (x+size, y+CUSHION_DEPTH), (x, y+CUSHION_DEPTH), (x, y)]
-        draw_polygon_cm(t, tr, poly, fill=COLOR_CUSHION, outline=COLOR_CONTOUR, width=1)
+        draw_polygon_cm(t, tr, poly, fill=_pal("coussins"), outline=COLOR_CONTOUR, width=1)
         label_poly(t, tr, poly, f"{size}", font=FONT_CUSHION)
         x += size; n += 1
     return n
@@ -5705,6 +6356,7 @@ def render_Simple1(tx,
     polys = build_polys_simple_S1(pts, dossier, acc_left, acc_right,
                                   meridienne_side, meridienne_len)
     _assert_banquettes_max_250(polys)
+    _scene_note("polys", polys)
 
     trv = _parse_traversins_spec(traversins, allowed={"g","d"})
     legend_items = _resolve_and_apply_colors(couleurs)
@@ -5722,11 +6374,11 @@ def render_Simple1(tx,
     # (Quadrillage et repères supprimés)
 
     for p in polys["dossiers"]:
-        if _poly_has_area(p):  draw_polygon_cm(t, tr, p, fill=COLOR_DOSSIER)
+        if _poly_has_area(p):  draw_polygon_cm(t, tr, p, fill=_pal("dossiers"))
     for p in polys["banquettes"]:
-        draw_polygon_cm(t, tr, p, fill=COLOR_ASSISE)
+        draw_polygon_cm(t, tr, p, fill=_pal("assise"))
     for p in polys["accoudoirs"]:
-        draw_polygon_cm(t, tr, p, fill=COLOR_ACC)
+        draw_polygon_cm(t, tr, p, fill=_pal("accoudoirs"))
 
     # Traversins + comptage (on travaille avec la profondeur totale)
     n_traversins = _draw_traversins_simple_S1(t, tr, pts, prof_tot, dossier, trv)
@@ -5770,10 +6422,12 @@ def render_Simple1(tx,
         size = _choose_cushion_size_auto_simple_S1(x0, x1)
         nb_coussins = _draw_coussins_simple_S1(t, tr, pts, size, meridienne_side, meridienne_len, traversins=trv)
         total_line = f"{coussins} → {nb_coussins} × {size} cm"
+        cushion_sizes = {"total": (nb_coussins, size)}
     elif spec["mode"] == "fixed":
         size = int(spec["fixed"])
         nb_coussins = _draw_coussins_simple_S1(t, tr, pts, size, meridienne_side, meridienne_len, traversins=trv)
         total_line = f"{coussins} → {nb_coussins} × {size} cm"
+        cushion_sizes = {"total": (nb_coussins, size)}
     else:
         best = _optimize_valise_simple(pts, spec["range"], meridienne_side, meridienne_len, traversins=trv)
         if not best:
@@ -5781,19 +6435,394 @@ def render_Simple1(tx,
         size = best["size"]
         nb_coussins = _draw_simple_with_size(t, tr, pts, size, meridienne_side, meridienne_len, traversins=trv)
         total_line = f"{nb_coussins} × {size} cm"
+        cushion_sizes = {"total": (nb_coussins, size)}
 
     # Légende
     draw_legend(t, tr, tx, profondeur, items=legend_items, pos="top-right")
 
     screen.tracer(True); t.hideturtle()
     add_split = int(polys.get("split_flags",{}).get("center",False) and dossier)
-    print("=== Rapport Canapé simple 1 ===")
-    print(f"Dimensions : {tx}×{profondeur} cm")
-    print(f"Banquettes : {len(polys['banquettes'])} → {banquette_sizes}")
-    print(f"Dossiers   : {len(polys['dossiers'])} (+{add_split} via scission)  |  Accoudoirs : {len(polys['accoudoirs'])}")
-    print(f"Banquettes d’angle : 0")
-    print(f"Traversins : {n_traversins} × 70x30")
-    print(f"Coussins   : {total_line}")
+    lines = [
+        "=== Rapport Canapé simple 1 ===",
+        f"Dimensions : {tx}×{profondeur} cm",
+        f"Banquettes : {len(polys['banquettes'])} → {banquette_sizes}",
+        f"Dossiers   : {len(polys['dossiers'])} (+{add_split} via scission)  |  Accoudoirs : {len(polys['accoudoirs'])}",
+        f"Banquettes d’angle : 0",
+        f"Traversins : {n_traversins} × 70x30",
+        f"Coussins   : {total_line}",
+    ]
     if meridienne_side:
-        print(f"Méridienne : côté {'gauche' if meridienne_side=='g' else 'droit'} — {meridienne_len} cm")
+        lines.append(f"Méridienne : côté {'gauche' if meridienne_side=='g' else 'droit'} — {meridienne_len} cm")
+    report = _emit_report("Simple", lines, polys, banquette_sizes, n_traversins, nb_coussins, cushion_sizes,
+                          tx, profondeur=profondeur,
+                          meridienne_side=meridienne_side, meridienne_len=meridienne_len,
+                          dossiers_scission=add_split)
     turtle.done()
+    return report
+
+# =====================================================================
+# ================  Rendu "headless" (sans pyplot)  ===================
+# =====================================================================
+
+def render_canape(type_canape, tx, ty=None, tz=None, profondeur=DEPTH_STD,
+                  acc_left=True, acc_right=True, acc_bas=True,
+                  dossier_left=True, dossier_bas=True, dossier_right=True,
+                  meridienne_side=None, meridienne_len=0,
+                  coussins="auto", traversins=None, couleurs=None):
+    """
+    Aiguillage par libellé de modèle (ceux du configurateur : "Simple (S)", "L - Sans Angle",
+    "L - Avec Angle (LF)", "U - Sans Angle", "U - 1 Angle (U1F)", "U - 2 Angles (U2F)").
+    Retourne le CanapeReport du rendu.
+    """
+    if "Simple" in type_canape:
+        return render_Simple1(tx=tx, profondeur=profondeur, dossier=dossier_bas,
+            acc_left=acc_left, acc_right=acc_right,
+            meridienne_side=meridienne_side, meridienne_len=meridienne_len,
+            coussins=coussins, traversins=traversins, window_title="Canapé Simple",
+            couleurs=couleurs)
+    elif "L - Sans Angle" in type_canape:
+        return render_LNF(tx=tx, ty=ty, profondeur=profondeur,
+            dossier_left=dossier_left, dossier_bas=dossier_bas,
+            acc_left=acc_left, acc_bas=acc_bas,
+            meridienne_side=meridienne_side, meridienne_len=meridienne_len,
+            coussins=coussins, variant="auto", traversins=traversins, window_title="L - Sans Angle",
+            couleurs=couleurs)
+    elif "L - Avec Angle" in type_canape:
+        return render_LF_variant(tx=tx, ty=ty, profondeur=profondeur,
+            dossier_left=dossier_left, dossier_bas=dossier_bas,
+            acc_left=acc_left, acc_bas=acc_bas,
+            meridienne_side=meridienne_side, meridienne_len=meridienne_len,
+            coussins=coussins, traversins=traversins, window_title="L - Avec Angle",
+            couleurs=couleurs)
+    elif "U - Sans Angle" in type_canape:
+        return render_U(tx=tx, ty_left=ty, tz_right=tz, profondeur=profondeur,
+            dossier_left=dossier_left, dossier_bas=dossier_bas, dossier_right=dossier_right,
+            acc_left=acc_left, acc_bas=acc_bas, acc_right=acc_right,
+            coussins=coussins, variant="auto", traversins=traversins, window_title="U - Sans Angle",
+            couleurs=couleurs)
+    elif "U - 1 Angle" in type_canape:
+        return render_U1F_v1(tx=tx, ty=ty, tz=tz, profondeur=profondeur,
+            dossier_left=dossier_left, dossier_bas=dossier_bas, dossier_right=dossier_right,
+            acc_left=acc_left, acc_right=acc_right,
+            meridienne_side=meridienne_side, meridienne_len=meridienne_len,
+            coussins=coussins, traversins=traversins, window_title="U - 1 Angle",
+            couleurs=couleurs)
+    elif "U - 2 Angles" in type_canape:
+        return render_U2f_variant(tx=tx, ty_left=ty, tz_right=tz, profondeur=profondeur,
+            dossier_left=dossier_left, dossier_bas=dossier_bas, dossier_right=dossier_right,
+            acc_left=acc_left, acc_bas=acc_bas, acc_right=acc_right,
+            meridienne_side=meridienne_side, meridienne_len=meridienne_len,
+            coussins=coussins, traversins=traversins, window_title="U - 2 Angles",
+            couleurs=couleurs)
+    else:
+        raise ValueError(f"Type de canapé inconnu : {type_canape}")
+
+
+# =====================================================================
+# ================  Scene : mise en page séparée du dessin  ===========
+# =====================================================================
+
+class _FrozenDict(dict):
+    """dict en lecture seule (reste picklable : caches, pools de processus)."""
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("Scene : dictionnaire en lecture seule")
+    __setitem__ = __delitem__ = clear = pop = popitem = setdefault = update = _readonly
+
+    def __reduce__(self):
+        return (_FrozenDict, (dict(self),))
+
+
+# Destination des rapports de rendu (débogage) : None = aucun affichage,
+# print = ancien rapport console ; toute fonction acceptant une chaîne convient.
+REPORT_SINK = None
+
+
+@dataclass(frozen=True)
+class CanapeReport:
+    """
+    Rapport d'un rendu, retourné par chaque render_* (et porté par la Scene d'un layout_*) :
+      - model             : "Simple", "LNF", "LF", "U v1"…"U v4", "U1F v1"…"U1F v4", "U2f"
+      - dimensions        : {"tx", "ty", "tz", "profondeur"} en cm (None si sans objet)
+      - meridienne        : (côté, longueur) ou None
+      - banquettes        : ((longueur, profondeur), …) en cm, dans l'ordre des polygones
+      - dossiers          : nombre de dossiers (LNF : un retour sans dossier gauche compte 0.5)
+      - dossiers_scission : dossiers supplémentaires dus aux scissions
+      - split_flags       : indicateurs de scission de la géométrie ({"left": True, …})
+      - accoudoirs, angles, traversins : comptages ; angle_size : côté A des angles (cm) ou None
+      - coussins          : nombre total de coussins
+      - coussins_sizes    : {côté: (nombre, taille)} en mode valise, {"total": (nombre, taille)} sinon
+      - lines             : lignes du rapport texte (str(report)), envoyé à REPORT_SINK
+    """
+    model: str
+    dimensions: _FrozenDict
+    meridienne: tuple
+    banquettes: tuple
+    dossiers: float
+    dossiers_scission: int
+    split_flags: _FrozenDict
+    accoudoirs: int
+    angles: int
+    angle_size: int
+    traversins: int
+    coussins: int
+    coussins_sizes: _FrozenDict
+    lines: tuple
+
+    def __str__(self):
+        return "\n".join(self.lines)
+
+
+def _valise_sizes_report(best):
+    """coussins_sizes d'un CanapeReport pour un résultat d'optimiseur valise : {côté: (nombre, taille)}."""
+    return {side: (best["counts"].get(side, 0), size) for side, size in best["sizes"].items()}
+
+
+def _emit_report(model, lines, polys, banquettes, traversins, coussins, coussins_sizes,
+                 tx, ty=None, tz=None, profondeur=None, meridienne_side=None, meridienne_len=0,
+                 dossiers=None, dossiers_scission=0, angles=0, angle_size=None):
+    """Assemble le CanapeReport d'un rendu et le transmet à REPORT_SINK s'il est défini."""
+    report = CanapeReport(
+        model=model,
+        dimensions=_FrozenDict(tx=tx, ty=ty, tz=tz, profondeur=profondeur),
+        meridienne=(meridienne_side, meridienne_len) if meridienne_side else None,
+        banquettes=tuple(tuple(b) for b in banquettes),
+        dossiers=len(polys["dossiers"]) if dossiers is None else dossiers,
+        dossiers_scission=dossiers_scission,
+        split_flags=_FrozenDict(polys.get("split_flags", {})),
+        accoudoirs=len(polys["accoudoirs"]),
+        angles=angles,
+        angle_size=angle_size,
+        traversins=traversins,
+        coussins=coussins,
+        coussins_sizes=_FrozenDict(coussins_sizes),
+        lines=tuple(lines),
+    )
+    if REPORT_SINK is not None:
+        REPORT_SINK(str(report))
+    return report
+
+
+@dataclass(frozen=True)
+class Scene:
+    """
+    Résultat immuable d'un layout_* : géométrie, coussins, cotes et comptages d'un canapé,
+    indépendants de la palette et du backend de dessin.
+      - polys      : {"banquettes"|"dossiers"|"accoudoirs"|"angle"|…: (polygone, …)} en cm
+      - cushions   : ((x0, y0, x1, y1, taille), …) en cm
+      - traversins : ((x0, y0, x1, y1), …) en cm
+      - arrows     : ((x0, y0, x1, y1, libellé), …) en cm
+      - labels     : ((x, y, texte), …) en cm
+      - counts     : comptages dérivés (banquettes, dossiers, accoudoirs, angles, coussins, …)
+      - ops        : primitives enregistrées (px), rejouées par draw() sur un écran
+      - report     : CanapeReport retourné par le render_* (comptages et tailles de coussins)
+    """
+    model: str
+    title: str
+    width: float
+    height: float
+    polys: _FrozenDict
+    cushions: tuple
+    traversins: tuple
+    arrows: tuple
+    labels: tuple
+    counts: _FrozenDict
+    ops: tuple
+    report: CanapeReport = None
+
+    def draw(self, screen, couleurs=None):
+        """Rejoue la scène sur `screen` (_Screen, _SvgScreen, _RLScreen) avec la palette `couleurs`."""
+        pal = _resolve_palette(couleurs)
+        colors = {ph[0]: pal[key][0] for key, ph in _PALETTE_PLACEHOLDERS.items()}
+        names = {f" ({ph[1]})": (f" ({pal[key][1]})" if pal[key][1] else "")
+                 for key, ph in _PALETTE_PLACEHOLDERS.items()}
+
+        def _sub(v):
+            if isinstance(v, str):
+                if v in colors:
+                    return colors[v]
+                if "(@" in v:
+                    for ph, name in names.items():
+                        v = v.replace(ph, name)
+            return v
+
+        screen.setup(self.width, self.height)
+        screen.title(self.title)
+        for method, args in self.ops:
+            getattr(screen, method)(*[_sub(a) for a in args])
+        screen.finish()
+        return screen
+
+
+def _freeze_polys(polys):
+    """Copie figée des polygones ; la clé "angles" (U2f) est ramenée à "angle" comme ailleurs."""
+    frozen = {}
+    for key, val in polys.items():
+        key = "angle" if key == "angles" else key
+        if isinstance(val, list):
+            frozen[key] = tuple(tuple(tuple(p) for p in poly) for poly in val)
+        elif isinstance(val, dict):
+            frozen[key] = _FrozenDict(val)
+    return _FrozenDict(frozen)
+
+
+def _layout(model, render_fn, *args, **kwargs):
+    """Exécute `render_fn` sur l'écran d'enregistrement et assemble la Scene."""
+    with _render_context(backend="scene", headless=True, notes={}) as ctx:
+        report = render_fn(*args, **kwargs)
+    screen, notes = ctx.finished, ctx.notes
+    if screen is None:
+        raise ValueError("Le rendu n'a produit aucune scène.")
+
+    polys = _freeze_polys(notes["polys"][-1] if notes.get("polys") else {})
+    cushions = []
+    for poly in notes.get("cushions", []):
+        xs = [x for x, _ in poly]; ys = [y for _, y in poly]
+        x0, x1, y0, y1 = min(xs), max(xs), min(ys), max(ys)
+        cushions.append((x0, y0, x1, y1, int(round(max(x1 - x0, y1 - y0)))))
+    split_flags = polys.get("split_flags", {})
+    counts = {
+        "banquettes": len(polys.get("banquettes", ())),
+        "dossiers":   sum(1 for p in polys.get("dossiers", ()) if _poly_has_area(p)),
+        "accoudoirs": sum(1 for p in polys.get("accoudoirs", ()) if _poly_has_area(p)),
+        "angles":     len(polys.get("angle", ())),
+        "coussins":   len(cushions),
+        "traversins": len(notes.get("traversins", [])),
+        "scission":   any(bool(v) for v in split_flags.values()),
+    }
+    return Scene(model=model, title=screen._title, width=screen.width, height=screen.height,
+                 polys=polys, cushions=tuple(cushions),
+                 traversins=tuple(notes.get("traversins", [])),
+                 arrows=tuple(notes.get("arrows", [])),
+                 labels=tuple(notes.get("labels", [])),
+                 counts=_FrozenDict(counts), ops=tuple(screen.ops), report=report)
+
+
+def layout_Simple(*args, **kwargs):
+    """Scene d'un canapé simple (mêmes arguments que render_Simple1)."""
+    return _layout("Simple", render_Simple1, *args, **kwargs)
+
+def layout_LNF(*args, **kwargs):
+    """Scene d'un L sans angle (mêmes arguments que render_LNF)."""
+    return _layout("LNF", render_LNF, *args, **kwargs)
+
+def layout_LF(*args, **kwargs):
+    """Scene d'un L avec angle (mêmes arguments que render_LF_variant)."""
+    return _layout("LF", render_LF_variant, *args, **kwargs)
+
+def layout_U(*args, **kwargs):
+    """Scene d'un U sans angle (mêmes arguments que render_U)."""
+    return _layout("U", render_U, *args, **kwargs)
+
+def layout_U1F(*args, **kwargs):
+    """Scene d'un U avec un angle (mêmes arguments que render_U1F_v1)."""
+    return _layout("U1F", render_U1F_v1, *args, **kwargs)
+
+def layout_U2f(*args, **kwargs):
+    """Scene d'un U avec deux angles (mêmes arguments que render_U2f_variant)."""
+    return _layout("U2f", render_U2f_variant, *args, **kwargs)
+
+
+def _render_kwargs(config):
+    """Arguments de render_canape : `config` est un dict, ou une QuoteConfig (quote_config.py)."""
+    return config.render_config() if hasattr(config, "render_config") else config
+
+
+def layout_canape(config):
+    """Scene à partir d'une configuration render_canape ou QuoteConfig (la palette `couleurs` est ignorée)."""
+    config = {k: v for k, v in _render_kwargs(config).items() if k != "couleurs"}
+    return _layout(config["type_canape"], render_canape, **config)
+
+
+def render_schema(config, fmt="png", dpi=150, backend="matplotlib", scene=None):
+    """
+    Rend le schéma décrit par `config` (dict des arguments de render_canape, ou QuoteConfig) et retourne
+    les octets de l'image (fmt : "png", "svg", "pdf"…). `scene` : Scene déjà calculée
+    (layout_canape) à réutiliser — seule la palette de `config` est alors appliquée.
+    - backend="matplotlib" : Figure + canvas Agg construits directement — aucun état pyplot,
+      aucun plt.show(), figure toujours libérée → utilisable depuis des threads.
+    - backend="svg" : émetteur SVG pur Python, sans Matplotlib (fmt doit valoir "svg", dpi ignoré).
+    """
+    if backend not in ("matplotlib", "svg"):
+        raise ValueError(f"Backend de rendu inconnu : {backend}")
+    if backend == "svg" and fmt != "svg":
+        raise ValueError("Le backend SVG ne produit que fmt='svg'.")
+    config = _render_kwargs(config)
+    if scene is None:
+        scene = layout_canape(config)
+    if backend == "svg":
+        return scene.draw(_SvgScreen(), config.get("couleurs")).to_svg().encode("utf-8")
+    screen = _Screen(headless=True)
+    try:
+        scene.draw(screen, config.get("couleurs"))
+        buf = BytesIO()
+        screen.fig.savefig(buf, format=fmt, dpi=dpi, bbox_inches="tight")
+        return buf.getvalue()
+    finally:
+        screen.fig.clear()
+
+
+def render_drawing(config, scene=None):
+    """
+    Rend le schéma en reportlab.graphics.shapes.Drawing (vectoriel, recadré sur le contenu),
+    à insérer tel quel comme flowable dans un PDF — sans Matplotlib ni rastérisation.
+    """
+    config = _render_kwargs(config)
+    if scene is None:
+        scene = layout_canape(config)
+    return scene.draw(_RLScreen(), config.get("couleurs")).to_drawing()
+
+
+# Temps (ms) du dernier prechauffer() de ce processus, par étape ; None s'il n'a pas été appelé
+PRECHAUFFAGE = None
+
+
+def prechauffer(dpi=150, vectoriel=False):
+    """
+    À appeler au démarrage d'un serveur ou d'un processus de travail : fait d'avance ce que
+    paie sinon le premier schéma — import de Matplotlib, recherche des polices (FontManager
+    et son cache), mise en page du texte de chaque police FONT_*, premier canvas Agg et PNG,
+    tables de coussins. vectoriel=True prépare aussi render_drawing (ReportLab graphics).
+    Retourne (et garde dans PRECHAUFFAGE) les temps par étape, en ms.
+    """
+    global PRECHAUFFAGE
+    temps = {}
+    t0 = time.perf_counter()
+
+    def _etape(nom):
+        nonlocal t0
+        t = time.perf_counter()
+        temps[nom] = (t - t0) * 1000
+        t0 = t
+
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+    _etape("matplotlib")
+
+    # petite scène jetable : un remplissage, un cadre arrondi, un trait et un texte par police
+    polices = [FONT_LABEL, FONT_CUSHION, FONT_DIM, FONT_LEGEND, FONT_TITLE]
+    carre = ((-80.0, -40.0), (80.0, -40.0), (80.0, 40.0), (-80.0, 40.0))
+    ops = [("add_fill", (carre, "@assise", "black", LINE_WIDTH)),
+           ("add_rounded_rect", (-60.0, -30.0, 60.0, 30.0, 8.0, "@coussins", "black", 1)),
+           ("add_segment", (-80.0, -50.0, 80.0, -50.0, "black", LINE_WIDTH))]
+    ops += [("add_text", (0.0, 40.0 - 16.0 * i, "Canapé 280 x 70", "center", font))
+            for i, font in enumerate(polices)]
+    scene = Scene(model="prechauffage", title="Canapé", width=200.0, height=120.0,
+                  polys=_FrozenDict(), cushions=(), traversins=(), arrows=(), labels=(),
+                  counts=_FrozenDict(), ops=tuple(ops))
+    screen = _Screen(headless=True)
+    try:
+        scene.draw(screen)
+        screen.fig.savefig(BytesIO(), format="png", dpi=dpi, bbox_inches="tight")
+    finally:
+        screen.fig.clear()
+    _etape("polices_agg")
+
+    _cushion_tables()
+    _etape("tables")
+
+    if vectoriel:
+        scene.draw(_RLScreen()).to_drawing()
+        _etape("drawing")
+
+    PRECHAUFFAGE = temps
+    return temps
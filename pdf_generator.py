@@ -1,144 +1,260 @@
 from reportlab.lib.pagesizes import A4
 from reportlab.lib import colors
 from reportlab.lib.units import cm
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, Image
+from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, Image, Frame
+from reportlab.pdfgen.canvas import Canvas
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
+from reportlab.graphics.shapes import Drawing
+from reportlab.platypus.flowables import Flowable
+from reportlab.lib.utils import ImageReader
 from io import BytesIO
 from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
+from functools import lru_cache
 import os
 
+from quote_config import QuoteConfig
+
+# Police et images de mousse sont cherchées à côté de ce module, quel que soit le répertoire courant
+DOSSIER_RESSOURCES = os.path.dirname(os.path.abspath(__file__))
+
 # --- POLICE UNICODE ---
 FONT_NAME_UNICODE = 'DejaVuSans'
-FONT_FILE = 'DejaVuSans.ttf'
+FONT_FILE = os.path.join(DOSSIER_RESSOURCES, 'DejaVuSans.ttf')
+
 
-if os.path.exists(FONT_FILE):
-    pdfmetrics.registerFont(TTFont(FONT_NAME_UNICODE, FONT_FILE))
-    BASE_FONT = FONT_NAME_UNICODE
-else:
-    BASE_FONT = 'Helvetica'
+@lru_cache(maxsize=None)
+def police_de_base():
+    """
+    Police des devis, enregistrée auprès de ReportLab au premier devis (et non à l'import) :
+    DejaVuSans (Unicode) si le fichier est présent, sinon Helvetica.
+    """
+    if os.path.exists(FONT_FILE):
+        pdfmetrics.registerFont(TTFont(FONT_NAME_UNICODE, FONT_FILE))
+        return FONT_NAME_UNICODE
     print(f"ATTENTION : Le fichier de police {FONT_FILE} est introuvable.")
+    return 'Helvetica'
 # ----------------------
 
 # --- MAPPING DES IMAGES ---
 IMAGE_FILES = {
-    'D25': 'D25.png',
-    'D30': 'D30.png',
-    'HR35': 'HR35.png',
-    'HR45': 'HR45.png'
+    'D25': os.path.join(DOSSIER_RESSOURCES, 'D25.png'),
+    'D30': os.path.join(DOSSIER_RESSOURCES, 'D30.png'),
+    'HR35': os.path.join(DOSSIER_RESSOURCES, 'HR35.png'),
+    'HR45': os.path.join(DOSSIER_RESSOURCES, 'HR45.png')
 }
 
+DESCRIPTIONS_MOUSSE = {
+    'D25': "La mousse D25 est une mousse polyuréthane de 25kg/m3. Elle est très ferme, parfaite pour les habitués des banquettes marocaines classiques.",
+    'D30': "La mousse D30 est une mousse polyuréthane de 30kg/m3. Elle est ultra ferme, idéale pour ceux qui recherchent un canapé très ferme.",
+    'HR35': "La mousse HR35 est une mousse haute résilience de 35kg/m3. Elle est semi ferme confortable, parfaite pour les adeptes des salons confortables.<br/>Les mousses haute résilience reprennent rapidement leur forme initiale et donc limitent l’affaissement dans le temps.",
+    'HR45': "La mousse HR45 est une mousse haute résilience de 45kg/m3. Elle est ferme confortable, parfaite pour les adeptes des salons confortables mais pas trop moelleux.<br/>Les mousses haute résilience reprennent rapidement leur forme initiale et donc limitent l’affaissement dans le temps."
+}
 
-def generer_pdf_devis(config, prix_details, schema_image=None):
+# --- TEXTES FIXES DU PIED DE PAGE ---
+INCLUS_ITEMS = [
+    "Livraison bas d'immeuble",
+    "Fabrication 100% artisanale France",
+    "Choix du tissu n'impacte pas le devis",
+    "Paiement 2 à 6 fois sans frais",
+    "Livraison 5 à 7 semaines",
+    "Housses déhoussables"
+]
+
+COTATIONS_FIXES = [
+    "Accoudoir: 15cm large / 60cm haut",
+    "Dossier: 10cm large / 70cm haut",
+    "Coussins: 65/80/90cm large",
+]
+
+# Nom du formulaire PDF (XObject) de la partie fixe du pied de page
+FORM_PIED = "PiedDevis"
+
+class _ImageMousse(Flowable):
     """
-    Génère un PDF de devis (1 page) avec un pied de page fixe en bas et des images de mousse.
+    Image de mousse dessinée depuis un ImageReader partagé : le PNG est lu et décodé une seule
+    fois ; canvas.drawImage encode l'image une fois par document et la réutilise par son nom.
     """
-    buffer = BytesIO()
-    
-    doc = SimpleDocTemplate(buffer, pagesize=A4,
-                           rightMargin=1*cm, leftMargin=1*cm,
-                           topMargin=1*cm, bottomMargin=6*cm)
-    
-    elements = []
-    styles = getSampleStyleSheet()
-    
-    # --- DÉFINITION DES STYLES ---
-    title_style = ParagraphStyle(
-        'CustomTitle', parent=styles['Heading1'], fontSize=14, textColor=colors.black, 
-        spaceAfter=5, alignment=TA_CENTER, fontName=BASE_FONT + '-Bold'
-    )
-    
-    header_info_style = ParagraphStyle(
-        'HeaderInfo', parent=styles['Normal'], fontSize=12, leading=14, 
-        textColor=colors.black, alignment=TA_CENTER, fontName=BASE_FONT
-    )
-    
-    price_style = ParagraphStyle(
-        'PriceStyle', parent=styles['Heading2'], fontSize=16, alignment=TA_CENTER, 
-        fontName=BASE_FONT, textColor=colors.black, spaceBefore=10, spaceAfter=10
-    )
-    
-    # Style de description de mousse
-    description_mousse_style = ParagraphStyle(
-        'MousseDesc', parent=styles['Normal'], fontSize=12, leading=12, 
-        textColor=colors.black, alignment=TA_LEFT, fontName=BASE_FONT
-    )
-    
-    # Styles pour le pied de page
-    column_header_style = ParagraphStyle(
-        'ColumnHeaderStyle', parent=styles['Normal'], fontSize=12, alignment=TA_LEFT, 
-        fontName=BASE_FONT + '-Bold', spaceAfter=10
-    )
-
-    detail_style = ParagraphStyle(
-        'DetailStyle', parent=styles['Normal'], fontSize=12, leading=12, 
-        textColor=colors.black, alignment=TA_LEFT, fontName=BASE_FONT
-    )
-    
-    footer_style = ParagraphStyle(
-        'FooterStyle', parent=styles['Normal'], fontSize=12, textColor=colors.black, 
-        alignment=TA_CENTER, spaceBefore=10, fontName=BASE_FONT
-    )
+    def __init__(self, reader, width, height, mask="auto"):
+        Flowable.__init__(self)
+        self.reader, self.mask = reader, mask
+        self.drawWidth, self.drawHeight = width, height
 
-    # --- FONCTION INTERNE POUR DESSINER LE PIED DE PAGE FIXE ---
-    def draw_footer(canvas, doc):
-        canvas.saveState()
+    def wrap(self, availWidth, availHeight):
+        return self.drawWidth, self.drawHeight
+
+    def draw(self):
+        self.canv.drawImage(self.reader, 0, 0, self.drawWidth, self.drawHeight, mask=self.mask)
+
+
+class _GabaritDevis:
+    """
+    Parties fixes d'un document de devis : feuille de styles, paragraphes statiques du pied
+    de page et images de mousse. Construit pour chaque document (un devis, ou toutes les pages
+    d'un catalogue) : le garder d'un devis à l'autre ne fait rien gagner de mesurable, le temps
+    d'un devis allant surtout à l'encodage de l'image de mousse, refait par chaque document.
+    """
+    def __init__(self):
+        self.styles = styles = getSampleStyleSheet()
+        base_font = police_de_base()
+
+        # --- DÉFINITION DES STYLES ---
+        self.title_style = ParagraphStyle(
+            'CustomTitle', parent=styles['Heading1'], fontSize=14, textColor=colors.black, 
+            spaceAfter=5, alignment=TA_CENTER, fontName=base_font + '-Bold'
+        )
         
-        # 1. Préparation des données des colonnes
+        self.header_info_style = ParagraphStyle(
+            'HeaderInfo', parent=styles['Normal'], fontSize=12, leading=14, 
+            textColor=colors.black, alignment=TA_CENTER, fontName=base_font
+        )
         
-        # Colonne Gauche
-        col_gauche = []
-        col_gauche.append(Paragraph("Il faut savoir que le tarif comprend :", column_header_style))
-        inclus_items = [
-            "Livraison bas d'immeuble",
-            "Fabrication 100% artisanale France",
-            "Choix du tissu n'impacte pas le devis",
-            "Paiement 2 à 6 fois sans frais",
-            "Livraison 5 à 7 semaines",
-            "Housses déhoussables"
-        ]
-        for item in inclus_items:
-            col_gauche.append(Paragraph(f"• {item}", detail_style))
-
-        # Colonne Droite
-        col_droite = []
-        col_droite.append(Paragraph("Détail des cotations :", column_header_style))
+        self.price_style = ParagraphStyle(
+            'PriceStyle', parent=styles['Heading2'], fontSize=16, alignment=TA_CENTER, 
+            fontName=base_font, textColor=colors.black, spaceBefore=10, spaceAfter=10
+        )
         
-        h_mousse = config['options'].get('epaisseur', 25)
-        h_assise = 46 if h_mousse > 20 else 40
+        # Style de description de mousse
+        self.description_mousse_style = ParagraphStyle(
+            'MousseDesc', parent=styles['Normal'], fontSize=12, leading=12, 
+            textColor=colors.black, alignment=TA_LEFT, fontName=base_font
+        )
         
-        cotations_items = [
-            "Accoudoir: 15cm large / 60cm haut",
-            "Dossier: 10cm large / 70cm haut",
-            "Coussins: 65/80/90cm large",
-            f"Profondeur assise: {config['dimensions']['profondeur']} cm",
-            f"Hauteur assise: {h_assise} cm (Mousse {h_mousse}cm)"
-        ]
-        for item in cotations_items:
-            col_droite.append(Paragraph(f"• {item}", detail_style))
-
-        table_footer = Table([[col_gauche, col_droite]], colWidths=[9.5*cm, 9.5*cm])
-        table_footer.setStyle(TableStyle([
+        # Styles pour le pied de page
+        self.column_header_style = ParagraphStyle(
+            'ColumnHeaderStyle', parent=styles['Normal'], fontSize=12, alignment=TA_LEFT, 
+            fontName=base_font + '-Bold', spaceAfter=10
+        )
+
+        self.detail_style = ParagraphStyle(
+            'DetailStyle', parent=styles['Normal'], fontSize=12, leading=12, 
+            textColor=colors.black, alignment=TA_LEFT, fontName=base_font
+        )
+        
+        self.footer_style = ParagraphStyle(
+            'FooterStyle', parent=styles['Normal'], fontSize=12, textColor=colors.black, 
+            alignment=TA_CENTER, spaceBefore=10, fontName=base_font
+        )
+
+        # --- PIED DE PAGE : PARTIES FIXES ---
+        col_gauche = [Paragraph("Il faut savoir que le tarif comprend :", self.column_header_style)]
+        col_gauche += [Paragraph(f"• {item}", self.detail_style) for item in INCLUS_ITEMS]
+        # colonne droite : cotations fixes, puis la place des deux lignes variables (une ligne chacune)
+        self.repere_cotations = _Repere()
+        col_droite = [Paragraph("Détail des cotations :", self.column_header_style)]
+        col_droite += [Paragraph(f"• {item}", self.detail_style) for item in COTATIONS_FIXES]
+        col_droite += [self.repere_cotations, Spacer(1, 2 * self.detail_style.leading)]
+        self.table_pied = Table([[col_gauche, col_droite]], colWidths=[9.5*cm, 9.5*cm])
+        self.table_pied.setStyle(TableStyle([
             ('VALIGN', (0,0), (-1,-1), 'TOP'),
             ('LEFTPADDING', (0,0), (-1,-1), 0),
             ('RIGHTPADDING', (0,0), (-1,-1), 0),
         ]))
-        
-        w, h = table_footer.wrap(doc.width, doc.bottomMargin)
-        table_footer.drawOn(canvas, doc.leftMargin, 1.5*cm)
-        
-        # 2. Ville (ex-Partie 6)
-        p_ville = Paragraph("FRÉVENT 62270", footer_style)
-        w_ville, h_ville = p_ville.wrap(doc.width, doc.bottomMargin)
-        p_ville.drawOn(canvas, doc.leftMargin, 0.5*cm)
-        
+        self.p_ville = Paragraph("FRÉVENT 62270", self.footer_style)
+        self.style_mousse = TableStyle([
+            # Centrage vertical par rapport à l'image
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'), 
+            # Ajout de padding à gauche et à droite de la table complète pour effet de marge
+            ('LEFTPADDING', (0, 0), (0, 0), 0.5*cm), # Marge à gauche de l'image
+            ('RIGHTPADDING', (0, 0), (-1, -1), 0.5*cm), # Marge à droite du texte
+        ])
+
+
+    def image_mousse(self, mousse_type, width, height):
+        """Flowable de l'image de mousse, None si pas d'image."""
+        path = IMAGE_FILES.get(mousse_type)
+        if not path:
+            return None
+        return _ImageMousse(_lecteur_image(path), width, height)
+
+    def draw_footer(self, canvas, doc, profondeur, h_mousse):
+        """
+        Pied de page : la partie fixe (colonnes « tarif comprend » / « cotations », ville) est
+        un formulaire PDF dessiné une fois par document puis référencé par chaque page ;
+        seules les deux lignes variables (profondeur, hauteur d'assise) sont dessinées ici.
+        """
+        if not canvas.hasForm(FORM_PIED):
+            canvas.beginForm(FORM_PIED)
+            self.table_pied.wrap(doc.width, doc.bottomMargin)
+            self.table_pied.drawOn(canvas, doc.leftMargin, 1.5*cm)
+            
+            # 2. Ville (ex-Partie 6)
+            w_ville, h_ville = self.p_ville.wrap(doc.width, doc.bottomMargin)
+            self.p_ville.drawOn(canvas, doc.leftMargin, 0.5*cm)
+            canvas.endForm()
+        canvas.doForm(FORM_PIED)
+
+        # lignes variables, sous les cotations fixes (position relevée par le repère)
+        h_assise = 46 if h_mousse > 20 else 40
+        canvas.saveState()
+        x = doc.leftMargin + self.repere_cotations.x
+        y = 1.5*cm + self.repere_cotations.y
+        for texte in (f"• Profondeur assise: {profondeur} cm",
+                      f"• Hauteur assise: {h_assise} cm (Mousse {h_mousse}cm)"):
+            p = Paragraph(texte, self.detail_style)
+            w, h = p.wrap(9.5*cm, doc.bottomMargin)
+            y -= h
+            p.drawOn(canvas, x, y)
         canvas.restoreState()
 
+
+class _Repere(Flowable):
+    """Flowable vide qui relève où il est posé (coordonnées relatives au conteneur)."""
+    x = y = 0
+
+    def wrap(self, availWidth, availHeight):
+        return 0, 0
+
+    def drawOn(self, canvas, x, y, _sW=0):
+        self.x, self.y = x, y
+
+
+@lru_cache(maxsize=None)
+def _lecteur_image(path):
+    """ImageReader d'une image de mousse, PNG lu et décodé une fois par processus."""
+    reader = ImageReader(path)
+    reader.getRGBData()  # pixels décodés ici, puis gardés par l'ImageReader
+    return reader
+
+
+
+
+def _config_pdf(config):
+    """
+    Configuration au format du gabarit (type_canape, dimensions, options, client) ;
+    une QuoteConfig est convertie, un dict est utilisé tel quel.
+    """
+    if not isinstance(config, QuoteConfig):
+        return config
+    return {
+        'type_canape': config.modele.value,
+        'dimensions': {'tx': config.tx, 'ty': config.ty, 'tz': config.tz, 'profondeur': config.profondeur},
+        'options': {
+            'acc_left': config.acc_left, 'acc_right': config.acc_right, 'acc_bas': config.acc_bas,
+            'dossier_left': config.dossier_left, 'dossier_bas': config.dossier_bas, 'dossier_right': config.dossier_right,
+            'meridienne_side': config.meridienne_side, 'meridienne_len': config.meridienne_len,
+            'type_coussins': config.coussins, 'type_mousse': config.type_mousse, 'epaisseur': config.epaisseur
+        },
+        'client': {'nom': config.nom_client, 'email': config.email_client}
+    }
+
+
+def _document(fichier):
+    """Gabarit de page des devis (A4, pied de page réservé en bas)."""
+    return SimpleDocTemplate(fichier, pagesize=A4,
+                             rightMargin=1*cm, leftMargin=1*cm,
+                             topMargin=1*cm, bottomMargin=6*cm)
+
+
+def _elements_devis(config, prix_details, schema_image, gabarit):
+    """Flowables d'un devis (config au format du gabarit, cf. _config_pdf)."""
+    elements = []
+
     # =================== CONTENU DU DOCUMENT ===================
     
     # 1. TITRE et INFOS HAUTES
-    elements.append(Paragraph("MON CANAPÉ MAROCAIN", title_style))
+    elements.append(Paragraph("MON CANAPÉ MAROCAIN", gabarit.title_style))
     
     type_canape = config['type_canape']
     dims = config['dimensions']
@@ -165,49 +281,41 @@ def generer_pdf_devis(config, prix_details, schema_image=None):
     if client['nom']: lignes_info.append(f"<b>Nom:</b> {client['nom']}")
     if client['email']: lignes_info.append(f"<b>Email:</b> {client['email']}")
     
-    elements.append(Paragraph("<br/>".join(lignes_info), header_info_style))
+    elements.append(Paragraph("<br/>".join(lignes_info), gabarit.header_info_style))
     
     # Description mousse dynamique
-    descriptions_mousse = {
-        'D25': "La mousse D25 est une mousse polyuréthane de 25kg/m3. Elle est très ferme, parfaite pour les habitués des banquettes marocaines classiques.",
-        'D30': "La mousse D30 est une mousse polyuréthane de 30kg/m3. Elle est ultra ferme, idéale pour ceux qui recherchent un canapé très ferme.",
-        'HR35': "La mousse HR35 est une mousse haute résilience de 35kg/m3. Elle est semi ferme confortable, parfaite pour les adeptes des salons confortables.<br/>Les mousses haute résilience reprennent rapidement leur forme initiale et donc limitent l’affaissement dans le temps.",
-        'HR45': "La mousse HR45 est une mousse haute résilience de 45kg/m3. Elle est ferme confortable, parfaite pour les adeptes des salons confortables mais pas trop moelleux.<br/>Les mousses haute résilience reprennent rapidement leur forme initiale et donc limitent l’affaissement dans le temps."
-    }
-    texte_mousse = descriptions_mousse.get(mousse_type, descriptions_mousse['HR35'])
+    texte_mousse = DESCRIPTIONS_MOUSSE.get(mousse_type, DESCRIPTIONS_MOUSSE['HR35'])
     
     elements.append(Spacer(1, 0.2*cm))
     
     # --- MODIFICATION CLÉ : Image et Texte en Tableau ---
-    image_path = IMAGE_FILES.get(mousse_type)
-    
-    if image_path:
-        try:
-            img_mousse = Image(image_path, width=2.5*cm, height=2.5*cm)
-            text_flowable = Paragraph(f"<i>{texte_mousse}</i>", description_mousse_style)
-            
-            # Ajustement des colWidths pour laisser plus de marge
-            # 18cm de largeur totale disponible (A4 - 2x1cm marge)
-            mousse_table = Table([[img_mousse, text_flowable]], colWidths=[3*cm, 14*cm]) 
-            
-            mousse_table.setStyle(TableStyle([
-                # Centrage vertical par rapport à l'image
-                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'), 
-                # Ajout de padding à gauche et à droite de la table complète pour effet de marge
-                ('LEFTPADDING', (0, 0), (0, 0), 0.5*cm), # Marge à gauche de l'image
-                ('RIGHTPADDING', (0, 0), (-1, -1), 0.5*cm), # Marge à droite du texte
-            ]))
-            elements.append(mousse_table)
-        except Exception:
-            # En cas d'erreur de fichier, afficher le texte seul 
-            elements.append(Paragraph(f"<i>{texte_mousse}</i>", description_mousse_style))
+    try:
+        img_mousse = gabarit.image_mousse(mousse_type, 2.5*cm, 2.5*cm)
+    except Exception:
+        # En cas d'erreur de fichier, afficher le texte seul 
+        img_mousse = None
+    text_flowable = Paragraph(f"<i>{texte_mousse}</i>", gabarit.description_mousse_style)
+    if img_mousse is not None:
+        # Ajustement des colWidths pour laisser plus de marge
+        # 18cm de largeur totale disponible (A4 - 2x1cm marge)
+        mousse_table = Table([[img_mousse, text_flowable]], colWidths=[3*cm, 14*cm]) 
+        mousse_table.setStyle(gabarit.style_mousse)
+        elements.append(mousse_table)
     else:
-        elements.append(Paragraph(f"<i>{texte_mousse}</i>", description_mousse_style))
+        elements.append(text_flowable)
 
     elements.append(Spacer(1, 0.3*cm))
 
     # 3. SCHÉMA
-    if schema_image:
+    if isinstance(schema_image, Drawing):
+        # Vectoriel : mise à l'échelle dans la même zone que l'image (18 x 10 cm)
+        factor = min(18 * cm / schema_image.width, 10 * cm / schema_image.height)
+        schema_image.scale(factor, factor)
+        schema_image.width *= factor
+        schema_image.height *= factor
+        schema_image.hAlign = 'CENTER'
+        elements.append(schema_image)
+    elif schema_image:
         try:
             img = Image(schema_image)
             avail_width = 18 * cm
@@ -230,17 +338,78 @@ def generer_pdf_devis(config, prix_details, schema_image=None):
             
             elements.append(img)
         except Exception:
-            elements.append(Paragraph("<i>(Schéma non disponible)</i>", header_info_style))
+            elements.append(Paragraph("<i>(Schéma non disponible)</i>", gabarit.header_info_style))
 
     elements.append(Spacer(1, 0.5*cm))
 
     # 4. PRIX
     montant_ttc = f"{prix_details['total_ttc']:.2f} €"
-    elements.append(Paragraph(f"PRIX TOTAL TTC : {montant_ttc}", price_style))
-    elements.append(Paragraph("<hr width='100%' color='black'/>", styles['Normal']))
+    elements.append(Paragraph(f"PRIX TOTAL TTC : {montant_ttc}", gabarit.price_style))
+    elements.append(Paragraph("<hr width='100%' color='black'/>", gabarit.styles['Normal']))
+    return elements
+
+
+def generer_pdf_devis(config, prix_details, schema_image=None):
+    """
+    Génère un PDF de devis (1 page) avec un pied de page fixe en bas et des images de mousse.
+    config : QuoteConfig, ou dict {type_canape, dimensions, options, client}.
+    schema_image : Drawing ReportLab (vectoriel, cf. canapematplot.render_drawing)
+                   ou image raster (chemin / flux PNG).
+    """
+    config = _config_pdf(config)
+    gabarit = _GabaritDevis()
+    buffer = BytesIO()
+    doc = _document(buffer)
+    profondeur = config['dimensions']['profondeur']
+    h_mousse = config['options'].get('epaisseur', 25)
+
+    def draw_footer(canvas, doc):
+        gabarit.draw_footer(canvas, doc, profondeur, h_mousse)
 
+    elements = _elements_devis(config, prix_details, schema_image, gabarit)
     
     # GÉNÉRATION AVEC CALLBACK POUR LE FOOTER
     doc.build(elements, onFirstPage=draw_footer)
     buffer.seek(0)
     return buffer
+
+
+def generer_pdf_catalogue(devis, chemin):
+    """
+    Génère un seul PDF de plusieurs devis (salons, clients professionnels), une page par devis
+    (plus si un devis déborde), avec la même mise en page que generer_pdf_devis.
+    devis  : itérable de (config, prix_details, schema_image), consommé au fil de l'eau —
+             un générateur ne produit chaque schéma qu'au moment de sa page.
+    chemin : fichier PDF écrit (remplacé d'un coup, jamais à moitié écrit).
+    Polices, styles, images de mousse et pied de page fixe sont partagés par toutes les pages ;
+    une page terminée ne garde que son flux de dessin (schéma et flowables sont libérés).
+    La mémoire n'est pas constante pour autant : ReportLab garde le flux compressé de chaque
+    page (une vingtaine de Ko) jusqu'à l'écriture du fichier, faite en une fois à la fin.
+    Retourne le nombre de devis.
+    """
+    gabarit = _GabaritDevis()
+    doc = _document(chemin)
+    canv = Canvas(chemin + ".tmp", pagesize=doc.pagesize)
+    n = 0
+    try:
+        for config, prix_details, schema_image in devis:
+            config = _config_pdf(config)
+            elements = _elements_devis(config, prix_details, schema_image, gabarit)
+            schema_image = None
+            # comme onFirstPage : pied de page sur la première page du devis, avant le contenu
+            gabarit.draw_footer(canv, doc, config['dimensions']['profondeur'],
+                                config['options'].get('epaisseur', 25))
+            while elements:
+                frame = Frame(doc.leftMargin, doc.bottomMargin, doc.width, doc.height, id='normal')
+                restants = len(elements)
+                frame.addFromList(elements, canv)
+                if len(elements) == restants:
+                    raise ValueError(f"Devis {n + 1} : élément trop grand pour la page.")
+                canv.showPage()
+            n += 1
+        canv.save()
+        os.replace(chemin + ".tmp", chemin)
+    finally:
+        if os.path.exists(chemin + ".tmp"):
+            os.remove(chemin + ".tmp")
+    return n
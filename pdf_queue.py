@@ -0,0 +1,51 @@
+"""
+File d'attente des devis PDF de l'application : les PDF sont construits par un petit pool de
+threads en arrière-plan, hors du thread du script Streamlit, et retrouvés par l'empreinte de
+leur configuration (QuoteConfig.cle). Un second clic pour la même configuration rejoint le
+travail en cours au lieu d'en lancer un nouveau.
+"""
+
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+
+class PDFQueue:
+    """
+    Pool borné (max_workers threads, max_jobs travaux en attente ou en cours au plus) ;
+    les derniers PDF terminés restent disponibles (max_jobs au plus, les plus anciens sont oubliés).
+    Un travail en erreur est relancé à la soumission suivante.
+    """
+
+    def __init__(self, max_workers=2, max_jobs=16):
+        self.max_jobs = max_jobs
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="pdf")
+        self._jobs = OrderedDict()   # cle -> Future, du plus ancien au plus récent
+        self._verrou = threading.Lock()
+
+    def soumettre(self, cle, fn, *args):
+        """Future du travail `cle` : celui déjà soumis s'il existe, sinon fn(*args) lancé en arrière-plan."""
+        with self._verrou:
+            futur = self._jobs.get(cle)
+            if futur is not None and not (futur.done() and futur.exception() is not None):
+                self._jobs.move_to_end(cle)
+                return futur
+            if sum(not f.done() for f in self._jobs.values()) >= self.max_jobs:
+                raise RuntimeError("Trop de PDF en cours de génération, réessayez dans un instant.")
+            futur = self._pool.submit(fn, *args)
+            self._jobs[cle] = futur
+            self._jobs.move_to_end(cle)
+            # oubli des plus anciens PDF terminés au-delà de max_jobs
+            for ancienne in [k for k, f in self._jobs.items() if f.done()][:max(0, len(self._jobs) - self.max_jobs)]:
+                del self._jobs[ancienne]
+            return futur
+
+    def travail(self, cle):
+        """Future du travail `cle`, None s'il n'a pas été soumis (ou a été oublié)."""
+        with self._verrou:
+            return self._jobs.get(cle)
+
+    def en_cours(self):
+        """Nombre de travaux en attente ou en cours."""
+        with self._verrou:
+            return sum(not f.done() for f in self._jobs.values())
@@ -22,6 +22,23 @@ PRIX_TRAVERSIN = 35
 PRIX_SURMATELAS = 150
 PRIX_MERIDIENNE = 200
 
+# Tarif des devis (calculer_prix_devis : application, PDF, devis en lot) :
+# False = estimation forfaitaire (calculer_prix_total), tarif en vigueur ;
+# True = chiffrage depuis le schéma (calculer_prix_scene), sur option
+TARIF_SCHEMA = False
+
+# Tarification depuis le schéma (calculer_prix_scene, hors tarif par défaut, cf. TARIF_SCHEMA) :
+# hauteurs sur lesquelles les polygones du schéma sont extrudés. Hypothèses de chiffrage, à
+# valider avec l'atelier avant d'activer TARIF_SCHEMA :
+#   - dossier et accoudoir : cotations imprimées sur les devis (pdf_generator.COTATIONS_FIXES) ;
+#   - coussin : aucune cote publiée, estimation (hauteur du dossier moins l'assise) ;
+#   - marge de couture : estimation, sous les facteurs forfaitaires (1.3 à 1.5) puisque la
+#     forme exacte est déjà dans les polygones.
+HAUTEUR_DOSSIER = 70  # cm — « Dossier: 10cm large / 70cm haut »
+HAUTEUR_ACCOUDOIR = 60  # cm — « Accoudoir: 15cm large / 60cm haut »
+HAUTEUR_COUSSIN = 45  # cm — estimation, coussin de dossier posé debout sur l'assise
+MARGE_COUTURE = 1.15  # estimation — coutures et chutes
+
 
 def calculer_surface_tissu(type_canape, tx, ty, tz, profondeur):
     """
@@ -62,6 +79,62 @@ def calculer_surface_mousse(type_canape, tx, ty, tz, profondeur, epaisseur):
     return round(volume, 3)
 
 
+def _aire_polygone(poly):
+    """Aire d'un polygone [(x, y), …] en cm² (formule du lacet)."""
+    aire = 0.0
+    for (x0, y0), (x1, y1) in zip(poly, poly[1:] + poly[:1]):
+        aire += x0 * y1 - x1 * y0
+    return abs(aire) / 2.0
+
+
+def _perimetre_polygone(poly):
+    """Périmètre d'un polygone [(x, y), …] en cm."""
+    return sum(((x1 - x0) ** 2 + (y1 - y0) ** 2) ** 0.5
+               for (x0, y0), (x1, y1) in zip(poly, poly[1:] + poly[:1]))
+
+
+def _bloc(polys, hauteur):
+    """
+    Tissu (dessus + côtés, en cm²) et volume (cm³) des polygones extrudés sur `hauteur` cm ;
+    les polygones d'aire nulle (tracés de repère) sont ignorés.
+    """
+    tissu = volume = 0.0
+    for p in polys:
+        aire = _aire_polygone(p)
+        if aire > 0:
+            tissu += aire + _perimetre_polygone(p) * hauteur
+            volume += aire * hauteur
+    return tissu, volume
+
+
+def calculer_surfaces_scene(scene, epaisseur):
+    """
+    Surfaces et volume exacts à partir des polygones du schéma (Scene de canapematplot.layout_canape),
+    chaque élément étant extrudé sur sa hauteur (dessus + côtés pour le tissu) :
+    assises (banquettes + angles) sur `epaisseur`, dossiers sur HAUTEUR_DOSSIER,
+    accoudoirs sur HAUTEUR_ACCOUDOIR, coussins sur HAUTEUR_COUSSIN (deux faces + tour).
+    """
+    assises = tuple(scene.polys.get("banquettes", ())) + tuple(scene.polys.get("angle", ()))
+    surface_assise = sum(_aire_polygone(p) for p in assises)
+    tissu_assise, mousse_assise = _bloc(assises, epaisseur)
+    tissu_dossiers, mousse_dossiers = _bloc(scene.polys.get("dossiers", ()), HAUTEUR_DOSSIER)
+    tissu_accoudoirs, mousse_accoudoirs = _bloc(scene.polys.get("accoudoirs", ()), HAUTEUR_ACCOUDOIR)
+
+    tissu_coussins = mousse_coussins = 0.0
+    for x0, y0, x1, y1, _ in scene.cushions:
+        largeur, profondeur = abs(x1 - x0), abs(y1 - y0)
+        tissu_coussins += 2 * largeur * profondeur + 2 * (largeur + profondeur) * HAUTEUR_COUSSIN
+        mousse_coussins += largeur * profondeur * HAUTEUR_COUSSIN
+
+    surface_tissu = (tissu_assise + tissu_dossiers + tissu_accoudoirs + tissu_coussins) / 10000
+    volume_mousse = (mousse_assise + mousse_dossiers + mousse_accoudoirs + mousse_coussins) / 1000000
+    return {
+        'surface_assise_m2': round(surface_assise / 10000, 2),
+        'surface_tissu_m2': round(surface_tissu * MARGE_COUTURE, 2),
+        'volume_mousse_m3': round(volume_mousse, 3),
+    }
+
+
 def calculer_prix_total(type_canape, tx, ty, tz, profondeur, type_coussins, 
                        type_mousse, epaisseur, acc_left, acc_right, acc_bas,
                        dossier_left, dossier_bas, dossier_right,
@@ -70,15 +143,69 @@ def calculer_prix_total(type_canape, tx, ty, tz, profondeur, type_coussins,
     """
     Calcule le prix total du canapé avec détails
     """
+    surface_tissu = calculer_surface_tissu(type_canape, tx, ty, tz, profondeur)
+    volume_mousse = calculer_surface_mousse(type_canape, tx, ty, tz, profondeur, epaisseur)
+    return _chiffrer(type_canape, surface_tissu, volume_mousse, type_mousse,
+                     sum([acc_left, acc_right, acc_bas]),
+                     sum([dossier_left, dossier_bas, dossier_right]),
+                     nb_coussins_deco, nb_traversins_supp, has_surmatelas, has_meridienne)
+
+
+def calculer_prix_scene(scene, type_mousse, epaisseur,
+                        nb_coussins_deco, nb_traversins_supp, has_surmatelas, has_meridienne):
+    """
+    Calcule le prix à partir du schéma déjà mis en page (Scene de canapematplot.layout_canape) :
+    surfaces et volume tirés des polygones, dossiers / accoudoirs / coussins comptés sur le
+    dessin réel (scissions, angles) — sans recalculer la géométrie. La méridienne vient de la
+    configuration (le rapport du schéma ne la renseigne pas pour tous les modèles).
+    """
+    surfaces = calculer_surfaces_scene(scene, epaisseur)
+    resultat = _chiffrer(scene.model, surfaces['surface_tissu_m2'], surfaces['volume_mousse_m3'],
+                         type_mousse, scene.counts['accoudoirs'], scene.counts['dossiers'],
+                         nb_coussins_deco, nb_traversins_supp, has_surmatelas, has_meridienne)
+    resultat['surface_assise_m2'] = surfaces['surface_assise_m2']
+    resultat['nb_coussins'] = scene.counts['coussins']
+    return resultat
+
+
+def calculer_prix_devis(config, scene=None, depuis_schema=None):
+    """
+    Calcule le prix d'une QuoteConfig avec le tarif en vigueur : l'estimation forfaitaire
+    (calculer_prix_total), ou le chiffrage depuis le schéma (calculer_prix_scene) si
+    `depuis_schema` — par défaut TARIF_SCHEMA — est vrai. `scene` : Scene déjà mise en page
+    pour l'aperçu, réutilisée par le chiffrage depuis le schéma (calculée ici sinon) ;
+    elle ne change jamais le prix.
+    """
+    if depuis_schema is None:
+        depuis_schema = TARIF_SCHEMA
+    if not depuis_schema:
+        return calculer_prix_total(config.modele.value, config.tx, config.ty, config.tz, config.profondeur,
+                                   config.coussins, config.type_mousse, config.epaisseur,
+                                   config.acc_left, config.acc_right, config.acc_bas,
+                                   config.dossier_left, config.dossier_bas, config.dossier_right,
+                                   config.nb_coussins_deco, config.nb_traversins_supp,
+                                   config.has_surmatelas, config.meridienne_side is not None)
+    if scene is None:
+        from canapematplot import layout_canape
+        scene = layout_canape(config)
+    return calculer_prix_scene(scene, config.type_mousse, config.epaisseur,
+                               config.nb_coussins_deco, config.nb_traversins_supp,
+                               config.has_surmatelas, config.meridienne_side is not None)
+
+
+def _chiffrer(type_canape, surface_tissu, volume_mousse, type_mousse,
+              nb_accoudoirs, nb_dossiers,
+              nb_coussins_deco, nb_traversins_supp, has_surmatelas, has_meridienne):
+    """
+    Détail des prix, sous-total, TVA et total TTC à partir des quantités calculées
+    """
     details = {}
     
     # 1. Tissu
-    surface_tissu = calculer_surface_tissu(type_canape, tx, ty, tz, profondeur)
     prix_tissu = surface_tissu * PRIX_TISSU_M2
     details['Tissu'] = round(prix_tissu, 2)
     
     # 2. Mousse
-    volume_mousse = calculer_surface_mousse(type_canape, tx, ty, tz, profondeur, epaisseur)
     prix_mousse = volume_mousse * PRIX_MOUSSE[type_mousse] * 1000  # Convertir en prix/m³
     details['Mousse'] = round(prix_mousse, 2)
     
@@ -93,12 +220,10 @@ def calculer_prix_total(type_canape, tx, ty, tz, profondeur, type_coussins,
     details['Structure et Fabrication'] = round(prix_structure, 2)
     
     # 4. Accoudoirs
-    nb_accoudoirs = sum([acc_left, acc_right, acc_bas])
     if nb_accoudoirs > 0:
         details['Accoudoirs'] = nb_accoudoirs * PRIX_ACCOUDOIR
     
     # 5. Dossiers
-    nb_dossiers = sum([dossier_left, dossier_bas, dossier_right])
     if nb_dossiers > 0:
         details['Dossiers'] = nb_dossiers * PRIX_DOSSIER
     
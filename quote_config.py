@@ -0,0 +1,212 @@
+"""
+Configuration d'un devis : un objet immuable et hachable (modèle, dimensions, options,
+couleurs, coussins, client), accepté tel quel par app.py, pricing.py, canapematplot.py
+(render_schema / layout_canape) et pdf_generator.py.
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass, fields, replace
+from enum import Enum
+
+
+class ModeleCanape(Enum):
+    """Modèles du configurateur ; la valeur est le libellé affiché (celui de render_canape)."""
+    SIMPLE = "Simple (S)"
+    L_SANS_ANGLE = "L - Sans Angle"
+    L_AVEC_ANGLE = "L - Avec Angle (LF)"
+    U_SANS_ANGLE = "U - Sans Angle"
+    U_1_ANGLE = "U - 1 Angle (U1F)"
+    U_2_ANGLES = "U - 2 Angles (U2F)"
+
+    @classmethod
+    def depuis(cls, valeur):
+        """Membre correspondant à un membre, un libellé ("L - Sans Angle") ou un nom ("L_SANS_ANGLE")."""
+        if isinstance(valeur, cls):
+            return valeur
+        for modele in cls:
+            if valeur in (modele.value, modele.name):
+                return modele
+        raise ValueError(f"Type de canapé inconnu : {valeur}")
+
+    @property
+    def famille(self):
+        """"S", "L" ou "U"."""
+        return "S" if self is ModeleCanape.SIMPLE else self.value[0]
+
+    @property
+    def nb_angles(self):
+        return {ModeleCanape.L_AVEC_ANGLE: 1, ModeleCanape.U_1_ANGLE: 1,
+                ModeleCanape.U_2_ANGLES: 2}.get(self, 0)
+
+
+# Champs qui ne changent ni la géométrie ni le schéma, par nature (cf. QuoteConfig.changements)
+CHAMPS_PRIX = ("type_mousse", "epaisseur", "nb_coussins_deco", "nb_traversins_supp", "has_surmatelas")
+CHAMPS_COULEURS = ("couleurs",)
+CHAMPS_CLIENT = ("nom_client", "email_client")
+
+# Côtés de méridienne proposés par modèle (comme le formulaire)
+_COTES_MERIDIENNE = {"S": ("g", "d"), "L": ("g", "d", "b"), "U": ("g", "d", "b")}
+
+
+@dataclass(frozen=True, slots=True)
+class QuoteConfig:
+    """
+    Configuration normalisée d'un canapé et de son devis :
+      - ty (retour gauche) n'existe que pour L et U, tz (retour droit) que pour U ;
+      - les options sans objet pour le modèle sont ramenées à False (dossiers gauche/droit
+        et accoudoir bas du Simple, dossier et accoudoir droits du L) ;
+      - méridienne : côté "g" | "d" | "b" ou None (longueur 0) ;
+      - couleurs : paires (élément, couleur) triées, cf. couleurs_dict.
+    cle : empreinte SHA-256 stable (entre processus) de to_json(), utilisable comme clé de cache.
+    """
+    modele: ModeleCanape
+    tx: int
+    ty: int = None
+    tz: int = None
+    profondeur: int = 70
+    acc_left: bool = True
+    acc_right: bool = True
+    acc_bas: bool = True
+    dossier_left: bool = True
+    dossier_bas: bool = True
+    dossier_right: bool = True
+    meridienne_side: str = None
+    meridienne_len: int = 0
+    coussins: str = "auto"
+    traversins: str = None
+    couleurs: tuple = ()
+    type_mousse: str = "HR35"
+    epaisseur: int = 25
+    nb_coussins_deco: int = 0
+    nb_traversins_supp: int = 0
+    has_surmatelas: bool = False
+    nom_client: str = ""
+    email_client: str = ""
+
+    def __post_init__(self):
+        modele = ModeleCanape.depuis(self.modele)
+        famille = modele.famille
+        valeurs = {
+            "modele": modele,
+            "tx": int(self.tx),
+            "ty": int(self.ty) if famille in ("L", "U") and self.ty is not None else None,
+            "tz": int(self.tz) if famille == "U" and self.tz is not None else None,
+            "profondeur": int(self.profondeur),
+            "acc_left": bool(self.acc_left),
+            "acc_right": bool(self.acc_right) and famille != "L",
+            "acc_bas": bool(self.acc_bas) and famille != "S",
+            "dossier_left": bool(self.dossier_left) and famille != "S",
+            "dossier_bas": bool(self.dossier_bas),
+            "dossier_right": bool(self.dossier_right) and famille == "U",
+            "coussins": str(self.coussins).strip().lower(),
+            "type_mousse": str(self.type_mousse).strip().upper(),
+            "epaisseur": int(self.epaisseur),
+            "nb_coussins_deco": int(self.nb_coussins_deco),
+            "nb_traversins_supp": int(self.nb_traversins_supp),
+            "has_surmatelas": bool(self.has_surmatelas),
+            "nom_client": str(self.nom_client or "").strip(),
+            "email_client": str(self.email_client or "").strip(),
+        }
+        if famille in ("L", "U") and valeurs["ty"] is None:
+            raise ValueError(f"Le modèle {modele.value} exige le retour gauche (ty).")
+        if famille == "U" and valeurs["tz"] is None:
+            raise ValueError(f"Le modèle {modele.value} exige le retour droit (tz).")
+
+        cote = str(self.meridienne_side or "").strip().lower()[:1] or None
+        if cote is not None and cote not in _COTES_MERIDIENNE[famille]:
+            raise ValueError(f"Côté de méridienne invalide pour {modele.value} : {self.meridienne_side}")
+        valeurs["meridienne_side"] = cote
+        valeurs["meridienne_len"] = int(self.meridienne_len or 0) if cote else 0
+
+        traversins = self.traversins
+        if isinstance(traversins, (list, tuple, set)):
+            traversins = ",".join(str(x) for x in traversins)
+        cotes = sorted({p.strip().lower() for p in str(traversins or "").replace(";", ",").split(",")
+                        if p.strip()})
+        valeurs["traversins"] = ",".join(cotes) or None
+
+        couleurs = self.couleurs
+        if isinstance(couleurs, dict):
+            couleurs = couleurs.items()
+        valeurs["couleurs"] = tuple(sorted((str(k), str(v)) for k, v in (couleurs or ()) if v))
+
+        for nom, valeur in valeurs.items():
+            object.__setattr__(self, nom, valeur)
+
+    @property
+    def couleurs_dict(self):
+        """Palette au format de render_canape ({"assise": "#f6f6f6", …}), None si aucune."""
+        return dict(self.couleurs) or None
+
+    def render_config(self):
+        """Arguments de canapematplot.render_canape (dict)."""
+        return {
+            "type_canape": self.modele.value, "tx": self.tx, "ty": self.ty, "tz": self.tz,
+            "profondeur": self.profondeur,
+            "acc_left": self.acc_left, "acc_right": self.acc_right, "acc_bas": self.acc_bas,
+            "dossier_left": self.dossier_left, "dossier_bas": self.dossier_bas,
+            "dossier_right": self.dossier_right,
+            "meridienne_side": self.meridienne_side, "meridienne_len": self.meridienne_len,
+            "coussins": self.coussins, "traversins": self.traversins, "couleurs": self.couleurs_dict,
+        }
+
+    def sans_client(self):
+        """Même configuration sans les coordonnées du client (clé de cache de l'aperçu)."""
+        return replace(self, nom_client="", email_client="")
+
+    def changements(self, autre):
+        """
+        Natures des champs qui diffèrent de `autre` (une QuoteConfig, ou None : tout a changé) :
+        "geometrie" (dimensions, structure, coussins → Scene à recalculer), "couleurs" (palette
+        seule), "prix" (options sans effet sur la géométrie), "client".
+        """
+        if autre is None:
+            return {"geometrie", "couleurs", "prix", "client"}
+        natures = set()
+        for f in fields(self):
+            if getattr(self, f.name) != getattr(autre, f.name):
+                natures.add("prix" if f.name in CHAMPS_PRIX else
+                            "couleurs" if f.name in CHAMPS_COULEURS else
+                            "client" if f.name in CHAMPS_CLIENT else "geometrie")
+        return natures
+
+    @property
+    def cle_geometrie(self):
+        """Empreinte des seuls champs de géométrie (clé de cache de la Scene)."""
+        defauts = {f.name: f.default for f in fields(self)
+                   if f.name in CHAMPS_PRIX + CHAMPS_COULEURS + CHAMPS_CLIENT}
+        return replace(self, **defauts).cle
+
+    @property
+    def cle_prix(self):
+        """Empreinte de la géométrie et des options de prix (clé de cache du prix)."""
+        return replace(self, couleurs=(), nom_client="", email_client="").cle
+
+    def to_dict(self):
+        """Champs différents des valeurs par défaut, en types JSON (une ligne de base de données)."""
+        data = {}
+        for f in fields(self):
+            valeur = getattr(self, f.name)
+            if f.name in ("modele", "tx") or valeur != f.default:
+                data[f.name] = valeur
+        data["modele"] = self.modele.name
+        if "couleurs" in data:
+            data["couleurs"] = dict(self.couleurs)
+        return data
+
+    def to_json(self):
+        """Sérialisation compacte et canonique (clés triées, sans espaces)."""
+        return json.dumps(self.to_dict(), sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(**data)
+
+    @classmethod
+    def from_json(cls, texte):
+        return cls.from_dict(json.loads(texte))
+
+    @property
+    def cle(self):
+        return hashlib.sha256(self.to_json().encode("utf-8")).hexdigest()